@@ -28,7 +28,7 @@ For legacy add-ons, this bl_info has been removed.
 
 import bpy
 from bpy.types import AddonPreferences
-from bpy.props import StringProperty, BoolProperty, EnumProperty
+from bpy.props import StringProperty, BoolProperty, EnumProperty, IntProperty
 
 # Import modules
 from . import core
@@ -43,6 +43,16 @@ modules = [
 ]
 
 
+def update_buffer_pool_size(self, context):
+    """Apply the frame buffer pool cap"""
+    utils.buffer_pool.get_buffer_pool().set_max_bytes(self.buffer_pool_size * 1024 * 1024)
+
+
+def update_lut_cache_size(self, context):
+    """Apply the baked LUT cache cap"""
+    utils.lut_cache.get_lut_cache().set_max_bytes(self.lut_cache_size * 1024 * 1024)
+
+
 class HyperGradeFXPreferences(AddonPreferences):
     bl_idname = __package__
 
@@ -66,6 +76,22 @@ class HyperGradeFXPreferences(AddonPreferences):
         default=True
     )
 
+    buffer_pool_size: IntProperty(
+        name="Frame Buffer Pool (MB)",
+        description="Memory kept for reusing frame buffers across frames (0 disables pooling)",
+        default=utils.buffer_pool.DEFAULT_POOL_SIZE_MB,
+        min=0,
+        update=update_buffer_pool_size
+    )
+
+    lut_cache_size: IntProperty(
+        name="LUT Cache (MB)",
+        description="Disk space for caching LUTs baked from looks and blueprints",
+        default=utils.lut_cache.DEFAULT_LUT_CACHE_SIZE_MB,
+        min=0,
+        update=update_lut_cache_size
+    )
+
     auto_connect_passes: BoolProperty(
         name="Auto-Connect Render Passes",
         description="Automatically connect render passes when detected",
@@ -95,6 +121,8 @@ class HyperGradeFXPreferences(AddonPreferences):
         box = layout.box()
         box.label(text="Performance", icon='SETTINGS')
         box.prop(self, "enable_live_preview")
+        box.prop(self, "buffer_pool_size")
+        box.prop(self, "lut_cache_size")
 
         box = layout.box()
         box.label(text="Automation", icon='AUTO')
@@ -230,6 +258,14 @@ def register():
     # Add scene properties
     bpy.types.Scene.hypergradefx = bpy.props.PointerProperty(type=HyperGradeFXSceneProperties)
 
+    # Apply saved performance preferences
+    try:
+        prefs = bpy.context.preferences.addons[__package__].preferences
+        update_buffer_pool_size(prefs, bpy.context)
+        update_lut_cache_size(prefs, bpy.context)
+    except Exception as e:
+        print(f"HyperGradeFX: Could not apply performance preferences: {e}")
+
     print("HyperGradeFX v1.0.0 loaded successfully")
 
 
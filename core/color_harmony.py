@@ -9,7 +9,7 @@ import colorsys
 from ..utils.helpers import (get_compositor_node_tree, create_node, connect_nodes,
                              calculate_color_harmony, mix_colors, create_color_ramp,
                              setup_realtime_preview)
-from ..utils.constants import COLOR_HARMONY_ANGLES
+from ..utils.constants import COLOR_HARMONY_ANGLES, GRADE_STACK_STAGES
 
 
 class HGFX_OT_ApplyColorHarmony(Operator):
@@ -324,13 +324,14 @@ class HGFX_OT_CreateColorGradeStack(Operator):
         current_x = x_start
         current_input = input_node
         current_socket = 'Image'
+        stage_labels = dict(GRADE_STACK_STAGES)
 
         # 1. Exposure
         exposure = create_node(
             node_tree,
             'CompositorNodeExposure',
             location=(current_x, y),
-            label="1. Exposure"
+            label=stage_labels['exposure']
         )
         connect_nodes(node_tree, current_input, current_socket, exposure, 'Image')
         current_input = exposure
@@ -342,7 +343,7 @@ class HGFX_OT_CreateColorGradeStack(Operator):
             node_tree,
             'CompositorNodeMixRGB',
             location=(current_x, y),
-            label="2. White Balance"
+            label=stage_labels['white_balance']
         )
         white_balance.blend_type = 'ADD'
         white_balance.inputs[0].default_value = 0.0
@@ -356,7 +357,7 @@ class HGFX_OT_CreateColorGradeStack(Operator):
             node_tree,
             'CompositorNodeBrightContrast',
             location=(current_x, y),
-            label="3. Contrast"
+            label=stage_labels['contrast']
         )
         connect_nodes(node_tree, current_input, current_socket, contrast, 'Image')
         current_input = contrast
@@ -368,7 +369,7 @@ class HGFX_OT_CreateColorGradeStack(Operator):
             node_tree,
             'CompositorNodeHueSat',
             location=(current_x, y),
-            label="4. Saturation"
+            label=stage_labels['saturation']
         )
         connect_nodes(node_tree, current_input, current_socket, saturation, 'Image')
         current_input = saturation
@@ -380,7 +381,7 @@ class HGFX_OT_CreateColorGradeStack(Operator):
             node_tree,
             'CompositorNodeColorCorrection',
             location=(current_x, y),
-            label="5. Color Wheels"
+            label=stage_labels['color_wheels']
         )
         connect_nodes(node_tree, current_input, current_socket, color_correction, 'Image')
         current_input = color_correction
@@ -392,7 +393,7 @@ class HGFX_OT_CreateColorGradeStack(Operator):
             node_tree,
             'CompositorNodeCurveRGB',
             location=(current_x, y),
-            label="6. Curves"
+            label=stage_labels['curves']
         )
         connect_nodes(node_tree, current_input, current_socket, curves, 'Image')
         current_input = curves
@@ -404,7 +405,7 @@ class HGFX_OT_CreateColorGradeStack(Operator):
             node_tree,
             'CompositorNodeHueSat',
             location=(current_x, y),
-            label="7. Final Adjust"
+            label=stage_labels['final_adjust']
         )
         connect_nodes(node_tree, current_input, current_socket, final_hue_sat, 'Image')
 
@@ -5,9 +5,15 @@ Enables shot-level post pipelines with batch operations
 
 import bpy
 from bpy.types import Operator, PropertyGroup
-from bpy.props import StringProperty, BoolProperty, CollectionProperty, IntProperty
+from bpy.props import StringProperty, BoolProperty, CollectionProperty, IntProperty, EnumProperty
 import json
+import os
+import re
+import threading
+import time
 from pathlib import Path
+from ..utils.ffmpeg_handler import get_ffmpeg_handler
+from ..utils.ffmpeg_jobs import get_job_queue
 
 
 class HGFXSequence(PropertyGroup):
@@ -258,23 +264,136 @@ class HGFX_OT_ApplySequence(Operator):
                 print(f"Error creating link: {e}")
 
 
+class _BatchEncodeLimit:
+    """
+    Concurrency limit of the shared job queue for one batch of encodes
+
+    The previous limit is restored once the batch is closed and every
+    encode it queued has ended, so later encodes from other operators
+    are not affected.
+    """
+
+    def __init__(self, queue, limit):
+        self.queue = queue
+        self.previous = queue.max_concurrent
+        self.pending = 0
+        self.closed = False
+        self._lock = threading.Lock()
+        queue.max_concurrent = max(1, int(limit))
+
+    def add(self):
+        with self._lock:
+            self.pending += 1
+
+    def job_finished(self, job=None):
+        with self._lock:
+            self.pending -= 1
+            self._restore()
+
+    def close(self):
+        """No more encodes will be queued for this batch"""
+        with self._lock:
+            self.closed = True
+            self._restore()
+
+    def _restore(self):
+        if self.closed and self.pending == 0:
+            self.queue.max_concurrent = self.previous
+
+
+def _frame_pattern(scene):
+    """
+    Get the FFmpeg input pattern of the frames Blender renders to scene.render.filepath
+
+    Follows Blender's naming: the last run of '#' becomes the zero-padded
+    frame number, otherwise four digits are appended.
+
+    Returns:
+        str: Absolute pattern, e.g. '/renders/shot_010_%04d.png'
+    """
+    render = scene.render
+    directory, name = os.path.split(bpy.path.abspath(render.filepath))
+    name = name.replace('%', '%%')
+
+    runs = list(re.finditer(r'#+', name))
+    if runs:
+        run = runs[-1]
+        name = f"{name[:run.start()]}%0{len(run.group())}d{name[run.end():]}"
+    else:
+        name += "%04d"
+    pattern = os.path.join(directory, name)
+    if render.use_file_extension:
+        pattern += render.file_extension
+
+    # Check against Blender's own frame path so a mismatch fails loudly
+    expected = bpy.path.abspath(render.frame_path(frame=scene.frame_start))
+    if Path(pattern % scene.frame_start) != Path(expected):
+        raise RuntimeError(f"Cannot derive a frame pattern for {expected}")
+    return pattern
+
+
 class HGFX_OT_BatchApplySequences(Operator):
     """Batch apply all sequences and render"""
     bl_idname = "hgfx.batch_apply_sequences"
     bl_label = "Batch Render Sequences"
     bl_options = {'REGISTER'}
 
+    encode_video: BoolProperty(
+        name="Encode Shots to Video",
+        description="Encode each finished shot in the background while the next shot renders",
+        default=False
+    )
+
+    codec: EnumProperty(
+        name="Codec",
+        items=[
+            ('H264', 'H.264', 'H.264 codec (most compatible)'),
+            ('H265', 'H.265/HEVC', 'H.265 codec (better compression)'),
+            ('PRORES', 'ProRes', 'Apple ProRes (high quality)'),
+            ('DNXHD', 'DNxHD', 'Avid DNxHD (professional)'),
+        ],
+        default='H264'
+    )
+
+    quality: EnumProperty(
+        name="Quality",
+        items=[
+            ('high', 'High', 'High quality'),
+            ('medium', 'Medium', 'Medium quality'),
+            ('low', 'Low', 'Low quality (smaller file)'),
+        ],
+        default='high'
+    )
+
+    max_encodes: IntProperty(
+        name="Concurrent Encodes",
+        description="Shots of this batch encoded at the same time while rendering continues",
+        default=2,
+        min=1,
+        max=16
+    )
+
     def execute(self, context):
-        manager = context.scene.hgfx_sequence_manager
+        scene = context.scene
+        manager = scene.hgfx_sequence_manager
 
         if len(manager.sequences) == 0:
             self.report({'WARNING'}, "No sequences to process")
             return {'CANCELLED'}
 
+        ffmpeg = None
+        encode_limit = None
+        if self.encode_video:
+            ffmpeg = self.get_encoder(scene)
+            if ffmpeg is None:
+                return {'CANCELLED'}
+            encode_limit = _BatchEncodeLimit(get_job_queue(), self.max_encodes)
+
         # Store original filepath
-        original_filepath = context.scene.render.filepath
+        original_filepath = scene.render.filepath
 
         sequences_processed = 0
+        encodes_queued = 0
 
         for idx, sequence in enumerate(manager.sequences):
             if not sequence.enabled:
@@ -285,22 +404,89 @@ class HGFX_OT_BatchApplySequences(Operator):
 
             # Set output path
             output_path = f"{original_filepath}{sequence.name}_"
-            context.scene.render.filepath = output_path
+            scene.render.filepath = output_path
 
             # Render animation
             try:
+                render_start = time.perf_counter()
                 bpy.ops.render.render(animation=True)
                 sequences_processed += 1
-                self.report({'INFO'}, f"Rendered sequence: {sequence.name}")
+                self.report({'INFO'}, f"Rendered sequence: {sequence.name} "
+                                      f"({time.perf_counter() - render_start:.1f}s)")
             except Exception as e:
                 self.report({'ERROR'}, f"Failed to render {sequence.name}: {e}")
+                continue
 
-        # Restore original filepath
-        context.scene.render.filepath = original_filepath
+            # Hand the finished shot to the encode queue and keep rendering
+            if ffmpeg:
+                try:
+                    self.queue_encode(scene, ffmpeg, sequence.name, encode_limit)
+                    encodes_queued += 1
+                except Exception as e:
+                    self.report({'ERROR'}, f"Failed to queue encode for {sequence.name}: {e}")
 
-        self.report({'INFO'}, f"Batch processed {sequences_processed} sequences")
+        # Restore original filepath
+        scene.render.filepath = original_filepath
+        if encode_limit:
+            encode_limit.close()
+
+        if encodes_queued:
+            bpy.ops.hgfx.ffmpeg_job_monitor('INVOKE_DEFAULT')
+            active = len(get_job_queue().active_jobs())
+            self.report({'INFO'}, f"Batch processed {sequences_processed} sequences, "
+                                  f"{active} of {encodes_queued} encodes still running")
+        else:
+            self.report({'INFO'}, f"Batch processed {sequences_processed} sequences")
         return {'FINISHED'}
 
+    def get_encoder(self, scene):
+        """Get a validated FFmpeg handler, reporting why encoding is impossible"""
+        if scene.render.is_movie_format:
+            self.report({'ERROR'}, "Shot encoding needs an image sequence output format")
+            return None
+
+        ffmpeg = get_ffmpeg_handler()
+        valid, message = ffmpeg.validate_codec(self.codec)
+        if not valid:
+            self.report({'ERROR'}, message)
+            return None
+        return ffmpeg
+
+    def queue_encode(self, scene, ffmpeg, shot_name, encode_limit):
+        """Queue the encode of the frames just rendered to scene.render.filepath"""
+        input_pattern = _frame_pattern(scene)
+        prefix = bpy.path.abspath(scene.render.filepath)
+        video_path = f"{prefix.rstrip('_#')}.mp4" if self.codec in ('H264', 'H265') \
+            else f"{prefix.rstrip('_#')}.mov"
+
+        def on_finish(job):
+            encode_limit.job_finished(job)
+            if job.state == 'DONE':
+                print(f"HyperGradeFX: Encoded {shot_name} in {job.elapsed:.1f}s: {video_path}")
+            elif job.state == 'FAILED':
+                print(f"HyperGradeFX: Encoding {shot_name} failed: {job.error_output}")
+
+        encode_limit.add()
+        try:
+            job = ffmpeg.encode_image_sequence_async(
+                input_pattern,
+                video_path,
+                scene.frame_end - scene.frame_start + 1,
+                codec=self.codec,
+                framerate=scene.render.fps,
+                start_number=scene.frame_start,
+                quality=self.quality,
+                on_finish=on_finish
+            )
+        except Exception:
+            encode_limit.job_finished()
+            raise
+        job.label = shot_name
+        return job
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
 
 class HGFX_OT_SaveSequencePreset(Operator):
     """Save sequence as a preset"""
@@ -3,13 +3,119 @@ Export and Automation Tools
 Handles batch export and FFmpeg integration
 """
 
+import os
+import shutil
 import bpy
-from bpy.types import Operator
-from bpy.props import StringProperty, EnumProperty, BoolProperty, IntProperty
+import numpy as np
+from bpy.types import Operator, PropertyGroup
+from bpy.props import StringProperty, EnumProperty, BoolProperty, IntProperty, CollectionProperty
 from pathlib import Path
 from ..utils.ffmpeg_handler import get_ffmpeg_handler
-from ..utils.openimageio_handler import get_image_handler
-from ..utils.constants import EXPORT_FORMATS, VIDEO_CODECS
+from ..utils.ffmpeg_jobs import get_job_queue
+from ..utils.openimageio_handler import get_image_handler, has_file_io, has_display_transform
+from ..utils.security import SecurityValidator
+from ..utils.constants import EXPORT_FORMATS, VIDEO_CODECS, HIGH_BIT_DEPTH_FORMATS
+
+
+# File extension per Blender file format
+_FORMAT_EXTENSIONS = {
+    'PNG': '.png',
+    'JPEG': '.jpg',
+    'OPEN_EXR': '.exr',
+    'TIFF': '.tif',
+}
+
+
+class HGFXExportTarget(PropertyGroup):
+    """One output of a multi-format batch export"""
+
+    name: StringProperty(
+        name="Folder",
+        description="Subfolder of the output directory for this target",
+        default="png"
+    )
+
+    enabled: BoolProperty(
+        name="Enabled",
+        default=True
+    )
+
+    file_format: EnumProperty(
+        name="Format",
+        items=[
+            ('PNG', 'PNG', 'PNG format'),
+            ('JPEG', 'JPEG', 'JPEG format'),
+            ('OPEN_EXR', 'OpenEXR', 'OpenEXR format'),
+            ('TIFF', 'TIFF', 'TIFF format'),
+        ],
+        default='PNG'
+    )
+
+    color_depth: EnumProperty(
+        name="Color Depth",
+        items=[
+            ('8', '8', '8 bits per channel (PNG, TIFF, JPEG)'),
+            ('16', '16', '16 bits per channel, half float for OpenEXR'),
+            ('32', '32', '32-bit float (OpenEXR)'),
+        ],
+        default='8'
+    )
+
+    scale: bpy.props.FloatProperty(
+        name="Scale",
+        description="Output size relative to the render resolution",
+        default=1.0,
+        min=0.05,
+        max=1.0
+    )
+
+    quality: IntProperty(
+        name="Quality",
+        description="JPEG quality",
+        default=90,
+        min=1,
+        max=100
+    )
+
+
+class HGFXExportTargetList(PropertyGroup):
+    """Export targets written by Batch Export Frames"""
+
+    targets: CollectionProperty(type=HGFXExportTarget)
+    active_target_index: IntProperty(default=0)
+
+
+class HGFX_OT_AddExportTarget(Operator):
+    """Add an export target"""
+    bl_idname = "hgfx.add_export_target"
+    bl_label = "Add Export Target"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        target_list = context.scene.hgfx_export_targets
+        target = target_list.targets.add()
+        target.name = f"target_{len(target_list.targets)}"
+        target_list.active_target_index = len(target_list.targets) - 1
+        return {'FINISHED'}
+
+
+class HGFX_OT_RemoveExportTarget(Operator):
+    """Remove the active export target"""
+    bl_idname = "hgfx.remove_export_target"
+    bl_label = "Remove Export Target"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        target_list = context.scene.hgfx_export_targets
+        index = target_list.active_target_index
+
+        if 0 <= index < len(target_list.targets):
+            target_list.targets.remove(index)
+            target_list.active_target_index = max(0, index - 1)
+        else:
+            self.report({'WARNING'}, "No export target to remove")
+
+        return {'FINISHED'}
 
 
 class HGFX_OT_BatchExportFrames(Operator):
@@ -45,7 +151,53 @@ class HGFX_OT_BatchExportFrames(Operator):
         default=250
     )
 
+    write_behind: BoolProperty(
+        name="Write Behind",
+        description="Compress and write frames in the background while the next frame renders",
+        default=True
+    )
+
+    queue_depth: IntProperty(
+        name="Queue Depth",
+        description="Frames that may wait to be written before rendering pauses",
+        default=4,
+        min=1,
+        max=32
+    )
+
+    use_targets: BoolProperty(
+        name="Use Export Targets",
+        description="Render each frame once and write it to every enabled export target "
+                    "(format, bit depth and scale per target subfolder)",
+        default=False
+    )
+
+    dedupe_holds: BoolProperty(
+        name="Link Held Frames",
+        description="When a frame is identical to the previous one, hardlink (or copy) "
+                    "the previous file instead of encoding it again",
+        default=False
+    )
+
+    dedupe_exact: BoolProperty(
+        name="Exact Compare",
+        description="Confirm held frames pixel by pixel instead of trusting a sampled hash",
+        default=True
+    )
+
+    skip_unchanged: BoolProperty(
+        name="Skip Unchanged Frames",
+        description="Skip frames whose output exists and whose compositor and render settings "
+                    "are unchanged since the last export. Scene content is not checked, so "
+                    "leave this off after editing objects, materials or lights",
+        default=False
+    )
+
     def execute(self, context):
+        from ..utils.buffer_pool import get_buffer_pool
+        from ..utils.export_manifest import ExportManifest, frame_digest
+        from ..utils.frame_dedup import FrameDeduplicator, break_hardlink, link_or_copy
+
         scene = context.scene
 
         if self.frame_start == 1 and self.frame_end == 250:
@@ -53,54 +205,566 @@ class HGFX_OT_BatchExportFrames(Operator):
             self.frame_end = scene.frame_end
 
         output_dir = Path(bpy.path.abspath(self.output_directory))
-        output_dir.mkdir(parents=True, exist_ok=True)
+
+        # Each destination is one output directory and format
+        if self.use_targets:
+            targets = [t for t in scene.hgfx_export_targets.targets if t.enabled]
+            if not targets:
+                self.report({'ERROR'}, "No export targets enabled")
+                return {'CANCELLED'}
+            for target in targets:
+                reason = _frame_capture_unsupported(scene, target.file_format)
+                if reason:
+                    self.report({'ERROR'}, f"Export targets need frame capture, but {reason}")
+                    return {'CANCELLED'}
+            destinations = [{
+                'directory': output_dir / SecurityValidator.sanitize_filename(target.name),
+                'format': target.file_format,
+                'tag': [target.file_format, target.color_depth, target.quality, round(target.scale, 4)],
+                'target': target,
+            } for target in targets]
+        else:
+            destinations = [{'directory': output_dir, 'format': self.file_format, 'tag': None, 'target': None}]
+
+        for dest in destinations:
+            dest['directory'].mkdir(parents=True, exist_ok=True)
+            dest['manifest'] = ExportManifest(dest['directory'])
 
         # Store original settings
         original_filepath = scene.render.filepath
         original_format = scene.render.image_settings.file_format
 
+        pending = {}
+        rendered = 0
+        skipped = 0
+        held = 0
+        previous_paths = None
+
+        capture = None
+        writer = None
+        if self.use_targets:
+            capture = _FrameCapture(scene)
+        elif self.write_behind:
+            reason = _frame_capture_unsupported(scene, self.file_format)
+            if reason:
+                self.report({'WARNING'}, f"Write-behind disabled: {reason}")
+            else:
+                capture = _FrameCapture(scene)
+
         try:
             scene.render.image_settings.file_format = self.file_format
 
+            dedup = None
+            if self.dedupe_holds:
+                if capture:
+                    dedup = FrameDeduplicator(exact=self.dedupe_exact)
+                else:
+                    self.report({'WARNING'}, "Held frame detection needs write-behind frame capture")
+
+            if capture:
+                for dest in destinations:
+                    target = dest['target']
+                    dest['encode'] = capture.encoder(scene) if target is None else capture.encoder(
+                        scene, target.file_format, target.color_depth, target.quality, target.scale
+                    )
+                writer = capture.create_writer(
+                    self.queue_depth * len(destinations),
+                    threads=min(8, max(2, len(destinations)))
+                )
+
             for frame in range(self.frame_start, self.frame_end + 1):
                 scene.frame_set(frame)
 
-                # Generate filename
-                filename = f"frame_{frame:04d}"
-                if self.file_format == 'PNG':
-                    filename += '.png'
-                elif self.file_format == 'JPEG':
-                    filename += '.jpg'
-                elif self.file_format == 'OPEN_EXR':
-                    filename += '.exr'
-                elif self.file_format == 'TIFF':
-                    filename += '.tif'
-
-                filepath = output_dir / filename
-                scene.render.filepath = str(filepath)
-
-                # Render frame
-                bpy.ops.render.render(write_still=True)
-
-                self.report({'INFO'}, f"Exported frame {frame}")
-
-            self.report({'INFO'}, f"Batch export complete: {self.frame_end - self.frame_start + 1} frames")
+                # Hashed after frame_set() so animated compositor values count
+                fingerprint = _export_fingerprint(scene)
+
+                stale = []
+                for dest in destinations:
+                    filepath = dest['directory'] / f"frame_{frame:04d}{_FORMAT_EXTENSIONS[dest['format']]}"
+                    digest = frame_digest({'scene': fingerprint, 'target': dest['tag']}, frame)
+                    if not (self.skip_unchanged and dest['manifest'].is_current(frame, filepath, digest)):
+                        stale.append((dest, filepath, digest))
+
+                if not stale:
+                    skipped += 1
+                    if dedup:
+                        dedup.reset()
+                    previous_paths = None
+                    continue
+
+                frame_paths = {id(dest): filepath for dest, filepath, _ in stale}
+
+                if writer:
+                    # Render once; every stale output is written on background threads
+                    bpy.ops.render.render(write_still=False)
+                    buffer = capture.read_pooled()
+
+                    outputs = stale
+                    if dedup and dedup.is_repeat(buffer) and previous_paths:
+                        # Held frame: reuse the previous frame's files once written
+                        writer.flush()
+                        self.report_written(writer, pending)
+                        outputs = []
+                        for dest, filepath, digest in stale:
+                            try:
+                                # A missing source means its write never landed
+                                if not os.path.exists(previous_paths[id(dest)]):
+                                    raise FileNotFoundError(previous_paths[id(dest)])
+                                link_or_copy(previous_paths[id(dest)], filepath)
+                            except OSError:
+                                outputs.append((dest, filepath, digest))
+                                continue
+                            dest['manifest'].record(frame, filepath, digest)
+                        if not outputs:
+                            get_buffer_pool().release(buffer)
+                            held += 1
+                            self.report({'INFO'}, f"Exported frame {frame}")
+
+                    if outputs:
+                        # Anything that could not be linked is written from this frame's buffer
+                        for dest, filepath, digest in outputs:
+                            break_hardlink(filepath)
+                            pending[str(filepath)] = (dest['manifest'], frame, digest)
+                        capture.submit(writer, [(filepath, dest['encode']) for dest, filepath, _ in outputs],
+                                       buffer=buffer)
+                        self.report_written(writer, pending)
+                else:
+                    # Render frame
+                    dest, filepath, digest = stale[0]
+                    break_hardlink(filepath)
+                    scene.render.filepath = str(filepath)
+                    bpy.ops.render.render(write_still=True)
+                    dest['manifest'].record(frame, filepath, digest)
+                    self.report({'INFO'}, f"Exported frame {frame}")
+
+                # Only destinations rendered this frame can serve the next one
+                previous_paths = frame_paths if len(frame_paths) == len(destinations) else None
+                rendered += 1
+
+            if writer:
+                writer.close()
+                self.report_written(writer, pending)
+                stats = writer.get_stats()
+                print(f"HyperGradeFX: Write-behind wrote {stats['frames']} files "
+                      f"({stats['write_seconds']:.1f}s hidden, "
+                      f"{stats['backpressure_seconds']:.1f}s waiting on a full queue)")
+
+            message = f"Batch export complete: {rendered} frames"
+            if len(destinations) > 1:
+                message += f" to {len(destinations)} targets"
+            if skipped:
+                message += f", {skipped} unchanged frames skipped"
+            if held:
+                message += f", {held} held frames linked"
+            self.report({'INFO'}, message)
 
         except Exception as e:
+            if writer:
+                writer.close(wait=False)
+                _record_written(writer, pending)
             self.report({'ERROR'}, f"Export failed: {e}")
             return {'CANCELLED'}
 
         finally:
+            # Frames written so far stay recorded, so a rerun resumes here
+            for dest in destinations:
+                dest['manifest'].flush()
+
+            if capture:
+                capture.remove()
+
             # Restore settings
             scene.render.filepath = original_filepath
             scene.render.image_settings.file_format = original_format
 
         return {'FINISHED'}
 
+    def report_written(self, writer, pending):
+        """Record finished write-behind files and report frames now fully written"""
+        for frame in _record_written(writer, pending):
+            self.report({'INFO'}, f"Exported frame {frame}")
+
     def invoke(self, context, event):
         return context.window_manager.invoke_props_dialog(self)
 
 
+# Node properties that do not change the composited image
+_COSMETIC_NODE_PROPS = {
+    'name', 'label', 'location', 'width', 'height', 'width_hidden', 'color',
+    'use_custom_color', 'select', 'show_options', 'show_preview', 'hide',
+    'show_texture', 'parent', 'dimensions', 'bl_idname', 'bl_label',
+    'bl_description', 'bl_icon', 'bl_static_type', 'bl_width_default',
+    'bl_width_min', 'bl_width_max', 'bl_height_default', 'bl_height_min',
+    'bl_height_max', 'rna_type', 'type', 'inputs', 'outputs', 'internal_links',
+}
+
+
+# Nested structs followed below a node property; deeper ones are not hashed
+_MAX_RNA_DEPTH = 4
+
+
+def _rna_value(value, depth=0):
+    """
+    Convert an RNA property value into something JSON can hash
+
+    Never falls back to str() or repr() of a struct, whose memory address
+    would change the digest in every session.
+    """
+    if isinstance(value, (bool, int, float, str)) or value is None:
+        return value
+    if isinstance(value, bpy.types.ID):
+        # Images and movie clips change with their source file
+        return [value.name, getattr(value, 'filepath', '')]
+    if isinstance(value, bpy.types.CurveMapping):
+        return [[list(point.location) for point in curve.points] for curve in value.curves]
+    if isinstance(value, bpy.types.ColorRamp):
+        return [value.interpolation, value.color_mode,
+                [[element.position, list(element.color)] for element in value.elements]]
+    if isinstance(value, bpy.types.bpy_struct):
+        # Other pointer structs (image user, crop rectangle, ...): hash their settings
+        if depth >= _MAX_RNA_DEPTH:
+            return None
+        settings = {}
+        for prop in value.bl_rna.properties:
+            key = prop.identifier
+            if key == 'rna_type' or (prop.is_readonly and prop.type not in ('POINTER', 'COLLECTION')):
+                continue
+            settings[key] = _rna_value(getattr(value, key, None), depth + 1)
+        return settings
+    try:
+        return [_rna_value(item, depth + 1) for item in value]
+    except TypeError:
+        # Unknown non-iterable object: only its type is stable
+        return type(value).__name__
+
+
+def _node_fingerprint(node):
+    """Describe a compositor node's settings and unlinked input values"""
+    settings = {'type': node.bl_idname, 'mute': node.mute}
+
+    for prop in node.bl_rna.properties:
+        key = prop.identifier
+        if key in _COSMETIC_NODE_PROPS or key in settings:
+            continue
+        if prop.type == 'COLLECTION' or (prop.is_readonly and prop.type != 'POINTER'):
+            continue
+        settings[key] = _rna_value(getattr(node, key, None))
+
+    settings['inputs'] = {
+        socket.identifier: _rna_value(socket.default_value)
+        for socket in node.inputs
+        if not socket.is_linked and hasattr(socket, 'default_value')
+    }
+    return settings
+
+
+def _export_fingerprint(scene):
+    """
+    Describe everything about the scene's output that the export manifest tracks
+
+    Covers the compositor nodes and links, resolution, engine and samples,
+    color management and output format. Scene content (objects, materials,
+    lights) is not included.
+
+    Returns:
+        dict: JSON-serializable description
+    """
+    render = scene.render
+    settings = render.image_settings
+    view = scene.view_settings
+
+    fingerprint = {
+        'engine': render.engine,
+        'resolution': [render.resolution_x, render.resolution_y, render.resolution_percentage],
+        'pixel_aspect': [render.pixel_aspect_x, render.pixel_aspect_y],
+        'border': [render.use_border, render.use_crop_to_border,
+                   render.border_min_x, render.border_min_y,
+                   render.border_max_x, render.border_max_y],
+        'film_transparent': render.film_transparent,
+        'camera': scene.camera.name if scene.camera else None,
+        'view': [view.view_transform, view.look, view.exposure, view.gamma],
+        'display': scene.display_settings.display_device,
+        'image': [settings.file_format, settings.color_mode, settings.color_depth,
+                  settings.compression, settings.quality,
+                  getattr(settings, 'exr_codec', None)],
+        'compositor': None,
+    }
+
+    if render.engine == 'CYCLES' and hasattr(scene, 'cycles'):
+        fingerprint['samples'] = scene.cycles.samples
+    elif hasattr(scene, 'eevee'):
+        fingerprint['samples'] = scene.eevee.taa_render_samples
+
+    if scene.use_nodes and scene.node_tree:
+        node_tree = scene.node_tree
+        fingerprint['compositor'] = {
+            'nodes': {node.name: _node_fingerprint(node) for node in node_tree.nodes},
+            'links': sorted(
+                [link.from_node.name, link.from_socket.identifier,
+                 link.to_node.name, link.to_socket.identifier, link.is_muted]
+                for link in node_tree.links
+            ),
+        }
+
+    return fingerprint
+
+
+def _record_written(writer, pending):
+    """
+    Record the files the write-behind writer has finished in their manifests
+
+    Returns:
+        list: Frames whose files have now all been written
+    """
+    if not pending:
+        return []
+    # Unrecorded paths can only be among the last len(pending) written
+    finished = set(writer.written[-len(pending):])
+    frames = set()
+    for path in [path for path in pending if path in finished]:
+        manifest, frame, digest = pending.pop(path)
+        manifest.record(frame, path, digest)
+        frames.add(frame)
+    outstanding = {frame for _, frame, _ in pending.values()}
+    return sorted(frames - outstanding)
+
+
+def _encode_frame(path, pixels, encode):
+    """SequenceWriter entry point: each queued file carries its own encoder"""
+    encode(path, pixels)
+
+
+def _frame_capture_unsupported(scene, file_format, require_file_io=True):
+    """
+    Check whether rendered frames can be captured and written outside Blender
+
+    Args:
+        scene: Blender scene
+        file_format: Output file format ('PNG' for display-referred output)
+        require_file_io: Frames are written with OpenImageIO
+
+    Returns:
+        str: Reason capture is not possible, or None when it is
+    """
+    if require_file_io and not has_file_io():
+        return "OpenImageIO Python module is not available"
+
+    if not scene.use_nodes or not scene.node_tree:
+        return "the compositor is not enabled"
+
+    if not any(node.type == 'COMPOSITE' for node in scene.node_tree.nodes):
+        return "the compositor has no Composite node"
+
+    # EXR stores scene linear values; other formats need the view transform.
+    # Standard on sRGB is reproduced directly, anything else through
+    # OpenColorIO with Blender's configuration
+    if file_format != 'OPEN_EXR':
+        view = scene.view_settings
+        if view.use_curve_mapping:
+            return "view curve mapping can only be applied by Blender"
+        if not _is_standard_view(scene):
+            if not has_display_transform():
+                return (f"view transform '{view.view_transform}' needs OpenImageIO "
+                        f"with OpenColorIO support")
+            if not _ocio_config_path():
+                return "Blender's OpenColorIO configuration was not found"
+
+    return None
+
+
+def _is_standard_view(scene):
+    """Check for the Standard view on an sRGB display without a look"""
+    view = scene.view_settings
+    return (view.view_transform == 'Standard' and view.look in ('None', '')
+            and scene.display_settings.display_device == 'sRGB')
+
+
+def _ocio_config_path():
+    """Get the OpenColorIO configuration Blender uses, or None"""
+    config_path = os.environ.get('OCIO')
+    if not config_path:
+        config_path = bpy.utils.system_resource('DATAFILES', path="colormanagement/config.ocio")
+    return config_path if config_path and os.path.isfile(config_path) else None
+
+
+class _FrameCapture:
+    """Read each composited frame through a temporary Viewer node"""
+
+    def __init__(self, scene):
+        node_tree = scene.node_tree
+        composite = next(node for node in node_tree.nodes if node.type == 'COMPOSITE')
+
+        self.node_tree = node_tree
+        self.previous_active = node_tree.nodes.active
+        self.viewer = node_tree.nodes.new('CompositorNodeViewer')
+        self.viewer.label = "HGFX Write Behind"
+        self.viewer.location = (composite.location.x, composite.location.y - 200)
+
+        # Only the active Viewer writes the 'Viewer Node' image
+        node_tree.nodes.active = self.viewer
+
+        if composite.inputs[0].links:
+            node_tree.links.new(composite.inputs[0].links[0].from_socket, self.viewer.inputs[0])
+
+    @staticmethod
+    def display_transform(scene, keep_alpha=True):
+        """
+        Get a function applying the scene's view transform
+
+        The function takes captured pixels (scene linear, bottom row first)
+        and returns display-referred pixels, top row first. Standard on sRGB
+        is computed directly; other views, looks and displays go through
+        OpenColorIO with Blender's configuration. Safe to call on writer
+        threads.
+        """
+        from ..utils.color_ops import linear_to_srgb
+        from ..utils.openimageio_handler import apply_display_transform
+
+        view = scene.view_settings
+        exposure_scale = 2.0 ** view.exposure
+        inv_gamma = 1.0 / view.gamma if view.gamma > 0 else 1.0
+
+        if _is_standard_view(scene):
+            to_display = linear_to_srgb
+        else:
+            # Resolved here: bpy must not be used on writer threads
+            display = scene.display_settings.display_device
+            view_name = view.view_transform
+            look = '' if view.look in ('None', '') else view.look
+            config_path = _ocio_config_path()
+
+            def to_display(rgb):
+                return apply_display_transform(rgb, display, view_name, look, config_path)
+
+        def transform(pixels):
+            # Blender images are stored bottom row first
+            pixels = pixels[::-1]
+            rgb = to_display(pixels[..., :3] * exposure_scale)
+            if inv_gamma != 1.0:
+                rgb = rgb ** inv_gamma
+            if keep_alpha:
+                return np.concatenate([rgb, pixels[..., 3:]], axis=-1)
+            return rgb
+
+        return transform
+
+    def read(self, out=None):
+        """
+        Read the composited frame after a render
+
+        Returns:
+            numpy.ndarray: Scene linear pixels, bottom row first
+        """
+        image = bpy.data.images.get('Viewer Node')
+        if image is None:
+            raise RuntimeError("Viewer image not found after render")
+        return get_image_handler().get_pixel_data(image, out=out)
+
+    def encoder(self, scene, file_format=None, color_depth=None, quality=None, scale=1.0):
+        """
+        Get a function that writes captured pixels in one output format
+
+        Settings not given come from the scene's output settings. The
+        function runs on writer threads: it resizes, applies the view
+        transform (EXR stays scene linear) and writes the file.
+
+        Args:
+            scene: Blender scene
+            file_format: 'PNG', 'JPEG', 'OPEN_EXR' or 'TIFF'
+            color_depth: '8', '16' or '32' (16 and 32 are half and full float for EXR)
+            quality: JPEG quality
+            scale: Output size relative to the render
+
+        Returns:
+            callable: encode(path, pixels)
+        """
+        from ..utils.openimageio_handler import write_image_file, resize_area
+
+        settings = scene.render.image_settings
+        file_format = file_format or settings.file_format
+        color_depth = color_depth or settings.color_depth
+        keep_alpha = settings.color_mode == 'RGBA' and file_format != 'JPEG'
+        to_display = self.display_transform(scene, keep_alpha)
+
+        write_kwargs = {}
+        if file_format == 'OPEN_EXR':
+            write_kwargs['color_depth'] = '32' if color_depth == '32' else 'HALF'
+            write_kwargs['compression'] = settings.exr_codec.lower()
+        elif file_format in ('PNG', 'TIFF'):
+            write_kwargs['color_depth'] = '8' if color_depth == '8' else '16'
+        elif file_format == 'JPEG':
+            write_kwargs['quality'] = quality or settings.quality
+
+        def encode(path, pixels):
+            if scale != 1.0:
+                height, width = pixels.shape[:2]
+                pixels = resize_area(pixels, max(1, round(width * scale)), max(1, round(height * scale)))
+            if file_format == 'OPEN_EXR':
+                # Blender images are stored bottom row first
+                pixels = pixels[::-1] if keep_alpha else pixels[::-1, :, :3]
+            else:
+                pixels = to_display(pixels)
+            write_image_file(path, pixels, **write_kwargs)
+
+        return encode
+
+    def create_writer(self, queue_depth, threads=2):
+        """Create a SequenceWriter for files queued with submit()"""
+        from ..utils.sequence_io import SequenceWriter
+
+        return SequenceWriter(writer=_encode_frame, queue_depth=queue_depth, threads=threads)
+
+    def read_pooled(self):
+        """Copy the current Viewer image into a buffer from the shared pool"""
+        from ..utils.buffer_pool import get_buffer_pool
+
+        image = bpy.data.images.get('Viewer Node')
+        if image is None:
+            raise RuntimeError("Viewer image not found after render")
+
+        width, height = image.size
+        return self.read(out=get_buffer_pool().acquire(width, height, image.channels))
+
+    def submit(self, writer, outputs, buffer=None):
+        """
+        Queue the captured frame's files on the writer
+
+        Args:
+            writer: SequenceWriter from create_writer()
+            outputs: (filepath, encode) pairs; they share the one buffer,
+                     which returns to the pool after the last is written
+            buffer: Frame from read_pooled() (default: read it now)
+        """
+        from ..utils.buffer_pool import get_buffer_pool
+
+        pool = get_buffer_pool()
+        if buffer is None:
+            buffer = self.read_pooled()
+
+        remaining = [len(outputs)]
+
+        def release(pixels):
+            remaining[0] -= 1
+            if remaining[0] == 0:
+                pool.release(pixels)
+
+        for filepath, encode in outputs:
+            writer.submit(filepath, buffer, release=release, encode=encode)
+
+    def remove(self):
+        """Remove the temporary Viewer node and restore the active node"""
+        try:
+            self.node_tree.nodes.remove(self.viewer)
+        except (ReferenceError, RuntimeError):
+            pass
+
+        try:
+            if self.previous_active is not None and self.previous_active.name in self.node_tree.nodes:
+                self.node_tree.nodes.active = self.previous_active
+        except (ReferenceError, RuntimeError):
+            pass
+
+
 class HGFX_OT_ExportToVideo(Operator):
     """Export compositor output to video using FFmpeg"""
     bl_idname = "hgfx.export_to_video"
@@ -134,12 +798,56 @@ class HGFX_OT_ExportToVideo(Operator):
         default='high'
     )
 
+    stream: BoolProperty(
+        name="Stream to FFmpeg",
+        description="Pipe each rendered frame straight into FFmpeg instead of writing temporary PNGs. "
+                    "The scene's view transform is applied (through OpenColorIO for views other "
+                    "than Standard); view curve mapping falls back to temporary PNGs",
+        default=True
+    )
+
     render_first: BoolProperty(
         name="Render Frames First",
         description="Render all frames before encoding",
         default=True
     )
 
+    high_bit_depth: BoolProperty(
+        name="10-bit",
+        description="Keep 16-bit frames end to end and encode 10-bit (ProRes, DNxHR, H.265)",
+        default=False
+    )
+
+    chroma: EnumProperty(
+        name="Chroma",
+        items=[
+            ('422', '4:2:2', '10-bit 4:2:2 (ProRes HQ, DNxHR HQX)'),
+            ('444', '4:4:4', '10-bit 4:4:4 (ProRes 4444, DNxHR 444)'),
+        ],
+        default='422'
+    )
+
+    background_encode: BoolProperty(
+        name="Encode in Background",
+        description="Queue the encode and keep Blender responsive; progress shows in the Export panel",
+        default=True
+    )
+
+    encode_workers: IntProperty(
+        name="Encode Workers",
+        description="Concurrent FFmpeg processes encoding segments of rendered frames (1 = single process)",
+        default=1,
+        min=1,
+        max=64
+    )
+
+    segment_length: IntProperty(
+        name="Segment Length",
+        description="Frames per segment when encoding with several workers",
+        default=240,
+        min=1
+    )
+
     def execute(self, context):
         scene = context.scene
 
@@ -149,8 +857,26 @@ class HGFX_OT_ExportToVideo(Operator):
             self.report({'ERROR'}, "FFmpeg not found. Please set FFmpeg path in preferences")
             return {'CANCELLED'}
 
+        if self.high_bit_depth and self.codec not in HIGH_BIT_DEPTH_FORMATS:
+            self.report({'ERROR'}, f"{self.codec} has no 10-bit option; use ProRes, DNxHD or H.265")
+            return {'CANCELLED'}
+
+        # Fail before rendering anything if this FFmpeg cannot encode the codec
+        valid, message = ffmpeg.validate_codec(
+            self.codec, ffmpeg.get_output_pix_fmt(self.codec, self.high_bit_depth, self.chroma)
+        )
+        if not valid:
+            self.report({'ERROR'}, message)
+            return {'CANCELLED'}
+
         output_path = bpy.path.abspath(self.output_path)
 
+        if self.stream:
+            reason = _frame_capture_unsupported(scene, 'PNG', require_file_io=False)
+            if not reason:
+                return self.stream_frames(scene, ffmpeg, output_path)
+            self.report({'WARNING'}, f"Streaming disabled, rendering temporary PNGs: {reason}")
+
         # Render frames first if needed
         if self.render_first:
             temp_dir = Path(bpy.path.abspath("//temp_frames/"))
@@ -158,11 +884,23 @@ class HGFX_OT_ExportToVideo(Operator):
 
             self.report({'INFO'}, "Rendering frames...")
 
-            for frame in range(scene.frame_start, scene.frame_end + 1):
-                scene.frame_set(frame)
-                filepath = temp_dir / f"frame_{frame:04d}.png"
-                scene.render.filepath = str(filepath)
-                bpy.ops.render.render(write_still=True)
+            image_settings = scene.render.image_settings
+            original_format = image_settings.file_format
+            original_depth = image_settings.color_depth
+
+            try:
+                # 16-bit PNGs keep the precision a 10-bit encode needs
+                image_settings.file_format = 'PNG'
+                image_settings.color_depth = '16' if self.high_bit_depth else '8'
+
+                for frame in range(scene.frame_start, scene.frame_end + 1):
+                    scene.frame_set(frame)
+                    filepath = temp_dir / f"frame_{frame:04d}.png"
+                    scene.render.filepath = str(filepath)
+                    bpy.ops.render.render(write_still=True)
+            finally:
+                image_settings.file_format = original_format
+                image_settings.color_depth = original_depth
 
             # Encode to video
             self.report({'INFO'}, "Encoding video...")
@@ -170,20 +908,61 @@ class HGFX_OT_ExportToVideo(Operator):
             input_pattern = str(temp_dir / "frame_%04d.png")
             framerate = scene.render.fps
 
-            success = ffmpeg.encode_image_sequence(
-                input_pattern,
-                output_path,
-                codec=self.codec,
-                framerate=framerate,
-                start_number=scene.frame_start,
-                quality=self.quality
-            )
+            if self.background_encode and self.encode_workers == 1:
+                def on_finish(job):
+                    if job.state == 'DONE':
+                        print(f"Video encoded successfully: {output_path}")
+                        shutil.rmtree(temp_dir, ignore_errors=True)
+                    elif job.state == 'FAILED':
+                        print(f"FFmpeg error: {job.error_output}")
+
+                ffmpeg.encode_image_sequence_async(
+                    input_pattern,
+                    output_path,
+                    scene.frame_end - scene.frame_start + 1,
+                    codec=self.codec,
+                    framerate=framerate,
+                    start_number=scene.frame_start,
+                    quality=self.quality,
+                    on_finish=on_finish,
+                    high_bit_depth=self.high_bit_depth,
+                    chroma=self.chroma
+                )
+                bpy.ops.hgfx.ffmpeg_job_monitor('INVOKE_DEFAULT')
+
+                self.report({'INFO'}, f"Encoding {Path(output_path).name} in the background")
+                return {'FINISHED'}
+
+            if self.encode_workers > 1:
+                success = ffmpeg.encode_image_sequence_chunked(
+                    input_pattern,
+                    output_path,
+                    scene.frame_end - scene.frame_start + 1,
+                    codec=self.codec,
+                    framerate=framerate,
+                    start_number=scene.frame_start,
+                    quality=self.quality,
+                    workers=self.encode_workers,
+                    segment_frames=self.segment_length,
+                    high_bit_depth=self.high_bit_depth,
+                    chroma=self.chroma
+                )
+            else:
+                success = ffmpeg.encode_image_sequence(
+                    input_pattern,
+                    output_path,
+                    codec=self.codec,
+                    framerate=framerate,
+                    start_number=scene.frame_start,
+                    quality=self.quality,
+                    high_bit_depth=self.high_bit_depth,
+                    chroma=self.chroma
+                )
 
             if success:
                 self.report({'INFO'}, f"Video exported: {output_path}")
 
                 # Clean up temp frames
-                import shutil
                 shutil.rmtree(temp_dir)
 
                 return {'FINISHED'}
@@ -195,10 +974,340 @@ class HGFX_OT_ExportToVideo(Operator):
             self.report({'ERROR'}, "Frame sequence export not yet implemented")
             return {'CANCELLED'}
 
+    def stream_frames(self, scene, ffmpeg, output_path):
+        """Render each frame and pipe it to FFmpeg as raw RGB"""
+        from ..utils.buffer_pool import get_buffer_pool
+
+        render = scene.render
+        width = render.resolution_x * render.resolution_percentage // 100
+        height = render.resolution_y * render.resolution_percentage // 100
+
+        capture = _FrameCapture(scene)
+        to_display = _FrameCapture.display_transform(scene, keep_alpha=False)
+        encoder = None
+
+        try:
+            encoder = ffmpeg.open_rawvideo_encoder(
+                output_path, width, height,
+                codec=self.codec,
+                framerate=render.fps,
+                quality=self.quality,
+                # 16 bits per channel into a 10-bit encode: no 8-bit step
+                pix_fmt='rgb48le' if self.high_bit_depth else 'rgb24',
+                high_bit_depth=self.high_bit_depth,
+                chroma=self.chroma
+            )
+
+            self.report({'INFO'}, "Rendering and encoding frames...")
+
+            with get_buffer_pool().borrow(width, height, 4) as buffer:
+                for frame in range(scene.frame_start, scene.frame_end + 1):
+                    scene.frame_set(frame)
+                    bpy.ops.render.render(write_still=False)
+                    encoder.write_frame(to_display(capture.read(out=buffer)))
+
+            success = encoder.close()
+            encoder = None
+
+        except Exception as e:
+            if encoder:
+                encoder.abort()
+            self.report({'ERROR'}, f"Streaming export failed: {e}")
+            return {'CANCELLED'}
+
+        finally:
+            capture.remove()
+
+        if success:
+            self.report({'INFO'}, f"Video exported: {output_path}")
+            return {'FINISHED'}
+
+        self.report({'ERROR'}, "FFmpeg encoding failed")
+        return {'CANCELLED'}
+
     def invoke(self, context, event):
         return context.window_manager.invoke_props_dialog(self)
 
 
+class HGFX_OT_RenderFarmExport(Operator):
+    """Render frames with several background Blender processes"""
+    bl_idname = "hgfx.render_farm_export"
+    bl_label = "Local Farm Render"
+    bl_options = {'REGISTER'}
+
+    # RenderFarm of the running render, for HGFX_OT_CancelRenderFarm
+    _active_farm = None
+
+    output_directory: StringProperty(
+        name="Output Directory",
+        subtype='DIR_PATH',
+        default="//render_output/"
+    )
+
+    file_format: EnumProperty(
+        name="Format",
+        items=[
+            ('PNG', 'PNG', 'PNG format'),
+            ('JPEG', 'JPEG', 'JPEG format'),
+            ('OPEN_EXR', 'OpenEXR', 'OpenEXR format'),
+            ('TIFF', 'TIFF', 'TIFF format'),
+        ],
+        default='PNG'
+    )
+
+    frame_start: IntProperty(
+        name="Start Frame",
+        default=1
+    )
+
+    frame_end: IntProperty(
+        name="End Frame",
+        default=250
+    )
+
+    workers: IntProperty(
+        name="Workers",
+        description="Background Blender processes rendering at once",
+        default=2,
+        min=1,
+        max=64
+    )
+
+    distribution: EnumProperty(
+        name="Distribution",
+        items=[
+            ('CHUNKED', 'Chunked', 'Each worker renders a contiguous range of frames'),
+            ('STRIDED', 'Strided', 'Workers take every Nth frame, evening out uneven shots'),
+        ],
+        default='CHUNKED'
+    )
+
+    max_retries: IntProperty(
+        name="Retries",
+        description="Extra attempts for frames a worker failed to save",
+        default=2,
+        min=0,
+        max=10
+    )
+
+    encode_video: BoolProperty(
+        name="Encode Video",
+        description="Queue a background FFmpeg encode once every frame is rendered",
+        default=False
+    )
+
+    codec: EnumProperty(
+        name="Codec",
+        items=[
+            ('H264', 'H.264', 'H.264 codec'),
+            ('H265', 'H.265', 'H.265 codec'),
+            ('PRORES', 'ProRes', 'ProRes codec'),
+            ('DNXHD', 'DNxHD', 'DNxHD codec'),
+        ],
+        default='H264'
+    )
+
+    def execute(self, context):
+        from ..utils.render_farm import RenderFarm
+
+        if HGFX_OT_RenderFarmExport._active_farm is not None:
+            self.report({'ERROR'}, "A farm render is already running")
+            return {'CANCELLED'}
+
+        scene = context.scene
+
+        if self.frame_start == 1 and self.frame_end == 250:
+            self.frame_start = scene.frame_start
+            self.frame_end = scene.frame_end
+
+        output_dir = Path(bpy.path.abspath(self.output_directory))
+        snapshot_dir = output_dir / ".hgfx_farm"
+        snapshot_dir.mkdir(parents=True, exist_ok=True)
+
+        # Workers render a copy, so the session can keep changing meanwhile
+        name = Path(bpy.data.filepath).stem if bpy.data.filepath else "untitled"
+        self._snapshot = snapshot_dir / f"{name}_farm.blend"
+        try:
+            bpy.ops.wm.save_as_mainfile(filepath=str(self._snapshot), copy=True)
+        except RuntimeError as e:
+            self.report({'ERROR'}, f"Could not save the farm snapshot: {e}")
+            return {'CANCELLED'}
+
+        self._farm = RenderFarm(
+            bpy.app.binary_path, self._snapshot, output_dir,
+            range(self.frame_start, self.frame_end + 1),
+            workers=self.workers,
+            distribution=self.distribution,
+            file_format=self.file_format,
+            max_retries=self.max_retries,
+            scene=scene.name
+        )
+        self._farm.start()
+        self._framerate = scene.render.fps
+        HGFX_OT_RenderFarmExport._active_farm = self._farm
+
+        self._timer = context.window_manager.event_timer_add(1.0, window=context.window)
+        context.window_manager.modal_handler_add(self)
+        self.report({'INFO'}, f"Rendering {len(self._farm.frames)} frames with {self.workers} workers")
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        farm = self._farm
+
+        if event.type != 'TIMER' and not farm.finished:
+            return {'PASS_THROUGH'}
+
+        if farm.poll():
+            context.workspace.status_text_set(
+                f"HyperGradeFX farm: {farm.fraction * 100:.0f}% of {len(farm.frames)} frames, "
+                f"{len(farm.active)} workers, {farm.elapsed:.0f}s"
+            )
+            return {'PASS_THROUGH'}
+
+        self.finish(context)
+        return {'FINISHED'}
+
+    def finish(self, context):
+        farm = self._farm
+        context.window_manager.event_timer_remove(self._timer)
+        context.workspace.status_text_set(None)
+        HGFX_OT_RenderFarmExport._active_farm = None
+        _redraw_export_panels(context)
+
+        try:
+            self._snapshot.unlink()
+        except OSError:
+            pass
+
+        if farm.state == 'CANCELLED':
+            self.report({'WARNING'}, f"Farm render cancelled after {len(farm.done_frames)} frames")
+        elif farm.failed_frames:
+            print(f"HyperGradeFX: Last worker output:\n{farm.last_error}")
+            self.report({'ERROR'}, f"{len(farm.failed_frames)} frame(s) failed after retries, "
+                                   f"e.g. {farm.failed_frames[:5]}")
+        else:
+            self.report({'INFO'}, f"Farm rendered {len(farm.frames)} frames in {farm.elapsed:.0f}s")
+            if self.encode_video:
+                self.queue_encode(context)
+
+    def queue_encode(self, context):
+        """Encode the rendered frames on the background job queue"""
+        farm = self._farm
+        ffmpeg = get_ffmpeg_handler()
+        if not ffmpeg.check_ffmpeg_available():
+            self.report({'WARNING'}, "FFmpeg not found, frames were not encoded")
+            return
+
+        ext = '.mp4' if self.codec in ('H264', 'H265') else '.mov'
+        input_pattern = str(farm.output_dir / f"frame_%04d{farm.frame_path(0).suffix}")
+        ffmpeg.encode_image_sequence_async(
+            input_pattern,
+            str(farm.output_dir / f"farm_render{ext}"),
+            frame_count=len(farm.frames),
+            codec=self.codec,
+            framerate=self._framerate,
+            start_number=farm.frames[0]
+        )
+        bpy.ops.hgfx.ffmpeg_job_monitor('INVOKE_DEFAULT')
+
+    def cancel(self, context):
+        self._farm.cancel()
+        self.finish(context)
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+
+class HGFX_OT_CancelRenderFarm(Operator):
+    """Stop the running farm render; frames already written are kept"""
+    bl_idname = "hgfx.cancel_render_farm"
+    bl_label = "Cancel Farm Render"
+    bl_options = {'REGISTER'}
+
+    @classmethod
+    def poll(cls, context):
+        return HGFX_OT_RenderFarmExport._active_farm is not None
+
+    def execute(self, context):
+        farm = HGFX_OT_RenderFarmExport._active_farm
+        farm.cancel()
+        # The render operator's next timer event reports and cleans up
+        self.report({'INFO'}, f"Farm render cancelled after {len(farm.done_frames)} frames")
+        return {'FINISHED'}
+
+
+class HGFX_OT_FFmpegJobMonitor(Operator):
+    """Track background FFmpeg encodes"""
+    bl_idname = "hgfx.ffmpeg_job_monitor"
+    bl_label = "FFmpeg Job Monitor"
+    bl_options = {'INTERNAL'}
+
+    _running = False
+
+    def invoke(self, context, event):
+        # One monitor is enough for the whole queue
+        if HGFX_OT_FFmpegJobMonitor._running:
+            return {'CANCELLED'}
+
+        HGFX_OT_FFmpegJobMonitor._running = True
+        self._timer = context.window_manager.event_timer_add(0.5, window=context.window)
+        context.window_manager.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        active = get_job_queue().update()
+        _redraw_export_panels(context)
+
+        if not active:
+            context.window_manager.event_timer_remove(self._timer)
+            HGFX_OT_FFmpegJobMonitor._running = False
+            return {'FINISHED'}
+
+        return {'PASS_THROUGH'}
+
+    def cancel(self, context):
+        context.window_manager.event_timer_remove(self._timer)
+        HGFX_OT_FFmpegJobMonitor._running = False
+
+
+class HGFX_OT_CancelFFmpegJobs(Operator):
+    """Cancel queued and running background encodes"""
+    bl_idname = "hgfx.cancel_ffmpeg_jobs"
+    bl_label = "Cancel Encodes"
+    bl_options = {'REGISTER'}
+
+    def execute(self, context):
+        queue = get_job_queue()
+        count = len(queue.active_jobs())
+        queue.cancel_all()
+        self.report({'INFO'}, f"Cancelled {count} encode(s)")
+        return {'FINISHED'}
+
+
+class HGFX_OT_ClearFFmpegJobs(Operator):
+    """Remove finished encodes from the list"""
+    bl_idname = "hgfx.clear_ffmpeg_jobs"
+    bl_label = "Clear Finished"
+    bl_options = {'REGISTER'}
+
+    def execute(self, context):
+        get_job_queue().clear_finished()
+        return {'FINISHED'}
+
+
+def _redraw_export_panels(context):
+    """Redraw node editors so job progress stays current"""
+    screen = context.window.screen if context.window else None
+    if screen is None:
+        return
+    for area in screen.areas:
+        if area.type == 'NODE_EDITOR':
+            area.tag_redraw()
+
+
 class HGFX_OT_QuickExport(Operator):
     """Quick export current frame"""
     bl_idname = "hgfx.quick_export"
@@ -283,12 +1392,289 @@ class HGFX_OT_ExportCompStack(Operator):
         return {'RUNNING_MODAL'}
 
 
+class HGFX_OT_RegradeFrames(Operator):
+    """Apply the color grade stack or a blueprint to rendered frames in parallel"""
+    bl_idname = "hgfx.regrade_frames"
+    bl_label = "Regrade Frames"
+    bl_options = {'REGISTER'}
+
+    input_directory: StringProperty(
+        name="Input Directory",
+        subtype='DIR_PATH',
+        default="//render_output/"
+    )
+
+    output_directory: StringProperty(
+        name="Output Directory",
+        subtype='DIR_PATH',
+        default="//regraded/"
+    )
+
+    grade_source: EnumProperty(
+        name="Grade",
+        items=[
+            ('GRADE_STACK', 'Color Grade Stack', 'Use the grade stack in the compositor'),
+            ('BLUEPRINT', 'Active Blueprint', 'Use the selected node blueprint'),
+        ],
+        default='GRADE_STACK'
+    )
+
+    workers: IntProperty(
+        name="Workers",
+        description="Worker processes (0 = one per CPU)",
+        default=0,
+        min=0,
+        max=256
+    )
+
+    use_lut: BoolProperty(
+        name="Bake LUT",
+        description="Bake pointwise grades into a 3D LUT before regrading. Faster; pixels "
+                    "outside the LUT (scene linear values above 1.0) are still graded directly",
+        default=False
+    )
+
+    def execute(self, context):
+        from ..utils.grade_evaluator import GradeStackEvaluator
+        from ..utils.parallel_grading import FrameGradingEngine
+        from ..utils.sequence_io import list_sequence
+
+        if not has_file_io():
+            self.report({'ERROR'}, "OpenImageIO Python module is required for regrading frames")
+            return {'CANCELLED'}
+
+        scene = context.scene
+        input_dir = Path(bpy.path.abspath(self.input_directory))
+        output_dir = Path(bpy.path.abspath(self.output_directory))
+
+        input_paths = list_sequence(input_dir) if input_dir.is_dir() else []
+        if not input_paths:
+            self.report({'ERROR'}, f"No frames found in {input_dir}")
+            return {'CANCELLED'}
+
+        if self.grade_source == 'GRADE_STACK':
+            if not scene.node_tree:
+                self.report({'ERROR'}, "No compositor node tree")
+                return {'CANCELLED'}
+            grade = GradeStackEvaluator.from_node_tree(scene.node_tree)
+        else:
+            index = scene.hgfx_blueprint_index
+            if not 0 <= index < len(scene.hgfx_blueprints):
+                self.report({'ERROR'}, "No blueprint selected")
+                return {'CANCELLED'}
+            grade = scene.hgfx_blueprints[index].node_data
+
+        output_dir.mkdir(parents=True, exist_ok=True)
+        output_paths = [output_dir / p.name for p in input_paths]
+
+        wm = context.window_manager
+        wm.progress_begin(0, len(input_paths))
+
+        try:
+            engine = FrameGradingEngine(grade, workers=self.workers or None, use_lut=self.use_lut)
+            engine.grade_files(input_paths, output_paths,
+                               progress=lambda done, total: wm.progress_update(done))
+        except Exception as e:
+            self.report({'ERROR'}, f"Regrade failed: {e}")
+            return {'CANCELLED'}
+        finally:
+            wm.progress_end()
+
+        stats = engine.stats
+        self.report({'INFO'}, f"Regraded {stats['frames']} frames with {engine.workers} workers "
+                              f"({stats['fps']:.1f} fps)")
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+
+class HGFX_OT_CreateProxies(Operator):
+    """Create proxy ladders for every video in a directory (one decode per clip)"""
+    bl_idname = "hgfx.create_proxies"
+    bl_label = "Create Proxies"
+    bl_options = {'REGISTER'}
+
+    source_directory: StringProperty(
+        name="Source Directory",
+        subtype='DIR_PATH',
+        default="//"
+    )
+
+    proxy_360p: BoolProperty(name="360p", default=True)
+    proxy_480p: BoolProperty(name="480p", default=False)
+    proxy_720p: BoolProperty(name="720p", default=True)
+    proxy_1080p: BoolProperty(name="1080p", default=False)
+
+    def execute(self, context):
+        ffmpeg = get_ffmpeg_handler()
+
+        if not ffmpeg.check_ffmpeg_available():
+            self.report({'ERROR'}, "FFmpeg not found. Please set FFmpeg path in preferences")
+            return {'CANCELLED'}
+
+        resolutions = [res for res in ('360p', '480p', '720p', '1080p')
+                       if getattr(self, f"proxy_{res}")]
+        if not resolutions:
+            self.report({'ERROR'}, "No proxy resolution selected")
+            return {'CANCELLED'}
+
+        source_dir = Path(bpy.path.abspath(self.source_directory))
+        video_extensions = {'.mov', '.mp4', '.mxf', '.mkv', '.avi'}
+        clips = sorted(p for p in source_dir.iterdir()
+                       if p.is_file() and p.suffix.lower() in video_extensions) if source_dir.is_dir() else []
+
+        if not clips:
+            self.report({'ERROR'}, f"No videos found in {source_dir}")
+            return {'CANCELLED'}
+
+        wm = context.window_manager
+        wm.progress_begin(0, len(clips))
+        failed = []
+
+        try:
+            for index, clip in enumerate(clips):
+                if ffmpeg.create_proxy_ladder(clip, resolutions=resolutions) is None:
+                    failed.append(clip.name)
+                wm.progress_update(index + 1)
+        finally:
+            wm.progress_end()
+
+        if failed:
+            self.report({'WARNING'}, f"Proxy creation failed for: {', '.join(failed)}")
+        else:
+            self.report({'INFO'}, f"Proxies ready for {len(clips)} clips")
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+
+class HGFX_OT_BenchmarkEncoders(Operator):
+    """Measure encode speed, CPU time, file size and memory for each video codec"""
+    bl_idname = "hgfx.benchmark_encoders"
+    bl_label = "Benchmark Encoders"
+    bl_options = {'REGISTER'}
+
+    output_path: StringProperty(
+        name="Results File",
+        subtype='FILE_PATH',
+        default="//encoder_benchmark.json"
+    )
+
+    baseline_path: StringProperty(
+        name="Compare With",
+        description="Earlier results file to compare against (optional)",
+        subtype='FILE_PATH',
+        default=""
+    )
+
+    resolution: EnumProperty(
+        name="Resolution",
+        items=[
+            ('1280x720', '720p', '1280x720'),
+            ('1920x1080', '1080p', '1920x1080'),
+            ('3840x2160', 'UHD', '3840x2160'),
+        ],
+        default='1920x1080'
+    )
+
+    frame_count: IntProperty(
+        name="Frames",
+        description="Frames encoded per codec, quality and pattern",
+        default=48,
+        min=8,
+        max=1000
+    )
+
+    all_qualities: BoolProperty(
+        name="All Qualities",
+        description="Benchmark high, medium and low quality (otherwise high only)",
+        default=True
+    )
+
+    high_bit_depth: BoolProperty(
+        name="10-bit",
+        description="Benchmark the 10-bit export path",
+        default=False
+    )
+
+    def execute(self, context):
+        from ..utils.encoder_benchmark import (
+            run_benchmark, save_results, load_results, compare_runs, format_comparison
+        )
+
+        ffmpeg = get_ffmpeg_handler()
+        if not ffmpeg.check_ffmpeg_available():
+            self.report({'ERROR'}, "FFmpeg not found. Please set FFmpeg path in preferences")
+            return {'CANCELLED'}
+
+        baseline = None
+        if self.baseline_path:
+            try:
+                baseline = load_results(bpy.path.abspath(self.baseline_path))
+            except (OSError, ValueError) as e:
+                self.report({'ERROR'}, f"Could not read baseline results: {e}")
+                return {'CANCELLED'}
+
+        width, height = (int(v) for v in self.resolution.split('x'))
+        qualities = ('high', 'medium', 'low') if self.all_qualities else ('high',)
+
+        wm = context.window_manager
+        wm.progress_begin(0, 1)
+
+        def progress(done, total, label):
+            wm.progress_update(done / max(1, total))
+            print(f"HyperGradeFX: Benchmark {done}/{total} {label}")
+
+        try:
+            run = run_benchmark(ffmpeg, qualities=qualities, resolutions=((width, height),),
+                                frame_count=self.frame_count,
+                                high_bit_depth=self.high_bit_depth, progress=progress)
+        except RuntimeError as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+        finally:
+            wm.progress_end()
+
+        output_path = save_results(run, bpy.path.abspath(self.output_path))
+
+        if baseline is not None:
+            print(format_comparison(compare_runs(baseline, run)))
+
+        measured = [r for r in run['results'] if r.get('ok')]
+        if not measured:
+            self.report({'WARNING'}, f"No codec could be benchmarked, see {output_path}")
+            return {'FINISHED'}
+
+        fastest = max(measured, key=lambda r: r['fps'])
+        self.report({'INFO'}, f"Benchmarked {len(measured)} encodes, fastest "
+                              f"{fastest['codec']} {fastest['quality']} at {fastest['fps']:.1f} fps. "
+                              f"Results: {output_path}")
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+
 class HGFX_OT_CreateContactSheet(Operator):
     """Create contact sheet of rendered frames"""
     bl_idname = "hgfx.create_contact_sheet"
     bl_label = "Create Contact Sheet"
     bl_options = {'REGISTER'}
 
+    source_directory: StringProperty(
+        name="Frames Directory",
+        subtype='DIR_PATH',
+        default="//render_output/"
+    )
+
+    output_path: StringProperty(
+        name="Output File",
+        subtype='FILE_PATH',
+        default="//contact_sheet.png"
+    )
+
     columns: IntProperty(
         name="Columns",
         default=4,
@@ -303,9 +1689,59 @@ class HGFX_OT_CreateContactSheet(Operator):
         max=10
     )
 
+    all_frames: BoolProperty(
+        name="All Frames",
+        description="Add rows until every frame fits (otherwise frames are sampled evenly)",
+        default=False
+    )
+
+    cell_width: IntProperty(
+        name="Cell Width",
+        description="Width of each frame on the sheet in pixels",
+        default=320,
+        min=32,
+        max=2048
+    )
+
+    use_cache: BoolProperty(
+        name="Cache Thumbnails",
+        description="Reuse downscaled frames from earlier sheets when the files are unchanged",
+        default=True
+    )
+
     def execute(self, context):
-        self.report({'INFO'}, "Contact sheet feature coming soon")
-        # This would require PIL/Pillow or similar
+        from ..utils.contact_sheet import write_contact_sheet
+        from ..utils.sequence_io import list_sequence
+
+        if not has_file_io():
+            self.report({'ERROR'}, "Contact sheets need the OpenImageIO Python module")
+            return {'CANCELLED'}
+
+        source_dir = Path(bpy.path.abspath(self.source_directory))
+        paths = list_sequence(source_dir) if source_dir.is_dir() else []
+        if not paths:
+            self.report({'ERROR'}, f"No frames found in {source_dir}")
+            return {'CANCELLED'}
+
+        wm = context.window_manager
+        wm.progress_begin(0, 1)
+
+        try:
+            output_path = write_contact_sheet(
+                paths, bpy.path.abspath(self.output_path),
+                columns=self.columns,
+                rows=None if self.all_frames else self.rows,
+                cell_width=self.cell_width,
+                use_cache=self.use_cache,
+                progress=lambda done, total: wm.progress_update(done / total)
+            )
+        except (RuntimeError, ValueError, OSError) as e:
+            self.report({'ERROR'}, f"Contact sheet failed: {e}")
+            return {'CANCELLED'}
+        finally:
+            wm.progress_end()
+
+        self.report({'INFO'}, f"Contact sheet saved: {output_path}")
         return {'FINISHED'}
 
     def invoke(self, context, event):
@@ -314,10 +1750,22 @@ class HGFX_OT_CreateContactSheet(Operator):
 
 # Registration
 classes = (
+    HGFXExportTarget,
+    HGFXExportTargetList,
+    HGFX_OT_AddExportTarget,
+    HGFX_OT_RemoveExportTarget,
     HGFX_OT_BatchExportFrames,
     HGFX_OT_ExportToVideo,
+    HGFX_OT_RenderFarmExport,
+    HGFX_OT_CancelRenderFarm,
+    HGFX_OT_FFmpegJobMonitor,
+    HGFX_OT_CancelFFmpegJobs,
+    HGFX_OT_ClearFFmpegJobs,
     HGFX_OT_QuickExport,
     HGFX_OT_ExportCompStack,
+    HGFX_OT_RegradeFrames,
+    HGFX_OT_CreateProxies,
+    HGFX_OT_BenchmarkEncoders,
     HGFX_OT_CreateContactSheet,
 )
 
@@ -326,7 +1774,13 @@ def register():
     for cls in classes:
         bpy.utils.register_class(cls)
 
+    bpy.types.Scene.hgfx_export_targets = bpy.props.PointerProperty(
+        type=HGFXExportTargetList
+    )
+
 
 def unregister():
+    del bpy.types.Scene.hgfx_export_targets
+
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
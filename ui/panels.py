@@ -5,6 +5,16 @@ Main UI panels for the compositor
 
 import bpy
 from bpy.types import Panel
+from ..utils.ffmpeg_jobs import get_job_queue
+
+
+# Icons for background encodes that are not running
+_JOB_ICONS = {
+    'QUEUED': 'TIME',
+    'DONE': 'CHECKMARK',
+    'FAILED': 'ERROR',
+    'CANCELLED': 'CANCEL',
+}
 
 
 class HGFX_PT_MainPanel(Panel):
@@ -272,6 +282,57 @@ class HGFX_PT_ExportPanel(Panel):
         col = box.column(align=True)
         col.operator("hgfx.batch_export_frames", icon='IMAGE_DATA')
         col.operator("hgfx.export_to_video", icon='FILE_MOVIE')
+        row = col.row(align=True)
+        row.operator("hgfx.render_farm_export", icon='SYSTEM')
+        row.operator("hgfx.cancel_render_farm", icon='CANCEL', text="")
+        col.operator("hgfx.regrade_frames", icon='COLOR')
+
+        # Export targets (render once, write many)
+        target_list = context.scene.hgfx_export_targets
+        box.label(text="Export Targets", icon='OUTLINER_OB_IMAGE')
+        row = box.row()
+        row.template_list(
+            "UI_UL_list", "hgfx_export_targets",
+            target_list, "targets",
+            target_list, "active_target_index",
+            rows=2
+        )
+        col = row.column(align=True)
+        col.operator("hgfx.add_export_target", icon='ADD', text="")
+        col.operator("hgfx.remove_export_target", icon='REMOVE', text="")
+
+        if 0 <= target_list.active_target_index < len(target_list.targets):
+            target = target_list.targets[target_list.active_target_index]
+            col = box.column(align=True)
+            col.prop(target, "name")
+            col.prop(target, "enabled")
+            col.prop(target, "file_format")
+            if target.file_format == 'JPEG':
+                col.prop(target, "quality")
+            else:
+                col.prop(target, "color_depth")
+            col.prop(target, "scale")
+
+        # Background encodes
+        jobs = get_job_queue().jobs
+        if jobs:
+            layout.separator()
+            box = layout.box()
+            box.label(text="Encoding Jobs", icon='FILE_MOVIE')
+            col = box.column(align=True)
+            for job in jobs:
+                row = col.row()
+                if job.state == 'RUNNING':
+                    fraction = job.fraction
+                    progress = f"{fraction * 100:.0f}%" if fraction is not None else f"frame {job.frame}"
+                    row.label(text=f"{job.label}: {progress} ({job.fps:.0f} fps, {job.speed:.2f}x)",
+                              icon='RENDER_ANIMATION')
+                else:
+                    row.label(text=f"{job.label}: {job.state.title()}", icon=_JOB_ICONS.get(job.state, 'DOT'))
+
+            row = box.row(align=True)
+            row.operator("hgfx.cancel_ffmpeg_jobs", icon='CANCEL')
+            row.operator("hgfx.clear_ffmpeg_jobs", icon='TRASH')
 
         # Utilities
         layout.separator()
@@ -280,6 +341,8 @@ class HGFX_PT_ExportPanel(Panel):
         col = box.column(align=True)
         col.operator("hgfx.export_comp_stack", icon='NODE_COMPOSITING')
         col.operator("hgfx.create_contact_sheet", icon='IMGDISPLAY')
+        col.operator("hgfx.create_proxies", icon='SEQUENCE')
+        col.operator("hgfx.benchmark_encoders", icon='TIME')
 
 
 class HGFX_PT_SafeAreaPanel(Panel):
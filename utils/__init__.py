@@ -4,8 +4,23 @@ Helper functions and utilities
 """
 
 from . import constants
+from . import buffer_pool
+from . import media_probe
 from . import ffmpeg_handler
+from . import ffmpeg_jobs
+from . import render_farm
+from . import encoder_benchmark
 from . import openimageio_handler
+from . import sequence_io
+from . import export_manifest
+from . import frame_dedup
+from . import color_ops
+from . import grade_evaluator
+from . import blueprint_interpreter
+from . import lut
+from . import lut_cache
+from . import contact_sheet
+from . import parallel_grading
 from . import helpers
 from . import security
 from . import error_handler
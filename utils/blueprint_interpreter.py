@@ -0,0 +1,389 @@
+"""
+Blueprint Interpreter for HyperGradeFX
+Executes blueprint node_data graphs directly on NumPy images
+"""
+
+import json
+from pathlib import Path
+
+import numpy as np
+
+from . import color_ops
+
+
+GROUP_INPUT = 'GROUP_INPUT'
+GROUP_OUTPUT = 'GROUP_OUTPUT'
+
+WHITE = (1.0, 1.0, 1.0, 1.0)
+
+
+class UnsupportedNodeError(ValueError):
+    """Raised when a blueprint uses node types the interpreter cannot run"""
+
+    def __init__(self, nodes):
+        self.nodes = nodes
+        names = ", ".join(f"{name} ({node_type})" for name, node_type in nodes)
+        super().__init__(f"Unsupported node types in blueprint: {names}")
+
+
+def _prop(node, name, default):
+    """Get a node setting from its 'inputs' or 'properties' entries"""
+    for section in ('inputs', 'properties'):
+        values = node.get(section) or {}
+        if name in values:
+            return values[name]
+    return default
+
+
+def _eval_color_correction(node, inputs):
+    params = {key: _prop(node, key, default)
+              for key, default in color_ops.color_correction_defaults().items()}
+    return [color_ops.color_correction(inputs['Image'], params, inputs['Mask'])]
+
+
+def _eval_hue_sat(node, inputs):
+    # Legacy blueprints store the values as node properties
+    hue = _prop(node, 'color_hue', inputs['Hue'])
+    saturation = _prop(node, 'color_saturation', inputs['Saturation'])
+    value = _prop(node, 'color_value', inputs['Value'])
+    return [color_ops.hue_sat_value(inputs['Image'], hue, saturation, value, inputs['Fac'])]
+
+
+def _eval_mix_rgb(node, inputs):
+    return [color_ops.mix_rgb(inputs['Image'], inputs['Image_001'], inputs['Fac'],
+                              _prop(node, 'blend_type', 'MIX'),
+                              _prop(node, 'use_clamp', False))]
+
+
+def _eval_bright_contrast(node, inputs):
+    return [color_ops.bright_contrast(inputs['Image'], inputs['Bright'], inputs['Contrast'])]
+
+
+def _eval_exposure(node, inputs):
+    return [color_ops.exposure(inputs['Image'], inputs['Exposure'])]
+
+
+def _eval_math(node, inputs):
+    return [color_ops.math_op(inputs['Value'], inputs['Value_001'],
+                              _prop(node, 'operation', 'ADD'),
+                              _prop(node, 'use_clamp', False))]
+
+
+def _eval_color_ramp(node, inputs):
+    ramp = _prop(node, 'color_ramp', {})
+    elements = [(e['position'], e['color']) for e in ramp.get('elements', [])]
+    if not elements:
+        elements = [(0.0, (0.0, 0.0, 0.0, 1.0)), (1.0, WHITE)]
+    colors = color_ops.color_ramp(inputs['Fac'], elements, ramp.get('interpolation', 'LINEAR'))
+    return [colors, colors[..., 3]]
+
+
+def _eval_curve_rgb(node, inputs):
+    curves = _prop(node, 'curves', {})
+    return [color_ops.rgb_curves(inputs['Image'], curves.get('combined'),
+                                 curves.get('red'), curves.get('green'), curves.get('blue'),
+                                 inputs['Black Level'], inputs['White Level'], inputs['Fac'])]
+
+
+def _eval_color_balance(node, inputs):
+    method = _prop(node, 'correction_method', 'LIFT_GAMMA_GAIN')
+    if method != 'LIFT_GAMMA_GAIN':
+        raise UnsupportedNodeError([(node['name'], f"{node['type']} {method}")])
+    return [color_ops.color_balance(inputs['Image'],
+                                    _prop(node, 'lift', (1.0, 1.0, 1.0)),
+                                    _prop(node, 'gamma', (1.0, 1.0, 1.0)),
+                                    _prop(node, 'gain', (1.0, 1.0, 1.0)),
+                                    inputs['Fac'])]
+
+
+# Supported node types: input sockets (name, kind, default), output sockets,
+# and the evaluator. Socket order matches Blender's compositor nodes so the
+# socket indices recorded by HGFX_OT_SaveBlueprint resolve correctly.
+NODE_TYPES = {
+    'CompositorNodeColorCorrection': {
+        'inputs': [('Image', 'COLOR', WHITE), ('Mask', 'VALUE', 1.0)],
+        'outputs': ['Image'],
+        'evaluate': _eval_color_correction,
+    },
+    'CompositorNodeHueSat': {
+        'inputs': [('Image', 'COLOR', WHITE), ('Hue', 'VALUE', 0.5),
+                   ('Saturation', 'VALUE', 1.0), ('Value', 'VALUE', 1.0),
+                   ('Fac', 'VALUE', 1.0)],
+        'outputs': ['Image'],
+        'evaluate': _eval_hue_sat,
+    },
+    'CompositorNodeMixRGB': {
+        'inputs': [('Fac', 'VALUE', 1.0), ('Image', 'COLOR', WHITE),
+                   ('Image_001', 'COLOR', WHITE)],
+        'outputs': ['Image'],
+        'evaluate': _eval_mix_rgb,
+    },
+    'CompositorNodeBrightContrast': {
+        'inputs': [('Image', 'COLOR', WHITE), ('Bright', 'VALUE', 0.0),
+                   ('Contrast', 'VALUE', 0.0)],
+        'outputs': ['Image'],
+        'evaluate': _eval_bright_contrast,
+    },
+    'CompositorNodeExposure': {
+        'inputs': [('Image', 'COLOR', WHITE), ('Exposure', 'VALUE', 0.0)],
+        'outputs': ['Image'],
+        'evaluate': _eval_exposure,
+    },
+    'CompositorNodeMath': {
+        'inputs': [('Value', 'VALUE', 0.5), ('Value_001', 'VALUE', 0.5),
+                   ('Value_002', 'VALUE', 0.5)],
+        'outputs': ['Value'],
+        'evaluate': _eval_math,
+    },
+    'CompositorNodeValToRGB': {
+        'inputs': [('Fac', 'VALUE', 0.5)],
+        'outputs': ['Image', 'Alpha'],
+        'evaluate': _eval_color_ramp,
+    },
+    'CompositorNodeCurveRGB': {
+        'inputs': [('Fac', 'VALUE', 1.0), ('Image', 'COLOR', WHITE),
+                   ('Black Level', 'COLOR', (0.0, 0.0, 0.0, 1.0)),
+                   ('White Level', 'COLOR', WHITE)],
+        'outputs': ['Image'],
+        'evaluate': _eval_curve_rgb,
+    },
+    'CompositorNodeColorBalance': {
+        'inputs': [('Fac', 'VALUE', 1.0), ('Image', 'COLOR', WHITE)],
+        'outputs': ['Image'],
+        'evaluate': _eval_color_balance,
+    },
+}
+
+
+def _is_image(value, shape):
+    """Check whether a socket value is a per-pixel color array"""
+    return isinstance(value, np.ndarray) and value.ndim == len(shape)
+
+
+def _to_color(value, shape):
+    """Convert a socket value to an RGBA image or constant color"""
+    if _is_image(value, shape):
+        return value
+    value = np.asarray(value, dtype=np.float32)
+    if value.ndim == 0 or value.ndim == len(shape) - 1:
+        # Scalar or scalar field to gray
+        return np.stack([value, value, value, np.ones_like(value)], axis=-1)
+    return value
+
+
+def _to_value(value, shape):
+    """Convert a socket value to a scalar or scalar field"""
+    if _is_image(value, shape):
+        return color_ops.luminance(value)
+    if isinstance(value, (tuple, list)):
+        return float(color_ops.luminance(np.asarray(value, dtype=np.float32)))
+    return value
+
+
+class BlueprintInterpreter:
+    """
+    Evaluate a blueprint's node_data graph on NumPy images
+
+    Nodes are run in topological order; only nodes feeding a group output
+    are evaluated. Unsupported node types raise UnsupportedNodeError
+    listing every offending node.
+
+    Blueprints written against the old Hue Saturation Value layout (Fac,
+    Image) link their image into socket 1. When a node's Image socket is
+    unlinked and an image arrives on one of its value sockets, that image
+    is used as the node's Image input.
+
+    Usage:
+        interpreter = BlueprintInterpreter.from_preset_file("grunge.json")
+        graded = interpreter.evaluate(pixels)
+    """
+
+    def __init__(self, node_data):
+        if isinstance(node_data, str):
+            node_data = json.loads(node_data) if node_data else {}
+
+        self.node_data = node_data
+        self.nodes = {node['name']: node for node in node_data.get('nodes', [])}
+        self.links = node_data.get('links', [])
+        self.order = self._sort_nodes()
+
+    @classmethod
+    def from_blueprint(cls, blueprint):
+        """Create an interpreter from an HGFXNodeBlueprint"""
+        return cls(blueprint.node_data)
+
+    @classmethod
+    def from_preset_file(cls, filepath):
+        """Create an interpreter from a preset JSON file"""
+        with open(Path(filepath), 'r', encoding='utf-8') as f:
+            preset = json.load(f)
+        return cls(preset.get('node_data', {}))
+
+    @staticmethod
+    def is_supported(node_type):
+        """Check whether a node type can be interpreted"""
+        return node_type in NODE_TYPES
+
+    def _sort_nodes(self):
+        """Topologically sort the nodes that feed the group outputs"""
+        upstream = {name: set() for name in self.nodes}
+        for link in self.links:
+            src, dst = link['from_node'], link['to_node']
+            if src != GROUP_INPUT and src not in self.nodes:
+                raise ValueError(f"Link from unknown node: {src}")
+            if dst != GROUP_OUTPUT and dst not in self.nodes:
+                raise ValueError(f"Link to unknown node: {dst}")
+            if dst in upstream and src in self.nodes:
+                upstream[dst].add(src)
+
+        # Nodes reachable backwards from the group output
+        needed = set()
+        stack = [link['from_node'] for link in self.links
+                 if link['to_node'] == GROUP_OUTPUT and link['from_node'] in self.nodes]
+        while stack:
+            name = stack.pop()
+            if name not in needed:
+                needed.add(name)
+                stack.extend(upstream[name])
+
+        # Kahn's algorithm, keeping the blueprint's node order for ties
+        remaining = {name: len(upstream[name]) for name in needed}
+        ready = [name for name in self.nodes if name in needed and remaining[name] == 0]
+        order = []
+        while ready:
+            name = ready.pop(0)
+            order.append(name)
+            for other in self.nodes:
+                if other in remaining and name in upstream[other]:
+                    remaining[other] -= 1
+                    if remaining[other] == 0:
+                        ready.append(other)
+
+        if len(order) != len(needed):
+            raise ValueError("Blueprint graph contains a cycle")
+
+        return order
+
+    def find_unsupported_nodes(self):
+        """
+        List nodes in the evaluated graph that cannot be interpreted
+
+        Returns:
+            list: (name, type) tuples
+        """
+        return [(name, self.nodes[name].get('type', '?')) for name in self.order
+                if not self.is_supported(self.nodes[name].get('type'))]
+
+    def check_supported(self):
+        """Raise UnsupportedNodeError if any evaluated node is unsupported"""
+        unsupported = self.find_unsupported_nodes()
+        if unsupported:
+            raise UnsupportedNodeError(unsupported)
+
+    def _resolve_socket(self, sockets, socket):
+        """Map a link's socket index or name to a socket position"""
+        if isinstance(socket, int):
+            return socket
+        for index, entry in enumerate(sockets):
+            name = entry[0] if isinstance(entry, tuple) else entry
+            if name == socket:
+                return index
+        raise ValueError(f"Unknown socket: {socket}")
+
+    def evaluate_outputs(self, *images):
+        """
+        Evaluate the graph
+
+        Args:
+            *images: Values for the group inputs, in order
+
+        Returns:
+            dict: Group output socket index -> value
+        """
+        self.check_supported()
+
+        if not images:
+            raise ValueError("At least one input image is required")
+
+        shape = np.shape(images[0])
+        values = {}
+        group_outputs = {}
+
+        def source_value(link):
+            src = link['from_node']
+            index = link.get('from_socket', 0)
+            if src == GROUP_INPUT:
+                if not isinstance(index, int):
+                    index = [i.get('name') for i in self.node_data.get('inputs', [])].index(index)
+                return np.asarray(images[index], dtype=np.float32)
+            spec = NODE_TYPES[self.nodes[src]['type']]
+            return values[src][self._resolve_socket(spec['outputs'], index)]
+
+        incoming = {}
+        for link in self.links:
+            incoming.setdefault(link['to_node'], []).append(link)
+
+        for name in self.order:
+            node = self.nodes[name]
+            spec = NODE_TYPES[node['type']]
+            sockets = spec['inputs']
+
+            linked = {}
+            for link in incoming.get(name, []):
+                linked[self._resolve_socket(sockets, link.get('to_socket', 0))] = source_value(link)
+
+            # Legacy layout: image linked into a value socket
+            image_index = next((i for i, s in enumerate(sockets) if s[0] == 'Image'), None)
+            if image_index is not None and image_index not in linked:
+                for index, value in list(linked.items()):
+                    if sockets[index][1] == 'VALUE' and _is_image(value, shape):
+                        linked[image_index] = linked.pop(index)
+                        break
+
+            inputs = {}
+            for index, (socket_name, kind, default) in enumerate(sockets):
+                value = linked.get(index, _prop(node, socket_name, default))
+                if kind == 'COLOR':
+                    inputs[socket_name] = _to_color(value, shape)
+                else:
+                    inputs[socket_name] = _to_value(value, shape)
+
+            values[name] = spec['evaluate'](node, inputs)
+
+        for link in self.links:
+            if link['to_node'] == GROUP_OUTPUT:
+                group_outputs[link.get('to_socket', 0)] = source_value(link)
+
+        return group_outputs
+
+    def evaluate(self, image):
+        """
+        Evaluate the graph for a single image input and output
+
+        Args:
+            image: Array of shape (..., 3) or (..., 4)
+
+        Returns:
+            numpy.ndarray: The first group output as a float32 image
+        """
+        outputs = self.evaluate_outputs(image)
+        if not outputs:
+            return np.array(image, dtype=np.float32, copy=True)
+
+        result = outputs.get(0, next(iter(outputs.values())))
+        result = np.broadcast_to(_to_color(result, np.shape(image)),
+                                 np.shape(image)[:-1] + (4,))
+        return np.array(result[..., :np.shape(image)[-1]], dtype=np.float32)
+
+    def apply_to_image(self, image, tile_size=512, max_memory_mb=64):
+        """
+        Apply the blueprint to a Blender image in place, tile by tile
+
+        Returns:
+            int: Number of tiles processed
+        """
+        from .openimageio_handler import ImageIOHandler
+
+        self.check_supported()
+        return ImageIOHandler.apply_tiled(image, self.evaluate, tile_size=tile_size,
+                                          max_memory_mb=max_memory_mb)
@@ -0,0 +1,179 @@
+"""
+Frame Buffer Pool for HyperGradeFX
+Reusable NumPy buffers for repeated per-frame pixel work
+"""
+
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+
+import numpy as np
+
+
+# Default pool cap (matches the add-on preference default)
+DEFAULT_POOL_SIZE_MB = 1024
+
+
+class FrameBufferPool:
+    """
+    Arena of reusable frame buffers keyed by (width, height, channels, dtype)
+
+    Buffers are borrowed with acquire() and handed back with release().
+    Released buffers are kept for the next request of the same shape until
+    the pool exceeds its byte cap, at which point the least recently used
+    shapes are dropped first. Each buffer may be released once per acquire;
+    releasing one the pool did not hand out raises ValueError. The pool is
+    safe to use from worker threads.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_POOL_SIZE_MB * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._free = OrderedDict()
+        self._pooled_bytes = 0
+        # id() of every buffer handed out by acquire() and not yet released
+        self._outstanding = set()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _make_key(width, height, channels, dtype):
+        return (int(width), int(height), int(channels), np.dtype(dtype).str)
+
+    def acquire(self, width, height, channels=4, dtype=np.float32):
+        """
+        Borrow a buffer of shape (height, width, channels)
+
+        The contents are undefined; callers are expected to overwrite them.
+
+        Returns:
+            numpy.ndarray: Buffer owned by the caller until released
+        """
+        key = self._make_key(width, height, channels, dtype)
+
+        with self._lock:
+            buffers = self._free.get(key)
+            if buffers:
+                buffer = buffers.pop()
+                self._pooled_bytes -= buffer.nbytes
+                if not buffers:
+                    del self._free[key]
+                self.hits += 1
+                self._outstanding.add(id(buffer))
+                return buffer
+            self.misses += 1
+
+        buffer = np.empty((key[1], key[0], key[2]), dtype=np.dtype(key[3]))
+        with self._lock:
+            self._outstanding.add(id(buffer))
+        return buffer
+
+    def release(self, buffer):
+        """
+        Return a buffer to the pool
+
+        Args:
+            buffer: Array previously obtained from acquire(), or a reshaped
+                    view of the whole of one
+
+        Raises:
+            ValueError: If the buffer is not currently borrowed from this pool,
+                        e.g. because it was already released
+        """
+        if buffer is None:
+            return
+
+        with self._lock:
+            if id(buffer) not in self._outstanding:
+                # Callers may hand back a full-size view such as out.reshape(shape)
+                base = buffer.base
+                if (not isinstance(base, np.ndarray) or id(base) not in self._outstanding
+                        or base.nbytes != buffer.nbytes):
+                    raise ValueError("Buffer was not acquired from this pool or was already released")
+                buffer = base
+            self._outstanding.discard(id(buffer))
+
+            if buffer.ndim != 3 or not buffer.flags['C_CONTIGUOUS']:
+                return
+
+            height, width, channels = buffer.shape
+            key = self._make_key(width, height, channels, buffer.dtype)
+
+            if buffer.nbytes > self.max_bytes:
+                self.evictions += 1
+                return
+
+            self._free.setdefault(key, []).append(buffer)
+            self._free.move_to_end(key)
+            self._pooled_bytes += buffer.nbytes
+            self._evict_locked()
+
+    @contextmanager
+    def borrow(self, width, height, channels=4, dtype=np.float32):
+        """
+        Borrow a buffer for the duration of a with-block
+
+        Usage:
+            with pool.borrow(1920, 1080) as buffer:
+                ...
+        """
+        buffer = self.acquire(width, height, channels, dtype)
+        try:
+            yield buffer
+        finally:
+            self.release(buffer)
+
+    def set_max_bytes(self, max_bytes):
+        """Change the pool cap, evicting buffers if needed"""
+        with self._lock:
+            self.max_bytes = max(0, int(max_bytes))
+            self._evict_locked()
+
+    def clear(self):
+        """Drop all pooled buffers"""
+        with self._lock:
+            self._free.clear()
+            self._pooled_bytes = 0
+
+    def get_stats(self):
+        """
+        Get pool statistics
+
+        Returns:
+            dict: Hit/miss counters and current pool usage
+        """
+        with self._lock:
+            requests = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / requests if requests else 0.0,
+                'evictions': self.evictions,
+                'pooled_buffers': sum(len(b) for b in self._free.values()),
+                'pooled_bytes': self._pooled_bytes,
+                'max_bytes': self.max_bytes,
+            }
+
+    def _evict_locked(self):
+        """Drop least recently used buffers until under the cap"""
+        while self._pooled_bytes > self.max_bytes and self._free:
+            key, buffers = next(iter(self._free.items()))
+            buffer = buffers.pop(0)
+            self._pooled_bytes -= buffer.nbytes
+            self.evictions += 1
+            if not buffers:
+                del self._free[key]
+
+
+# Shared pool instance
+_buffer_pool = None
+
+
+def get_buffer_pool():
+    """Get the shared frame buffer pool"""
+    global _buffer_pool
+    if _buffer_pool is None:
+        _buffer_pool = FrameBufferPool()
+    return _buffer_pool
@@ -0,0 +1,465 @@
+"""
+HyperGradeFX Color Operations
+Vectorized NumPy versions of the compositor color nodes
+
+All functions take float arrays whose last axis holds RGB or RGBA values
+(an image of shape (height, width, channels), a tile, or a flat list of
+colors) and return a new float32 array of the same shape. Alpha is passed
+through unchanged. Factors may be scalars or arrays matching the leading
+axes of the image. Nothing here depends on bpy, so these functions can run
+in headless workers.
+"""
+
+import numpy as np
+
+
+# Rec. 709 luminance weights (Blender's default scene linear coefficients)
+LUMINANCE_WEIGHTS = np.array([0.2126, 0.7152, 0.0722], dtype=np.float32)
+
+# Blender's Color Correction node blends ranges over +/- this margin
+COLOR_CORRECTION_MARGIN = 0.10
+
+
+def _factor(fac, pixels):
+    """Broadcast a scalar or per-pixel factor against an image"""
+    fac = np.asarray(fac, dtype=np.float32)
+    if fac.ndim and fac.ndim == pixels.ndim - 1:
+        fac = fac[..., None]
+    return fac
+
+
+def _with_rgb(pixels, rgb):
+    """Return a float32 copy of pixels with the RGB channels replaced"""
+    out = np.array(pixels, dtype=np.float32, copy=True)
+    out[..., :3] = rgb
+    return out
+
+
+def luminance(pixels):
+    """Get scene linear luminance of RGB(A) pixels"""
+    return np.asarray(pixels, dtype=np.float32)[..., :3] @ LUMINANCE_WEIGHTS
+
+
+def rgb_to_hsv(rgb):
+    """Convert an array of RGB values to HSV (all components 0-1)"""
+    rgb = np.asarray(rgb, dtype=np.float32)
+    r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+
+    maxc = rgb.max(axis=-1)
+    minc = rgb.min(axis=-1)
+    delta = maxc - minc
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        s = np.where(maxc > 0, delta / maxc, 0.0)
+        safe = np.where(delta > 0, delta, 1.0)
+        rc = (maxc - r) / safe
+        gc = (maxc - g) / safe
+        bc = (maxc - b) / safe
+
+    h = np.where(r == maxc, bc - gc, np.where(g == maxc, 2.0 + rc - bc, 4.0 + gc - rc))
+    h = np.where(delta > 0, (h / 6.0) % 1.0, 0.0)
+
+    return np.stack([h, s, maxc], axis=-1).astype(np.float32)
+
+
+def hsv_to_rgb(hsv):
+    """Convert an array of HSV values to RGB"""
+    hsv = np.asarray(hsv, dtype=np.float32)
+    h, s, v = hsv[..., 0], hsv[..., 1], hsv[..., 2]
+
+    h6 = (h % 1.0) * 6.0
+    i = np.floor(h6).astype(np.int32) % 6
+    f = h6 - np.floor(h6)
+
+    p = v * (1.0 - s)
+    q = v * (1.0 - s * f)
+    t = v * (1.0 - s * (1.0 - f))
+
+    r = np.choose(i, [v, q, p, p, t, v])
+    g = np.choose(i, [t, v, v, q, p, p])
+    b = np.choose(i, [p, p, t, v, v, q])
+
+    return np.stack([r, g, b], axis=-1).astype(np.float32)
+
+
+def exposure(pixels, exposure=0.0):
+    """Exposure node: scale RGB by 2^exposure"""
+    pixels = np.asarray(pixels, dtype=np.float32)
+    scale = np.float32(2.0) ** _factor(exposure, pixels)
+    return _with_rgb(pixels, pixels[..., :3] * scale)
+
+
+def bright_contrast(pixels, bright=0.0, contrast=0.0):
+    """Bright/Contrast node (same linear model as Blender's compositor)"""
+    pixels = np.asarray(pixels, dtype=np.float32)
+    brightness = _factor(bright, pixels) / 100.0
+    contrast = _factor(contrast, pixels)
+    delta = contrast / 200.0
+
+    # Positive contrast steepens the slope, negative flattens it
+    a_pos = 1.0 / np.maximum(1.0 - delta * 2.0, np.finfo(np.float32).eps)
+    b_pos = a_pos * (brightness - delta)
+    a_neg = np.maximum(1.0 + delta * 2.0, 0.0)
+    b_neg = a_neg * brightness - delta
+
+    a = np.where(contrast > 0, a_pos, a_neg)
+    b = np.where(contrast > 0, b_pos, b_neg)
+
+    return _with_rgb(pixels, pixels[..., :3] * a + b)
+
+
+def hue_sat_value(pixels, hue=0.5, saturation=1.0, value=1.0, fac=1.0):
+    """Hue/Saturation/Value node (hue 0.5 is neutral)"""
+    pixels = np.asarray(pixels, dtype=np.float32)
+    hsv = rgb_to_hsv(pixels[..., :3])
+
+    hsv[..., 0] = (hsv[..., 0] + np.asarray(hue, dtype=np.float32) - 0.5) % 1.0
+    hsv[..., 1] *= np.asarray(saturation, dtype=np.float32)
+    hsv[..., 2] *= np.asarray(value, dtype=np.float32)
+
+    rgb = hsv_to_rgb(hsv)
+    fac = _factor(fac, pixels)
+    return _with_rgb(pixels, pixels[..., :3] + (rgb - pixels[..., :3]) * fac)
+
+
+def _blend_rgb(a, b, blend_type):
+    """Blend two RGB arrays with a MixRGB blend mode"""
+    if blend_type == 'MIX':
+        return b
+    if blend_type == 'ADD':
+        return a + b
+    if blend_type == 'SUBTRACT':
+        return a - b
+    if blend_type == 'MULTIPLY':
+        return a * b
+    if blend_type == 'SCREEN':
+        return 1.0 - (1.0 - a) * (1.0 - b)
+    if blend_type == 'DIVIDE':
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(b != 0, a / np.where(b != 0, b, 1.0), a)
+    if blend_type == 'DIFFERENCE':
+        return np.abs(a - b)
+    if blend_type == 'DARKEN':
+        return np.minimum(a, b)
+    if blend_type == 'LIGHTEN':
+        return np.maximum(a, b)
+    if blend_type == 'OVERLAY':
+        return np.where(a < 0.5, 2.0 * a * b, 1.0 - 2.0 * (1.0 - a) * (1.0 - b))
+    if blend_type == 'SOFT_LIGHT':
+        screen = 1.0 - (1.0 - a) * (1.0 - b)
+        return (1.0 - a) * a * b + a * screen
+    if blend_type == 'LINEAR_LIGHT':
+        return a + 2.0 * b - 1.0
+    if blend_type == 'HUE':
+        hsv_a = rgb_to_hsv(a)
+        hsv_b = rgb_to_hsv(b)
+        hsv_a[..., 0] = np.where(hsv_b[..., 1] > 0, hsv_b[..., 0], hsv_a[..., 0])
+        return hsv_to_rgb(hsv_a)
+    if blend_type == 'SATURATION':
+        hsv_a = rgb_to_hsv(a)
+        hsv_b = rgb_to_hsv(b)
+        hsv_a[..., 1] = np.where(hsv_a[..., 1] > 0, hsv_b[..., 1], hsv_a[..., 1])
+        return hsv_to_rgb(hsv_a)
+    if blend_type == 'VALUE':
+        hsv_a = rgb_to_hsv(a)
+        hsv_a[..., 2] = rgb_to_hsv(b)[..., 2]
+        return hsv_to_rgb(hsv_a)
+    if blend_type == 'COLOR':
+        hsv_a = rgb_to_hsv(a)
+        hsv_b = rgb_to_hsv(b)
+        hsv_b[..., 2] = hsv_a[..., 2]
+        return np.where((hsv_b[..., 1] > 0)[..., None], hsv_to_rgb(hsv_b), a)
+
+    raise ValueError(f"Unsupported blend type: {blend_type}")
+
+
+# Blend modes handled by mix_rgb()
+MIX_BLEND_TYPES = (
+    'MIX', 'ADD', 'SUBTRACT', 'MULTIPLY', 'SCREEN', 'DIVIDE', 'DIFFERENCE',
+    'DARKEN', 'LIGHTEN', 'OVERLAY', 'SOFT_LIGHT', 'LINEAR_LIGHT',
+    'HUE', 'SATURATION', 'VALUE', 'COLOR',
+)
+
+
+def mix_rgb(image1, image2, fac=0.5, blend_type='MIX', use_clamp=False):
+    """
+    Mix node: blend image2 over image1
+
+    Args:
+        image1: Base image (its alpha is kept)
+        image2: Blend image or a single RGB(A) color
+        fac: Blend factor
+        blend_type: One of MIX_BLEND_TYPES
+        use_clamp: Clamp the result to 0-1
+    """
+    image1 = np.asarray(image1, dtype=np.float32)
+    image2 = np.asarray(image2, dtype=np.float32)
+
+    a = image1[..., :3]
+    b = np.broadcast_to(image2[..., :3], a.shape)
+
+    fac = _factor(fac, image1)
+    rgb = a + (_blend_rgb(a, b, blend_type) - a) * fac
+
+    if use_clamp:
+        rgb = np.clip(rgb, 0.0, 1.0)
+
+    return _with_rgb(image1, rgb)
+
+
+# Default parameters for one tonal range of the Color Correction node
+COLOR_CORRECTION_RANGE_DEFAULTS = {
+    'saturation': 1.0,
+    'contrast': 1.0,
+    'gamma': 1.0,
+    'gain': 1.0,
+    'lift': 0.0,
+}
+
+COLOR_CORRECTION_RANGES = ('master', 'shadows', 'midtones', 'highlights')
+
+
+def color_correction_defaults():
+    """Get default Color Correction parameters as a flat dict"""
+    params = {
+        'midtones_start': 0.2,
+        'midtones_end': 0.7,
+        'red': True,
+        'green': True,
+        'blue': True,
+    }
+    for tonal_range in COLOR_CORRECTION_RANGES:
+        for key, value in COLOR_CORRECTION_RANGE_DEFAULTS.items():
+            params[f'{tonal_range}_{key}'] = value
+    return params
+
+
+def color_correction(pixels, params=None, mask=1.0):
+    """
+    Color Correction node (master/shadows/midtones/highlights wheels)
+
+    Args:
+        pixels: Input image
+        params: Dict using the node's property names (master_lift,
+                shadows_gamma, midtones_start, red, ...); missing keys
+                use the node defaults
+        mask: Mask factor
+    """
+    settings = color_correction_defaults()
+    settings.update(params or {})
+
+    pixels = np.asarray(pixels, dtype=np.float32)
+    rgb = pixels[..., :3]
+
+    # Weight of each tonal range from the average channel level
+    level = rgb.mean(axis=-1)
+    margin = COLOR_CORRECTION_MARGIN
+    margin_div = 0.5 / margin
+    start = settings['midtones_start']
+    end = settings['midtones_end']
+
+    low_blend = np.clip((level - start) * margin_div + 0.5, 0.0, 1.0)
+    high_blend = np.clip((level - end) * margin_div + 0.5, 0.0, 1.0)
+
+    shadows = 1.0 - low_blend
+    highlights = high_blend
+    midtones = low_blend - high_blend
+
+    def weighted(key):
+        return (shadows * settings[f'shadows_{key}'] +
+                midtones * settings[f'midtones_{key}'] +
+                highlights * settings[f'highlights_{key}'])
+
+    saturation = (settings['master_saturation'] * weighted('saturation'))[..., None]
+    contrast = (settings['master_contrast'] * weighted('contrast'))[..., None]
+    gamma = (settings['master_gamma'] * weighted('gamma'))[..., None]
+    gain = (settings['master_gain'] * weighted('gain'))[..., None]
+    lift = (settings['master_lift'] + weighted('lift'))[..., None]
+
+    luma = luminance(rgb)[..., None]
+    result = luma + saturation * (rgb - luma)
+    result = 0.5 + (result - 0.5) * contrast
+    graded = result * gain + lift
+
+    # Non-positive values fall back to the ungraded value, as in Blender
+    with np.errstate(divide='ignore', invalid='ignore'):
+        powered = np.power(np.maximum(graded, 0.0), 1.0 / gamma)
+    result = np.where(graded > 0.0, powered, result)
+
+    mask = _factor(mask, pixels)
+    result = rgb + (result - rgb) * mask
+
+    # Disabled channels pass through untouched
+    enabled = np.array([settings['red'], settings['green'], settings['blue']], dtype=bool)
+    result = np.where(enabled, result, rgb)
+
+    return _with_rgb(pixels, result)
+
+
+def linear_to_srgb(values):
+    """Encode scene linear values with the sRGB transfer function"""
+    values = np.asarray(values, dtype=np.float32)
+    encoded = 1.055 * np.power(np.maximum(values, 0.0031308), 1.0 / 2.4) - 0.055
+    return np.where(values < 0.0031308, values * 12.92, encoded).astype(np.float32)
+
+
+def srgb_to_linear(values):
+    """Decode sRGB encoded values to scene linear"""
+    values = np.asarray(values, dtype=np.float32)
+    decoded = np.power((np.maximum(values, 0.04045) + 0.055) / 1.055, 2.4)
+    return np.where(values < 0.04045, values / 12.92, decoded).astype(np.float32)
+
+
+def color_balance(pixels, lift=(1.0, 1.0, 1.0), gamma=(1.0, 1.0, 1.0),
+                  gain=(1.0, 1.0, 1.0), fac=1.0):
+    """Color Balance node in Lift/Gamma/Gain mode (applied in sRGB space)"""
+    pixels = np.asarray(pixels, dtype=np.float32)
+    rgb = pixels[..., :3]
+
+    lift = np.asarray(lift, dtype=np.float32)[:3]
+    gamma = np.asarray(gamma, dtype=np.float32)[:3]
+    gain = np.asarray(gain, dtype=np.float32)[:3]
+
+    lift_lgg = 2.0 - lift
+    inv_gamma = 1.0 / np.maximum(gamma, 1e-5)
+
+    result = ((linear_to_srgb(rgb) - 1.0) * lift_lgg + 1.0) * gain
+    result = srgb_to_linear(np.power(np.maximum(result, 0.0), inv_gamma))
+
+    fac = _factor(fac, pixels)
+    return _with_rgb(pixels, rgb + (result - rgb) * fac)
+
+
+def _curve_table(points):
+    """Split [(x, y), ...] curve points into sorted interpolation arrays"""
+    points = np.asarray(points, dtype=np.float32).reshape(-1, 2)
+    order = np.argsort(points[:, 0], kind='stable')
+    return points[order, 0], points[order, 1]
+
+
+def evaluate_curve(values, points):
+    """
+    Evaluate a piecewise linear curve
+
+    Args:
+        values: Input array
+        points: Curve points as [(x, y), ...]; None means identity
+    """
+    values = np.asarray(values, dtype=np.float32)
+    if points is None:
+        return values
+    xs, ys = _curve_table(points)
+    return np.interp(values, xs, ys).astype(np.float32)
+
+
+def rgb_curves(pixels, combined=None, red=None, green=None, blue=None,
+               black=(0.0, 0.0, 0.0), white=(1.0, 1.0, 1.0), fac=1.0):
+    """
+    RGB Curves node
+
+    Each curve is a list of (x, y) points, densely sampled when it comes
+    from a node's curve mapping. The combined curve is applied before the
+    per-channel curves, as in Blender.
+    """
+    pixels = np.asarray(pixels, dtype=np.float32)
+    rgb = pixels[..., :3]
+
+    black = np.asarray(black, dtype=np.float32)[:3]
+    white = np.asarray(white, dtype=np.float32)[:3]
+    range_ = np.where(white != black, white - black, 1.0)
+
+    result = (rgb - black) / range_
+    result = evaluate_curve(result, combined)
+    result = np.stack([
+        evaluate_curve(result[..., 0], red),
+        evaluate_curve(result[..., 1], green),
+        evaluate_curve(result[..., 2], blue),
+    ], axis=-1)
+
+    fac = _factor(fac, pixels)
+    return _with_rgb(pixels, rgb + (result - rgb) * fac)
+
+
+def color_ramp(fac, elements, interpolation='LINEAR'):
+    """
+    Color Ramp node
+
+    Args:
+        fac: Scalar field (any shape)
+        elements: List of (position, (r, g, b, a)) stops
+        interpolation: LINEAR, EASE or CONSTANT
+
+    Returns:
+        numpy.ndarray: RGBA array of shape fac.shape + (4,)
+    """
+    fac = np.asarray(fac, dtype=np.float32)
+    stops = sorted(elements, key=lambda e: e[0])
+    positions = np.array([p for p, _ in stops], dtype=np.float32)
+    colors = np.array([tuple(c) + (1.0,) * (4 - len(c)) for _, c in stops],
+                      dtype=np.float32)
+
+    if len(stops) == 1:
+        return np.broadcast_to(colors[0], fac.shape + (4,)).copy()
+
+    # Index of the stop at or below each value
+    idx = np.clip(np.searchsorted(positions, fac, side='right') - 1, 0, len(stops) - 2)
+    p0 = positions[idx]
+    p1 = positions[idx + 1]
+    span = np.where(p1 > p0, p1 - p0, 1.0)
+    t = np.clip((fac - p0) / span, 0.0, 1.0)
+
+    if interpolation == 'CONSTANT':
+        t = (fac >= p1).astype(np.float32)
+    elif interpolation == 'EASE':
+        t = t * t * (3.0 - 2.0 * t)
+    elif interpolation != 'LINEAR':
+        raise ValueError(f"Unsupported color ramp interpolation: {interpolation}")
+
+    result = colors[idx] + (colors[idx + 1] - colors[idx]) * t[..., None]
+    result[fac <= positions[0]] = colors[0]
+    result[fac >= positions[-1]] = colors[-1]
+    return result
+
+
+# Math node operations handled by math_op()
+MATH_OPERATIONS = {
+    'ADD': lambda a, b: a + b,
+    'SUBTRACT': lambda a, b: a - b,
+    'MULTIPLY': lambda a, b: a * b,
+    'DIVIDE': lambda a, b: np.where(b != 0, a / np.where(b != 0, b, 1.0), 0.0),
+    'POWER': lambda a, b: np.power(np.abs(a), b) * np.where(a < 0, -1.0, 1.0),
+    'LOGARITHM': lambda a, b: np.where((a > 0) & (b > 0) & (b != 1),
+                                       np.log(np.maximum(a, 1e-30)) /
+                                       np.log(np.where((b > 0) & (b != 1), b, 2.0)), 0.0),
+    'SQRT': lambda a, b: np.sqrt(np.maximum(a, 0.0)),
+    'ABSOLUTE': lambda a, b: np.abs(a),
+    'MINIMUM': lambda a, b: np.minimum(a, b),
+    'MAXIMUM': lambda a, b: np.maximum(a, b),
+    'LESS_THAN': lambda a, b: (a < b).astype(np.float32),
+    'GREATER_THAN': lambda a, b: (a > b).astype(np.float32),
+    'ROUND': lambda a, b: np.floor(a + 0.5),
+    'FLOOR': lambda a, b: np.floor(a),
+    'CEIL': lambda a, b: np.ceil(a),
+    'FRACT': lambda a, b: a - np.floor(a),
+    'MODULO': lambda a, b: np.where(b != 0, np.fmod(a, np.where(b != 0, b, 1.0)), 0.0),
+    'SINE': lambda a, b: np.sin(a),
+    'COSINE': lambda a, b: np.cos(a),
+    'TANGENT': lambda a, b: np.tan(a),
+}
+
+
+def math_op(a, b=0.5, operation='ADD', use_clamp=False):
+    """Math node on scalar fields"""
+    if operation not in MATH_OPERATIONS:
+        raise ValueError(f"Unsupported math operation: {operation}")
+
+    a = np.asarray(a, dtype=np.float32)
+    b = np.asarray(b, dtype=np.float32)
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        result = MATH_OPERATIONS[operation](a, b)
+
+    if use_clamp:
+        result = np.clip(result, 0.0, 1.0)
+
+    return np.asarray(result, dtype=np.float32)
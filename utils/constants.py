@@ -59,6 +59,14 @@ EXPORT_FORMATS = {
     'TIFF': {'ext': '.tif', 'color_depth': '16'},
 }
 
+# Proxy resolutions (FFmpeg scale argument)
+PROXY_RESOLUTIONS = {
+    '360p': '640:360',
+    '480p': '854:480',
+    '720p': '1280:720',
+    '1080p': '1920:1080',
+}
+
 # Video Codecs
 VIDEO_CODECS = {
     'PRORES': {'codec': 'prores_ks', 'profile': 'hq'},
@@ -67,6 +75,34 @@ VIDEO_CODECS = {
     'DNXHD': {'codec': 'dnxhd', 'bitrate': '185M'},
 }
 
+# 10-bit output formats per codec and chroma subsampling, used instead of
+# 8-bit 4:2:0 when exporting at high bit depth
+HIGH_BIT_DEPTH_FORMATS = {
+    'PRORES': {
+        '422': {'pix_fmt': 'yuv422p10le', 'profile': 'hq'},
+        '444': {'pix_fmt': 'yuv444p10le', 'profile': '4444'},
+    },
+    'DNXHD': {
+        '422': {'pix_fmt': 'yuv422p10le', 'profile': 'dnxhr_hqx'},
+        '444': {'pix_fmt': 'yuv444p10le', 'profile': 'dnxhr_444'},
+    },
+    'H265': {
+        '422': {'pix_fmt': 'yuv422p10le'},
+        '444': {'pix_fmt': 'yuv444p10le'},
+    },
+}
+
+# Color Grade Stack stages (key, node label), in processing order
+GRADE_STACK_STAGES = [
+    ('exposure', '1. Exposure'),
+    ('white_balance', '2. White Balance'),
+    ('contrast', '3. Contrast'),
+    ('saturation', '4. Saturation'),
+    ('color_wheels', '5. Color Wheels'),
+    ('curves', '6. Curves'),
+    ('final_adjust', '7. Final Adjust'),
+]
+
 # Node Group Preset Categories
 PRESET_CATEGORIES = [
     'COLOR_GRADING',
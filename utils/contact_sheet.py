@@ -0,0 +1,231 @@
+"""
+Contact Sheets for HyperGradeFX
+Tiles downscaled frames of an image sequence into one sheet
+"""
+
+import hashlib
+import math
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from .openimageio_handler import read_image_file, read_image_size, write_image_file, resize_area
+from .sequence_io import SequenceReader
+
+
+# Thumbnails kept in the cache directory; the oldest are pruned first
+DEFAULT_MAX_THUMBNAILS = 5000
+
+
+def select_frames(paths, count):
+    """
+    Pick count evenly spaced frames, always including the first and last
+
+    Returns:
+        list: Selected paths in sequence order
+    """
+    paths = list(paths)
+    if count >= len(paths):
+        return paths
+    if count <= 1:
+        return paths[:1]
+    step = (len(paths) - 1) / (count - 1)
+    return [paths[round(i * step)] for i in range(count)]
+
+
+def _to_rgba(pixels):
+    """Expand grey, grey+alpha and RGB pixels to RGBA"""
+    channels = pixels.shape[2]
+    if channels == 4:
+        return pixels
+    height, width = pixels.shape[:2]
+    rgba = np.ones((height, width, 4), dtype=np.float32)
+    if channels in (1, 2):
+        rgba[..., :3] = pixels[..., :1]
+        if channels == 2:
+            rgba[..., 3] = pixels[..., 1]
+    else:
+        rgba[..., :3] = pixels[..., :3]
+    return rgba
+
+
+class ThumbnailCache:
+    """
+    Downscaled frames stored as float16 .npy files
+
+    Keyed by the source file's resolved path, size and mtime plus the
+    thumbnail size, so a changed frame is decoded again while reruns over
+    an unchanged sequence skip decoding entirely.
+    """
+
+    def __init__(self, cache_dir=None, max_files=DEFAULT_MAX_THUMBNAILS):
+        if cache_dir is None:
+            cache_dir = Path(tempfile.gettempdir()) / "HyperGradeFX" / "thumbnails"
+        self.cache_dir = Path(cache_dir)
+        self.max_files = max_files
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, source, width, height):
+        try:
+            resolved = os.path.realpath(source)
+            stat = os.stat(resolved)
+        except OSError:
+            return None
+        key = f"{resolved}|{stat.st_size}|{stat.st_mtime_ns}|{width}x{height}"
+        return self.cache_dir / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.npy"
+
+    def get(self, source, width, height):
+        """Get a cached thumbnail, or None"""
+        path = self._path(source, width, height)
+        try:
+            thumbnail = np.load(path).astype(np.float32)
+        except (OSError, ValueError, TypeError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return thumbnail
+
+    def put(self, source, width, height, thumbnail):
+        """Store a thumbnail"""
+        path = self._path(source, width, height)
+        if path is None:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+            with open(tmp_path, 'wb') as f:
+                np.save(f, thumbnail.astype(np.float16))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"HyperGradeFX: Could not cache thumbnail: {e}")
+
+    def prune(self):
+        """Remove the oldest thumbnails beyond max_files"""
+        try:
+            files = sorted(self.cache_dir.glob('*.npy'), key=lambda p: p.stat().st_mtime)
+        except OSError:
+            return
+        for path in files[:max(0, len(files) - self.max_files)]:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
+def _thumbnail_reader(width, height, cache):
+    """Get a SequenceReader callable that returns one downscaled RGBA frame"""
+
+    def read(path):
+        if cache is not None:
+            thumbnail = cache.get(path, width, height)
+            if thumbnail is not None:
+                return thumbnail
+
+        # Decode and shrink on the reader thread, so only the small
+        # thumbnail is queued and the full frame is freed right away
+        thumbnail = _to_rgba(resize_area(read_image_file(path), width, height))
+
+        if cache is not None:
+            cache.put(path, width, height, thumbnail)
+        return thumbnail
+
+    return read
+
+
+def build_contact_sheet(paths, columns=4, rows=None, cell_width=320, padding=4,
+                        background=(0.05, 0.05, 0.05, 1.0), threads=None,
+                        use_cache=True, cache_dir=None, progress=None):
+    """
+    Tile an image sequence into a contact sheet
+
+    Frames are decoded on a thread pool, area-downsampled to the cell size
+    as they arrive and copied into the sheet, so memory stays at about one
+    full frame per reader thread plus the sheet itself.
+
+    Args:
+        paths: Frame file paths in order
+        columns: Cells per row
+        rows: Rows of cells; None fits every frame, otherwise frames are
+              sampled evenly to fill columns * rows cells
+        cell_width: Cell width in pixels (height follows the frame aspect)
+        padding: Gap around cells in pixels
+        background: RGBA color between cells
+        threads: Decode threads (default: CPU count, at most 8)
+        use_cache: Reuse and store thumbnails in the thumbnail cache
+        cache_dir: Thumbnail cache directory (default: temp directory)
+        progress: Optional callable(done, total)
+
+    Returns:
+        numpy.ndarray: float32 RGBA sheet, rows top to bottom
+    """
+    paths = list(paths)
+    if not paths:
+        raise ValueError("No frames to put on the contact sheet")
+
+    columns = max(1, int(columns))
+    if rows is None:
+        rows = math.ceil(len(paths) / columns)
+    paths = select_frames(paths, columns * rows)
+    rows = math.ceil(len(paths) / columns)
+
+    source_width, source_height, _ = read_image_size(paths[0])
+    cell_width = max(1, int(cell_width))
+    cell_height = max(1, round(cell_width * source_height / source_width))
+
+    sheet = np.empty((rows * (cell_height + padding) + padding,
+                      columns * (cell_width + padding) + padding, 4), dtype=np.float32)
+    sheet[...] = background
+
+    cache = ThumbnailCache(cache_dir) if use_cache else None
+    if threads is None:
+        threads = min(8, os.cpu_count() or 1)
+
+    reader = SequenceReader(paths, reader=_thumbnail_reader(cell_width, cell_height, cache),
+                            prefetch=threads * 2, threads=threads)
+
+    for index, (_, thumbnail) in enumerate(reader):
+        row, column = divmod(index, columns)
+        y = padding + row * (cell_height + padding)
+        x = padding + column * (cell_width + padding)
+        sheet[y:y + cell_height, x:x + cell_width] = thumbnail
+        if progress:
+            progress(index + 1, len(paths))
+
+    if cache is not None:
+        cache.prune()
+
+    return sheet
+
+
+def write_contact_sheet(paths, output_path, **kwargs):
+    """
+    Build a contact sheet and write it to an image file
+
+    Frames from OpenEXR sequences are scene linear; they are converted to
+    sRGB unless the sheet itself is written as EXR.
+
+    Args:
+        paths: Frame file paths in order
+        output_path: Sheet file path (format from the extension)
+        **kwargs: Passed on to build_contact_sheet()
+
+    Returns:
+        str: Written file path
+    """
+    from .color_ops import linear_to_srgb
+
+    paths = list(paths)
+    sheet = build_contact_sheet(paths, **kwargs)
+
+    output_path = Path(output_path)
+    if paths and Path(paths[0]).suffix.lower() == '.exr' and output_path.suffix.lower() != '.exr':
+        sheet[..., :3] = linear_to_srgb(np.clip(sheet[..., :3], 0.0, None))
+
+    if output_path.suffix.lower() in ('.jpg', '.jpeg'):
+        sheet = sheet[..., :3]
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    return write_image_file(output_path, sheet)
@@ -0,0 +1,330 @@
+"""
+Encoder Benchmark for HyperGradeFX
+Measures FFmpeg encode throughput for each VIDEO_CODECS entry
+"""
+
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from .constants import VIDEO_CODECS, HIGH_BIT_DEPTH_FORMATS
+
+
+# Bump when the result layout changes
+BENCHMARK_VERSION = 1
+
+BENCHMARK_PATTERNS = ('gradient', 'noise', 'detail')
+BENCHMARK_QUALITIES = ('high', 'medium', 'low')
+
+# Distinct frames generated per pattern; the encode cycles through them
+_UNIQUE_FRAMES = 8
+
+
+def generate_frame(width, height, pattern='gradient', index=0, seed=0):
+    """
+    Generate a synthetic test frame
+
+    Args:
+        width, height: Frame size in pixels
+        pattern: 'gradient' (smooth ramps), 'noise' (incompressible grain)
+                 or 'detail' (fine stripes and checker patches)
+        index: Frame number, used to animate the pattern
+        seed: Random seed for the noise pattern
+
+    Returns:
+        numpy.ndarray: float32 array of shape (height, width, 3) in 0-1
+    """
+    y, x = np.mgrid[0:height, 0:width].astype(np.float32)
+    u = x / max(1, width - 1)
+    v = y / max(1, height - 1)
+    phase = index / _UNIQUE_FRAMES
+
+    if pattern == 'gradient':
+        frame = np.stack([
+            (u + phase) % 1.0,
+            v,
+            0.5 + 0.5 * np.sin(2.0 * np.pi * (u + v + phase)),
+        ], axis=-1)
+
+    elif pattern == 'noise':
+        rng = np.random.default_rng(seed + index)
+        frame = rng.random((height, width, 3), dtype=np.float32)
+
+    elif pattern == 'detail':
+        shift = index * 4
+        stripes = 0.5 + 0.5 * np.sin((x + shift) * 1.3) * np.cos(y * 0.7)
+        checker = (((x + shift) // 8 + y // 8) % 2).astype(np.float32)
+        zone = 0.5 + 0.5 * np.cos(((u - 0.5) ** 2 + (v - 0.5) ** 2) * (400.0 + shift))
+        frame = np.stack([stripes, checker, zone], axis=-1)
+
+    else:
+        raise ValueError(f"Unknown benchmark pattern: {pattern}")
+
+    return np.ascontiguousarray(frame, dtype=np.float32)
+
+
+def _finish(encoder):
+    """
+    Close an encoder and collect the FFmpeg process's resource usage
+
+    The usage covers CPU time and peak memory of that one process; where
+    it is unavailable (Windows) only success is reported.
+
+    Returns:
+        tuple: (success, cpu_seconds or None, peak_rss_bytes or None)
+    """
+    ok, usage = encoder.close(timeout=None, rusage=True)
+    if usage is None:
+        return ok, None, None
+
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    peak_rss = usage.ru_maxrss if sys.platform == 'darwin' else usage.ru_maxrss * 1024
+    return ok, usage.ru_utime + usage.ru_stime, peak_rss
+
+
+def benchmark_encode(handler, frames, output_path, codec, quality, frame_count,
+                     framerate=24, high_bit_depth=False):
+    """
+    Time one encode of prepared frames
+
+    Args:
+        handler: FFmpegHandler
+        frames: Frames to cycle through (float32, (height, width, 3))
+        output_path: Encoded file path
+        codec: VIDEO_CODECS key
+        quality: Quality preset
+        frame_count: Frames to encode
+        framerate: Frame rate of the video
+        high_bit_depth: 10-bit encode fed with 16-bit frames
+
+    Returns:
+        dict: Timing, CPU, size and memory figures
+    """
+    height, width = frames[0].shape[:2]
+    pix_fmt = 'rgb48le' if high_bit_depth else 'rgb24'
+
+    # Quantize once up front so only the encode is timed
+    dtype, scale = (np.uint16, 65535) if high_bit_depth else (np.uint8, 255)
+    prepared = [np.ascontiguousarray(np.clip(f, 0.0, 1.0) * scale + 0.5, dtype=dtype)
+                for f in frames]
+
+    start = time.perf_counter()
+    encoder = handler.open_rawvideo_encoder(
+        str(output_path), width, height, codec=codec, framerate=framerate,
+        quality=quality, pix_fmt=pix_fmt, high_bit_depth=high_bit_depth
+    )
+    try:
+        for index in range(frame_count):
+            encoder.write_frame(prepared[index % len(prepared)])
+    except RuntimeError:
+        encoder.abort()
+        raise
+    ok, cpu_seconds, peak_rss = _finish(encoder)
+    seconds = time.perf_counter() - start
+
+    output_bytes = Path(output_path).stat().st_size if ok and Path(output_path).exists() else 0
+    return {
+        'ok': ok,
+        'seconds': seconds,
+        'fps': frame_count / seconds if seconds > 0 else 0.0,
+        'cpu_seconds': cpu_seconds,
+        'output_bytes': output_bytes,
+        'bits_per_frame': output_bytes * 8 / frame_count if frame_count else 0,
+        'peak_rss_bytes': peak_rss,
+        'error': None if ok else encoder.error_output[-2000:],
+    }
+
+
+def run_benchmark(handler, codecs=None, qualities=BENCHMARK_QUALITIES,
+                  resolutions=((1920, 1080),), patterns=BENCHMARK_PATTERNS,
+                  frame_count=48, framerate=24, high_bit_depth=False, progress=None):
+    """
+    Benchmark every codec, quality, resolution and pattern combination
+
+    Codecs the FFmpeg build cannot encode are recorded as skipped.
+
+    Args:
+        handler: FFmpegHandler
+        codecs: VIDEO_CODECS keys (default: all)
+        qualities: Quality presets ('high', 'medium', 'low')
+        resolutions: (width, height) pairs
+        patterns: Synthetic frame patterns
+        frame_count: Frames encoded per run
+        framerate: Frame rate of the video
+        high_bit_depth: Benchmark the 10-bit path (codecs without one are skipped)
+        progress: Optional callable(done, total, label)
+
+    Returns:
+        dict: Benchmark run (see save_results())
+    """
+    capabilities = handler.get_capabilities()
+    if capabilities is None:
+        raise RuntimeError("FFmpeg is not available")
+
+    codecs = list(codecs or VIDEO_CODECS)
+    combos = [(codec, quality, res, pattern)
+              for res in resolutions for pattern in patterns
+              for codec in codecs for quality in qualities]
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="hgfx_bench_") as temp_dir:
+        frame_sets = {}
+
+        for done, (codec, quality, (width, height), pattern) in enumerate(combos):
+            label = f"{codec} {quality} {width}x{height} {pattern}"
+            if progress:
+                progress(done, len(combos), label)
+
+            entry = {
+                'codec': codec,
+                'quality': quality,
+                'resolution': [width, height],
+                'pattern': pattern,
+                'frames': frame_count,
+                'high_bit_depth': high_bit_depth,
+            }
+
+            if high_bit_depth and codec not in HIGH_BIT_DEPTH_FORMATS:
+                entry['skipped'] = "no 10-bit format"
+                results.append(entry)
+                continue
+
+            valid, message = handler.validate_codec(
+                codec, handler.get_output_pix_fmt(codec, high_bit_depth)
+            )
+            if not valid:
+                entry['skipped'] = message
+                results.append(entry)
+                continue
+
+            key = (width, height, pattern)
+            if key not in frame_sets:
+                frame_sets.clear()
+                frame_sets[key] = [generate_frame(width, height, pattern, i)
+                                   for i in range(_UNIQUE_FRAMES)]
+
+            ext = '.mp4' if codec in ('H264', 'H265') else '.mov'
+            output_path = Path(temp_dir) / f"bench{ext}"
+            try:
+                entry.update(benchmark_encode(handler, frame_sets[key], output_path, codec,
+                                              quality, frame_count, framerate, high_bit_depth))
+            except Exception as e:
+                entry.update({'ok': False, 'error': str(e)})
+            finally:
+                try:
+                    output_path.unlink()
+                except OSError:
+                    pass
+
+            results.append(entry)
+
+    if progress:
+        progress(len(combos), len(combos), "done")
+
+    return {
+        'version': BENCHMARK_VERSION,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'ffmpeg_version': capabilities['version'],
+        'host': {
+            'platform': platform.platform(),
+            'machine': platform.machine(),
+            'cpu_count': os.cpu_count(),
+        },
+        'results': results,
+    }
+
+
+def save_results(run, filepath):
+    """Write a benchmark run to JSON"""
+    filepath = Path(filepath)
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(run, f, indent=2)
+    return str(filepath)
+
+
+def load_results(filepath):
+    """Load a benchmark run from JSON"""
+    with open(filepath, 'r', encoding='utf-8') as f:
+        run = json.load(f)
+    if run.get('version') != BENCHMARK_VERSION:
+        raise ValueError(f"Unsupported benchmark file version: {run.get('version')}")
+    return run
+
+
+def _result_key(entry):
+    return (entry['codec'], entry['quality'], tuple(entry['resolution']),
+            entry['pattern'], entry.get('high_bit_depth', False))
+
+
+def _change(old, new):
+    """Relative change in percent, or None if it cannot be computed"""
+    if old in (None, 0) or new is None:
+        return None
+    return (new - old) / old * 100.0
+
+
+def compare_runs(baseline, current):
+    """
+    Compare two benchmark runs entry by entry
+
+    Args:
+        baseline: Earlier run (dict from run_benchmark() / load_results())
+        current: Later run
+
+    Returns:
+        list: One dict per combination present and successful in both runs,
+              with both values and the percent change of fps, CPU seconds,
+              output size and peak memory
+    """
+    before = {_result_key(e): e for e in baseline['results'] if e.get('ok')}
+    rows = []
+
+    for entry in current['results']:
+        if not entry.get('ok'):
+            continue
+        old = before.get(_result_key(entry))
+        if old is None:
+            continue
+
+        row = {
+            'codec': entry['codec'],
+            'quality': entry['quality'],
+            'resolution': entry['resolution'],
+            'pattern': entry['pattern'],
+        }
+        for field in ('fps', 'cpu_seconds', 'output_bytes', 'peak_rss_bytes'):
+            row[f'{field}_before'] = old.get(field)
+            row[f'{field}_after'] = entry.get(field)
+            row[f'{field}_change'] = _change(old.get(field), entry.get(field))
+        rows.append(row)
+
+    return rows
+
+
+def format_comparison(rows):
+    """
+    Format compare_runs() output as a text table
+
+    Returns:
+        str: One line per combination
+    """
+    def pct(value):
+        return "   n/a" if value is None else f"{value:+6.1f}%"
+
+    lines = [f"{'codec':8} {'quality':7} {'size':>10} {'pattern':9} "
+             f"{'fps':>8} {'fps Δ':>7} {'cpu Δ':>7} {'bytes Δ':>7} {'rss Δ':>7}"]
+    for row in rows:
+        width, height = row['resolution']
+        lines.append(
+            f"{row['codec']:8} {row['quality']:7} {f'{width}x{height}':>10} {row['pattern']:9} "
+            f"{row['fps_after']:8.1f} {pct(row['fps_change'])} {pct(row['cpu_seconds_change'])} "
+            f"{pct(row['output_bytes_change'])} {pct(row['peak_rss_bytes_change'])}"
+        )
+    return '\n'.join(lines)
@@ -0,0 +1,154 @@
+"""
+Export Manifest for HyperGradeFX
+Records which exported frames are up to date so reruns can skip them
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+
+# Bump when the stored format or the hashed settings change
+EXPORT_MANIFEST_VERSION = 1
+
+MANIFEST_FILENAME = "hgfx_export_manifest.json"
+
+# Recorded frames between automatic saves, so a crash loses little progress
+DEFAULT_SAVE_INTERVAL = 25
+
+
+def frame_digest(settings, frame):
+    """
+    Hash the settings a frame was rendered with together with its number
+
+    Args:
+        settings: JSON-serializable description of the compositor setup and
+                  render settings at this frame
+        frame: Frame number
+
+    Returns:
+        str: Hex digest
+    """
+    payload = {
+        'version': EXPORT_MANIFEST_VERSION,
+        'settings': settings,
+        'frame': int(frame),
+    }
+    text = json.dumps(payload, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class ExportManifest:
+    """
+    Per-frame record of an export directory
+
+    Each frame entry holds the digest of the settings it was rendered with
+    and the output file's name, size and mtime. A frame is current while the
+    digest matches and the file is unchanged on disk, so an interrupted or
+    partly invalidated export only renders the frames that are missing or
+    stale.
+
+    Usage:
+        manifest = ExportManifest(output_dir)
+        if not manifest.is_current(frame, path, digest):
+            render(path)
+            manifest.record(frame, path, digest)
+        manifest.flush()
+    """
+
+    def __init__(self, directory, filename=MANIFEST_FILENAME, save_interval=DEFAULT_SAVE_INTERVAL):
+        self.path = Path(directory) / filename
+        self.save_interval = max(1, int(save_interval))
+        self.frames = {}
+        self._unsaved = 0
+
+        self.skipped = 0
+        self.recorded = 0
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == EXPORT_MANIFEST_VERSION:
+                self.frames = data.get('frames', {})
+        except (OSError, ValueError):
+            pass
+
+    def is_current(self, frame, filepath, digest):
+        """
+        Check whether a frame's output is up to date
+
+        Args:
+            frame: Frame number
+            filepath: Expected output file
+            digest: frame_digest() of the current settings
+
+        Returns:
+            bool: True if the frame can be skipped
+        """
+        entry = self.frames.get(str(frame))
+        if entry is None or entry['digest'] != digest or entry['file'] != Path(filepath).name:
+            return False
+
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return False
+
+        if stat.st_size != entry['size'] or stat.st_mtime_ns != entry['mtime_ns']:
+            return False
+
+        self.skipped += 1
+        return True
+
+    def record(self, frame, filepath, digest):
+        """Record a frame whose output file has been written"""
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            # Not written after all; leave the frame to be rendered again
+            self.frames.pop(str(frame), None)
+            return
+
+        self.frames[str(frame)] = {
+            'digest': digest,
+            'file': Path(filepath).name,
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+        }
+        self.recorded += 1
+        self._unsaved += 1
+        if self._unsaved >= self.save_interval:
+            self.flush()
+
+    def invalidate(self, frame):
+        """Forget a frame so the next export renders it"""
+        if self.frames.pop(str(frame), None) is not None:
+            self._unsaved += 1
+
+    def flush(self):
+        """Write the manifest to disk if it changed"""
+        if not self._unsaved:
+            return
+        try:
+            tmp_path = self.path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': EXPORT_MANIFEST_VERSION, 'frames': self.frames}, f)
+            os.replace(tmp_path, self.path)
+            self._unsaved = 0
+        except OSError as e:
+            print(f"HyperGradeFX: Could not save export manifest: {e}")
+
+    def get_stats(self):
+        """
+        Get manifest statistics
+
+        Returns:
+            dict: Recorded frames and this run's skip/record counters
+        """
+        return {
+            'frames': len(self.frames),
+            'skipped': self.skipped,
+            'recorded': self.recorded,
+            'manifest_path': str(self.path),
+        }
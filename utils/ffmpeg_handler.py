@@ -5,9 +5,142 @@ Handles video encoding and export operations
 
 import subprocess
 import os
+import json
+import shutil
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import bpy
+import numpy as np
 from pathlib import Path
-from .constants import VIDEO_CODECS
+from .constants import VIDEO_CODECS, PROXY_RESOLUTIONS, HIGH_BIT_DEPTH_FORMATS
+from .media_probe import DEFAULT_FLUSH_INTERVAL, get_media_probe_cache
+
+
+# Bump when the probe format changes so stale disk entries are ignored
+PROBE_CACHE_VERSION = 1
+
+# Probe results for this session, keyed by (resolved path, mtime, size)
+_probe_cache = {}
+_probe_lock = threading.Lock()
+
+
+def _probe_cache_path():
+    return Path(tempfile.gettempdir()) / "HyperGradeFX" / "ffmpeg_probe.json"
+
+
+def _executable_key(ffmpeg_path):
+    """
+    Resolve an FFmpeg executable to a cache key
+
+    Returns:
+        tuple: (resolved path, mtime, size), or None if it does not exist
+    """
+    resolved = shutil.which(ffmpeg_path) or ffmpeg_path
+    try:
+        stat = os.stat(resolved)
+    except OSError:
+        return None
+    return (os.path.realpath(resolved), stat.st_mtime, stat.st_size)
+
+
+def _parse_table(output):
+    """Get the name column from ffmpeg's -encoders / -pix_fmts listings"""
+    names = []
+    in_table = False
+    for line in output.splitlines():
+        if line.strip().startswith('---'):
+            in_table = True
+            continue
+        fields = line.split()
+        if in_table and len(fields) >= 2:
+            names.append(fields[1])
+    return names
+
+
+def _run_probe(executable):
+    """Run ffmpeg to collect its version, encoders and pixel formats"""
+    def run(*args):
+        result = subprocess.run(
+            [executable, '-hide_banner', *args],
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip() or f"ffmpeg {' '.join(args)} failed")
+        return result.stdout
+
+    version_line = (run('-version').splitlines() or [''])[0]
+    version = version_line.split(' ')[2] if version_line.startswith('ffmpeg version') else version_line
+
+    return {
+        'version': version,
+        'encoders': sorted(_parse_table(run('-encoders'))),
+        'pix_fmts': sorted(_parse_table(run('-pix_fmts'))),
+    }
+
+
+def probe_ffmpeg(ffmpeg_path="ffmpeg"):
+    """
+    Get the capabilities of an FFmpeg executable
+
+    The probe runs once per executable path and modification time; results
+    are kept for the session and in a JSON file in the temp directory, so
+    later sessions skip spawning ffmpeg too.
+
+    Args:
+        ffmpeg_path: FFmpeg executable name or path
+
+    Returns:
+        dict: {'version', 'encoders', 'pix_fmts'}, or None if FFmpeg is
+              not available
+    """
+    key = _executable_key(ffmpeg_path)
+    if key is None:
+        return None
+
+    with _probe_lock:
+        probe = _probe_cache.get(key)
+        if probe is not None:
+            return probe
+
+        disk_key = '|'.join(str(part) for part in key)
+        cache_path = _probe_cache_path()
+        disk_cache = _load_json(cache_path)
+        if disk_cache.get('version') != PROBE_CACHE_VERSION:
+            disk_cache = {}
+
+        entries = disk_cache.get('entries', {})
+        probe = entries.get(disk_key)
+
+        if probe is None:
+            try:
+                probe = _run_probe(key[0])
+            except Exception as e:
+                print(f"FFmpeg not found: {e}")
+                return None
+
+            entries[disk_key] = probe
+            try:
+                _save_json(cache_path, {'version': PROBE_CACHE_VERSION, 'entries': entries})
+            except OSError as e:
+                print(f"HyperGradeFX: Could not save FFmpeg probe cache: {e}")
+
+        _probe_cache[key] = probe
+        return probe
+
+
+def clear_probe_cache():
+    """Forget all FFmpeg probe results, in memory and on disk"""
+    with _probe_lock:
+        _probe_cache.clear()
+        try:
+            _probe_cache_path().unlink()
+        except OSError:
+            pass
 
 
 class FFmpegHandler:
@@ -16,103 +149,413 @@ class FFmpegHandler:
     def __init__(self, ffmpeg_path="ffmpeg"):
         self.ffmpeg_path = ffmpeg_path
 
+    def get_capabilities(self):
+        """
+        Get the cached capabilities of this FFmpeg
+
+        Returns:
+            dict: {'version', 'encoders', 'pix_fmts'}, or None if unavailable
+        """
+        return probe_ffmpeg(self.ffmpeg_path)
+
     def check_ffmpeg_available(self):
         """Check if FFmpeg is available"""
+        return self.get_capabilities() is not None
+
+    def get_available_codecs(self):
+        """
+        Get the VIDEO_CODECS entries this FFmpeg can encode
+
+        Returns:
+            list: Codec keys (e.g. ['H264', 'PRORES'])
+        """
+        capabilities = self.get_capabilities()
+        if capabilities is None:
+            return []
+        encoders = set(capabilities['encoders'])
+        return [codec for codec, settings in VIDEO_CODECS.items()
+                if settings['codec'] in encoders]
+
+    def validate_codec(self, codec, pix_fmt='yuv420p'):
+        """
+        Check that a VIDEO_CODECS entry can be encoded
+
+        Args:
+            codec: Video codec key (H264, H265, PRORES, DNXHD)
+            pix_fmt: Output pixel format the encode will use
+
+        Returns:
+            tuple: (bool, str) - valid flag and error message
+        """
+        if codec not in VIDEO_CODECS:
+            return False, f"Unknown codec: {codec}"
+
+        capabilities = self.get_capabilities()
+        if capabilities is None:
+            return False, "FFmpeg is not available"
+
+        encoder = VIDEO_CODECS[codec]['codec']
+        if encoder not in capabilities['encoders']:
+            return False, f"FFmpeg {capabilities['version']} was built without the {encoder} encoder"
+
+        if pix_fmt and pix_fmt not in capabilities['pix_fmts']:
+            return False, f"FFmpeg {capabilities['version']} does not support pixel format {pix_fmt}"
+
+        return True, ""
+
+    def encode_image_sequence(self, input_pattern, output_path, codec='H264',
+                             framerate=24, start_number=1, quality='high',
+                             high_bit_depth=False, chroma='422'):
+        """
+        Encode an image sequence to video
+
+        Args:
+            input_pattern: Input file pattern (e.g., "frame_%04d.png")
+            output_path: Output video file path
+            codec: Video codec (H264, H265, PRORES, DNXHD)
+            framerate: Frame rate of the video
+            start_number: Starting frame number
+            quality: Quality preset (high, medium, low)
+            high_bit_depth: Encode 10-bit (feed 16-bit frames to benefit)
+            chroma: Chroma subsampling at high bit depth ('422' or '444')
+        """
+        if not self.check_ffmpeg_available():
+            raise RuntimeError("FFmpeg is not available")
+
+        cmd = self.build_sequence_command(input_pattern, output_path, codec,
+                                          framerate, start_number, quality,
+                                          high_bit_depth, chroma)
+
         try:
+            print(f"Running FFmpeg: {' '.join(cmd)}")
             result = subprocess.run(
-                [self.ffmpeg_path, '-version'],
+                cmd,
                 capture_output=True,
                 text=True,
-                timeout=5
+                timeout=3600  # 1 hour timeout
             )
-            return result.returncode == 0
+
+            if result.returncode == 0:
+                print(f"Video encoded successfully: {output_path}")
+                return True
+            else:
+                print(f"FFmpeg error: {result.stderr}")
+                return False
+
+        except subprocess.TimeoutExpired:
+            print("FFmpeg encoding timed out")
+            return False
         except Exception as e:
-            print(f"FFmpeg not found: {e}")
+            print(f"Error running FFmpeg: {e}")
             return False
 
-    def encode_image_sequence(self, input_pattern, output_path, codec='H264',
-                             framerate=24, start_number=1, quality='high'):
+    def build_sequence_command(self, input_pattern, output_path, codec='H264',
+                               framerate=24, start_number=1, quality='high',
+                               high_bit_depth=False, chroma='422'):
+        """Build the FFmpeg command encoding an image sequence"""
+        cmd = [
+            self.ffmpeg_path,
+            '-framerate', str(framerate),
+            '-start_number', str(start_number),
+            '-i', input_pattern,
+        ]
+        cmd.extend(self.get_codec_args(codec, quality, high_bit_depth, chroma))
+        cmd.extend(['-y', str(output_path)])  # Overwrite output file
+        return cmd
+
+    def encode_image_sequence_async(self, input_pattern, output_path, frame_count=None,
+                                    codec='H264', framerate=24, start_number=1,
+                                    quality='high', on_finish=None,
+                                    high_bit_depth=False, chroma='422'):
         """
-        Encode an image sequence to video
+        Queue an image sequence encode on the shared FFmpeg job queue
+
+        Returns immediately; poll the returned job for progress.
 
         Args:
             input_pattern: Input file pattern (e.g., "frame_%04d.png")
             output_path: Output video file path
+            frame_count: Number of frames, for progress reporting
             codec: Video codec (H264, H265, PRORES, DNXHD)
             framerate: Frame rate of the video
             start_number: Starting frame number
             quality: Quality preset (high, medium, low)
+            on_finish: Optional callable(job) run when the encode ends
+            high_bit_depth: Encode 10-bit (feed 16-bit frames to benefit)
+            chroma: Chroma subsampling at high bit depth ('422' or '444')
+
+        Returns:
+            FFmpegJob: The queued job
         """
+        from .ffmpeg_jobs import FFmpegJob, get_job_queue
+
         if not self.check_ffmpeg_available():
             raise RuntimeError("FFmpeg is not available")
 
-        codec_settings = VIDEO_CODECS.get(codec, VIDEO_CODECS['H264'])
+        cmd = self.build_sequence_command(input_pattern, output_path, codec,
+                                          framerate, start_number, quality,
+                                          high_bit_depth, chroma)
+        job = FFmpegJob(cmd, total_frames=frame_count, label=Path(output_path).name,
+                        on_finish=on_finish)
+        return get_job_queue().submit(job)
+
+    def encode_image_sequence_chunked(self, input_pattern, output_path, frame_count,
+                                      codec='H264', framerate=24, start_number=1,
+                                      quality='high', workers=4, segment_frames=240,
+                                      gop_size=None, high_bit_depth=False, chroma='422'):
+        """
+        Encode an image sequence as parallel segments joined with concat
+
+        The frame range is split into segments that start on a GOP boundary
+        (every segment opens with a keyframe), each segment is encoded by its
+        own FFmpeg process, and the segments are joined with the concat
+        demuxer without re-encoding.
+
+        Args:
+            input_pattern: Input file pattern (e.g., "frame_%04d.png")
+            output_path: Output video file path
+            frame_count: Number of frames in the sequence
+            codec: Video codec (H264, H265, PRORES, DNXHD)
+            framerate: Frame rate of the video
+            start_number: Starting frame number
+            quality: Quality preset (high, medium, low)
+            workers: Concurrent FFmpeg processes
+            segment_frames: Target frames per segment
+            gop_size: Keyframe interval for long-GOP codecs (default: 1 second);
+                      segments are rounded up to a multiple of it
+            high_bit_depth: Encode 10-bit (see HIGH_BIT_DEPTH_FORMATS)
+            chroma: Chroma subsampling at high bit depth ('422' or '444')
+
+        Returns:
+            bool: True if every segment encoded and the concat succeeded
+        """
+        if not self.check_ffmpeg_available():
+            raise RuntimeError("FFmpeg is not available")
+
+        workers = max(1, int(workers))
+        segments = self.plan_segments(frame_count, start_number, segment_frames,
+                                      gop_size or max(1, int(round(framerate))))
+        if len(segments) <= 1 or workers == 1:
+            return self.encode_image_sequence(input_pattern, output_path, codec,
+                                              framerate, start_number, quality,
+                                              high_bit_depth, chroma)
+
+        gop_args = []
+        if codec in ('H264', 'H265'):
+            gop = gop_size or max(1, int(round(framerate)))
+            # Fixed GOP with no scene-cut keyframes keeps segments aligned
+            gop_args = ['-g', str(gop), '-keyint_min', str(gop), '-sc_threshold', '0']
+
+        # Share the CPU between concurrent encoders
+        threads = max(1, (os.cpu_count() or 1) // workers)
+
+        output_path = Path(output_path)
+        segment_dir = Path(tempfile.mkdtemp(prefix="hgfx_segments_", dir=output_path.parent))
+
+        def encode_segment(index, first_frame, count):
+            segment_path = segment_dir / f"segment_{index:04d}{output_path.suffix}"
+            cmd = [
+                self.ffmpeg_path,
+                '-framerate', str(framerate),
+                '-start_number', str(first_frame),
+                '-i', input_pattern,
+                '-frames:v', str(count),
+                '-threads', str(threads),
+            ]
+            cmd.extend(self.get_codec_args(codec, quality, high_bit_depth, chroma))
+            cmd.extend(gop_args)
+            cmd.extend(['-y', str(segment_path)])
+
+            # FFmpeg reads keyboard commands from stdin; keep parallel
+            # workers from competing for it
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=3600,
+                                    stdin=subprocess.DEVNULL)
+            if result.returncode != 0:
+                raise RuntimeError(f"Segment {index} failed: {result.stderr.strip()[-2000:]}")
+            return segment_path
+
+        try:
+            print(f"Encoding {frame_count} frames as {len(segments)} segments "
+                  f"with {workers} FFmpeg workers")
+
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(encode_segment, index, first_frame, count)
+                           for index, (first_frame, count) in enumerate(segments)]
+                segment_paths = [future.result() for future in futures]
+
+            return self.concat_segments(segment_paths, str(output_path))
+
+        except subprocess.TimeoutExpired:
+            print("FFmpeg encoding timed out")
+            return False
+        except Exception as e:
+            print(f"Error running FFmpeg: {e}")
+            return False
+
+        finally:
+            shutil.rmtree(segment_dir, ignore_errors=True)
+
+    @staticmethod
+    def plan_segments(frame_count, start_number=1, segment_frames=240, gop_size=1):
+        """
+        Split a frame range into GOP-aligned segments
+
+        Returns:
+            list: (first frame number, frame count) per segment
+        """
+        gop_size = max(1, int(gop_size))
+        length = max(gop_size, -(-int(segment_frames) // gop_size) * gop_size)
+
+        segments = []
+        for offset in range(0, frame_count, length):
+            segments.append((start_number + offset, min(length, frame_count - offset)))
+        return segments
+
+    def concat_segments(self, segment_paths, output_path):
+        """
+        Join encoded segments into one file without re-encoding
+
+        Args:
+            segment_paths: Segment files, in order
+            output_path: Output video file path
+
+        Returns:
+            bool: True if successful
+        """
+        list_path = Path(segment_paths[0]).parent / "segments.txt"
+        with open(list_path, 'w', encoding='utf-8') as f:
+            for path in segment_paths:
+                # Escape single quotes for the concat demuxer
+                escaped = str(Path(path).resolve()).replace("'", "'\\''")
+                f.write(f"file '{escaped}'\n")
 
-        # Build FFmpeg command
         cmd = [
             self.ffmpeg_path,
-            '-framerate', str(framerate),
-            '-start_number', str(start_number),
-            '-i', input_pattern,
-            '-c:v', codec_settings['codec'],
+            '-f', 'concat',
+            '-safe', '0',
+            '-i', str(list_path),
+            '-c', 'copy',
+            '-y', output_path
         ]
 
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=3600,
+                                    stdin=subprocess.DEVNULL)
+            if result.returncode == 0:
+                print(f"Video encoded successfully: {output_path}")
+                return True
+            print(f"FFmpeg concat error: {result.stderr}")
+            return False
+        except Exception as e:
+            print(f"Error joining segments: {e}")
+            return False
+
+    def get_codec_args(self, codec='H264', quality='high', high_bit_depth=False, chroma='422'):
+        """
+        Build the output codec arguments for a VIDEO_CODECS entry
+
+        Args:
+            codec: Video codec (H264, H265, PRORES, DNXHD)
+            quality: Quality preset (high, medium, low)
+            high_bit_depth: Encode 10-bit (codecs in HIGH_BIT_DEPTH_FORMATS)
+            chroma: Chroma subsampling at high bit depth ('422' or '444')
+
+        Returns:
+            list: FFmpeg arguments
+        """
+        codec_settings = VIDEO_CODECS.get(codec, VIDEO_CODECS['H264'])
+        hbd = self.get_high_bit_depth_format(codec, chroma) if high_bit_depth else None
+        args = ['-c:v', codec_settings['codec']]
+
         # Add codec-specific settings
         if codec == 'PRORES':
-            cmd.extend(['-profile:v', codec_settings['profile']])
+            args.extend(['-profile:v', hbd['profile'] if hbd else codec_settings['profile']])
         elif codec in ['H264', 'H265']:
             crf = codec_settings['crf']
             if quality == 'high':
                 crf -= 2
             elif quality == 'low':
                 crf += 2
-            cmd.extend(['-crf', str(crf)])
+            args.extend(['-crf', str(crf)])
         elif codec == 'DNXHD':
-            cmd.extend(['-b:v', codec_settings['bitrate']])
+            if hbd:
+                # DNxHR profiles work at any resolution and set their own bitrate
+                args.extend(['-profile:v', hbd['profile']])
+            else:
+                args.extend(['-b:v', codec_settings['bitrate']])
 
         # Add output settings
-        cmd.extend([
-            '-pix_fmt', 'yuv420p',
-            '-y',  # Overwrite output file
-            output_path
-        ])
+        args.extend(['-pix_fmt', hbd['pix_fmt'] if hbd else 'yuv420p'])
+        return args
 
-        try:
-            print(f"Running FFmpeg: {' '.join(cmd)}")
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=3600  # 1 hour timeout
-            )
+    @staticmethod
+    def get_high_bit_depth_format(codec, chroma='422'):
+        """
+        Get the 10-bit output settings for a codec
 
-            if result.returncode == 0:
-                print(f"Video encoded successfully: {output_path}")
-                return True
-            else:
-                print(f"FFmpeg error: {result.stderr}")
-                return False
+        Returns:
+            dict: {'pix_fmt', 'profile'?} from HIGH_BIT_DEPTH_FORMATS
+        """
+        formats = HIGH_BIT_DEPTH_FORMATS.get(codec)
+        if formats is None:
+            raise ValueError(f"{codec} has no high bit depth format")
+        if chroma not in formats:
+            raise ValueError(f"Unsupported chroma subsampling for {codec}: {chroma}")
+        return formats[chroma]
 
-        except subprocess.TimeoutExpired:
-            print("FFmpeg encoding timed out")
-            return False
-        except Exception as e:
-            print(f"Error running FFmpeg: {e}")
-            return False
+    def get_output_pix_fmt(self, codec, high_bit_depth=False, chroma='422'):
+        """Get the pixel format an encode will write"""
+        if high_bit_depth:
+            return self.get_high_bit_depth_format(codec, chroma)['pix_fmt']
+        return 'yuv420p'
+
+    def open_rawvideo_encoder(self, output_path, width, height, codec='H264',
+                              framerate=24, quality='high', pix_fmt='rgb24',
+                              high_bit_depth=False, chroma='422'):
+        """
+        Start an encoder that takes raw frames on stdin
+
+        Frames are encoded as they are written, so no temporary image files
+        are needed and encoding overlaps with rendering.
+
+        Args:
+            output_path: Output video file path
+            width, height: Frame size in pixels
+            codec: Video codec (H264, H265, PRORES, DNXHD)
+            framerate: Frame rate of the video
+            quality: Quality preset (high, medium, low)
+            pix_fmt: Raw input layout ('rgb24', 'rgba', 'rgb48le', 'rgba64le'
+                     or 'gbrpf32le'); use 16-bit or float input with
+                     high_bit_depth so precision is kept end to end
+            high_bit_depth: Encode 10-bit (see HIGH_BIT_DEPTH_FORMATS)
+            chroma: Chroma subsampling at high bit depth ('422' or '444')
+
+        Returns:
+            RawVideoEncoder: Encoder accepting frames through write_frame()
+        """
+        if not self.check_ffmpeg_available():
+            raise RuntimeError("FFmpeg is not available")
+
+        cmd = [
+            self.ffmpeg_path,
+            '-f', 'rawvideo',
+            '-pix_fmt', pix_fmt,
+            '-s', f'{width}x{height}',
+            '-framerate', str(framerate),
+            '-i', 'pipe:0',
+        ]
+        cmd.extend(self.get_codec_args(codec, quality, high_bit_depth, chroma))
+        cmd.extend(['-y', output_path])
+
+        print(f"Running FFmpeg: {' '.join(cmd)}")
+        return RawVideoEncoder(cmd, width, height, pix_fmt)
 
     def create_proxy(self, input_path, output_path, resolution='720p'):
         """Create a proxy video for preview"""
         if not self.check_ffmpeg_available():
             raise RuntimeError("FFmpeg is not available")
 
-        resolution_map = {
-            '360p': '640:360',
-            '480p': '854:480',
-            '720p': '1280:720',
-            '1080p': '1920:1080',
-        }
-
-        scale = resolution_map.get(resolution, '1280:720')
+        scale = PROXY_RESOLUTIONS.get(resolution, '1280:720')
 
         cmd = [
             self.ffmpeg_path,
@@ -132,6 +575,98 @@ class FFmpegHandler:
             print(f"Error creating proxy: {e}")
             return False
 
+    def create_proxy_ladder(self, input_path, output_dir=None,
+                            resolutions=('360p', '720p', '1080p'), crf=23, preset='fast'):
+        """
+        Create proxies at several resolutions from a single decode
+
+        The source is decoded once and split into one scaled branch per
+        rung. A proxy_manifest.json in the output directory records what
+        was made from which source, so rungs that are already up to date
+        are skipped (and FFmpeg is not run at all if none are missing).
+
+        Args:
+            input_path: Source video file path
+            output_dir: Proxy directory (default: a 'proxies' folder next
+                        to the source)
+            resolutions: Keys of PROXY_RESOLUTIONS to create
+            crf: H.264 CRF for the proxies
+            preset: x264 preset
+
+        Returns:
+            dict: Resolution -> proxy path for every requested rung, or
+                  None if encoding failed
+        """
+        input_path = Path(input_path)
+        output_dir = Path(output_dir) if output_dir else input_path.parent / "proxies"
+
+        unknown = [res for res in resolutions if res not in PROXY_RESOLUTIONS]
+        if unknown:
+            raise ValueError(f"Unknown proxy resolution(s): {', '.join(unknown)}")
+
+        stat = input_path.stat()
+        source = {'mtime': stat.st_mtime, 'size': stat.st_size}
+        settings = {'crf': crf, 'preset': preset}
+
+        manifest_path = output_dir / "proxy_manifest.json"
+        manifest = _load_json(manifest_path)
+        entry = manifest.get(str(input_path.resolve()), {})
+        if entry.get('source') != source or entry.get('settings') != settings:
+            entry = {'source': source, 'settings': settings, 'proxies': {}}
+
+        proxies = {res: output_dir / f"{input_path.stem}_{res}.mp4" for res in resolutions}
+        missing = [res for res in resolutions
+                   if entry['proxies'].get(res) != proxies[res].name or not proxies[res].exists()]
+
+        if missing:
+            if not self.check_ffmpeg_available():
+                raise RuntimeError("FFmpeg is not available")
+
+            output_dir.mkdir(parents=True, exist_ok=True)
+
+            # One decode, split into a scaled branch per rung
+            labels = [f"[s{i}]" for i in range(len(missing))]
+            graph = [f"[0:v]split={len(missing)}{''.join(labels)}"]
+            for i, res in enumerate(missing):
+                graph.append(f"{labels[i]}scale={PROXY_RESOLUTIONS[res]}[v{i}]")
+
+            cmd = [
+                self.ffmpeg_path,
+                '-i', str(input_path),
+                '-filter_complex', ';'.join(graph),
+            ]
+            for i, res in enumerate(missing):
+                cmd.extend([
+                    '-map', f'[v{i}]',
+                    '-map', '0:a?',
+                    '-c:v', 'libx264',
+                    '-crf', str(crf),
+                    '-preset', preset,
+                    '-c:a', 'aac',
+                    '-y', str(proxies[res]),
+                ])
+
+            try:
+                result = subprocess.run(cmd, capture_output=True, text=True,
+                                        stdin=subprocess.DEVNULL)
+            except Exception as e:
+                print(f"Error creating proxies: {e}")
+                return None
+
+            if result.returncode != 0:
+                print(f"FFmpeg error: {result.stderr}")
+                return None
+
+            for res in missing:
+                entry['proxies'][res] = proxies[res].name
+
+            # Re-read so proxies written meanwhile for other clips are kept
+            manifest = _load_json(manifest_path)
+            manifest[str(input_path.resolve())] = entry
+            _save_json(manifest_path, manifest)
+
+        return {res: str(path) for res, path in proxies.items()}
+
     def extract_frames(self, video_path, output_pattern, start_frame=None,
                       end_frame=None, format='png'):
         """Extract frames from a video"""
@@ -162,8 +697,194 @@ class FFmpegHandler:
             print(f"Error extracting frames: {e}")
             return False
 
-    def get_video_info(self, video_path):
-        """Get video information using ffprobe"""
+    def get_video_stream(self, video_path):
+        """
+        Get size and frame rate of a video's first video stream
+
+        Returns:
+            dict: {'width', 'height', 'fps', 'frames'} ('frames' may be None)
+        """
+        info = self.get_video_info(video_path)
+        if not info:
+            raise RuntimeError(f"Cannot read video info: {video_path}")
+
+        stream = next((s for s in info.get('streams', []) if s.get('codec_type') == 'video'), None)
+        if stream is None:
+            raise RuntimeError(f"No video stream in {video_path}")
+
+        num, _, den = stream.get('r_frame_rate', '24/1').partition('/')
+        fps = float(num) / float(den or 1) if float(den or 1) else 24.0
+        frames = stream.get('nb_frames')
+
+        return {
+            'width': int(stream['width']),
+            'height': int(stream['height']),
+            'fps': fps,
+            'frames': int(frames) if frames and frames.isdigit() else None,
+        }
+
+    def decode_frames(self, video_path, start_frame=0, end_frame=None, scale=None,
+                      pix_fmt='rgb48le'):
+        """
+        Decode a video into NumPy frames without writing image files
+
+        FFmpeg writes raw frames to a pipe that is read into one reusable
+        buffer, so memory use does not grow with the clip length.
+
+        Args:
+            video_path: Video file path
+            start_frame: First frame to decode (0-based)
+            end_frame: Last frame to decode, inclusive (None = to the end)
+            scale: Output size factor (e.g. 0.5) or (width, height); None
+                   keeps the source size
+            pix_fmt: 'rgb48le' (16-bit) or 'gbrpf32le' (float, keeps values
+                     outside 0-1)
+
+        Yields:
+            tuple: (frame number, float32 array of shape (height, width, 3)),
+                   rows top to bottom. The array is reused for the next
+                   frame; copy it to keep it.
+        """
+        if pix_fmt not in ('rgb48le', 'gbrpf32le'):
+            raise ValueError(f"Unsupported decode pixel format: {pix_fmt}")
+
+        if not self.check_ffmpeg_available():
+            raise RuntimeError("FFmpeg is not available")
+
+        stream = self.get_video_stream(video_path)
+        width, height = stream['width'], stream['height']
+
+        if isinstance(scale, (tuple, list)):
+            width, height = int(scale[0]), int(scale[1])
+        elif scale is not None and scale != 1.0:
+            # Keep sizes even for chroma-subsampled sources
+            width = max(2, int(round(width * scale / 2)) * 2)
+            height = max(2, int(round(height * scale / 2)) * 2)
+
+        cmd = [self.ffmpeg_path, '-v', 'error']
+        if start_frame:
+            # Seek before the input; FFmpeg decodes from the previous
+            # keyframe and drops frames up to the exact time
+            cmd.extend(['-ss', f"{start_frame / stream['fps']:.6f}"])
+        cmd.extend(['-i', str(video_path)])
+
+        if end_frame is not None:
+            cmd.extend(['-frames:v', str(max(0, end_frame - start_frame + 1))])
+        if (width, height) != (stream['width'], stream['height']):
+            cmd.extend(['-vf', f'scale={width}:{height}:flags=area'])
+
+        cmd.extend(['-an', '-f', 'rawvideo', '-pix_fmt', pix_fmt, 'pipe:1'])
+
+        if pix_fmt == 'rgb48le':
+            raw = np.empty((height, width, 3), dtype='<u2')
+        else:
+            raw = np.empty((3, height, width), dtype='<f4')
+        frame_buffer = np.empty((height, width, 3), dtype=np.float32)
+        raw_view = memoryview(raw).cast('B')
+
+        process = subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        )
+
+        # Drain stderr so a chatty FFmpeg never blocks on a full pipe while
+        # frames are read from stdout
+        stderr_tail = deque(maxlen=50)
+        stderr_thread = threading.Thread(target=_drain_lines, args=(process.stderr, stderr_tail),
+                                         daemon=True)
+        stderr_thread.start()
+
+        try:
+            frame = start_frame
+            while end_frame is None or frame <= end_frame:
+                if not _read_exact(process.stdout, raw_view):
+                    break
+
+                if pix_fmt == 'rgb48le':
+                    np.multiply(raw, 1.0 / 65535.0, out=frame_buffer, casting='unsafe')
+                else:
+                    # Planes are stored G, B, R
+                    frame_buffer[..., 0] = raw[2]
+                    frame_buffer[..., 1] = raw[0]
+                    frame_buffer[..., 2] = raw[1]
+
+                yield frame, frame_buffer
+                frame += 1
+
+            returncode = process.wait()
+            stderr_thread.join(timeout=5)
+            if returncode != 0:
+                error = '\n'.join(stderr_tail)
+                raise RuntimeError(f"FFmpeg decode failed: {error}")
+
+        finally:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            process.stdout.close()
+            process.stderr.close()
+
+    def get_video_info(self, video_path, use_cache=True):
+        """
+        Get video information using ffprobe
+
+        Results are cached by path, size and modification time (see
+        media_probe), so asking again about an unchanged file is instant.
+        The cache index is written at most every DEFAULT_FLUSH_INTERVAL
+        seconds from here; use probe_files() for many files.
+        """
+        cache = get_media_probe_cache() if use_cache else None
+        if cache is not None:
+            info = cache.get(video_path)
+            if info is not None:
+                return info
+
+        info = self._run_ffprobe(video_path)
+        if info is not None and cache is not None:
+            cache.put(video_path, info)
+            cache.flush(min_interval=DEFAULT_FLUSH_INTERVAL)
+        return info
+
+    def probe_files(self, paths, workers=8):
+        """
+        Get video information for many files at once
+
+        Cached results are returned directly; the rest are probed with up
+        to `workers` concurrent ffprobe processes and the cache is written
+        once at the end.
+
+        Args:
+            paths: Media file paths
+            workers: Concurrent ffprobe processes
+
+        Returns:
+            dict: Path (as given) -> parsed ffprobe JSON, or None if it
+                  could not be probed
+        """
+        cache = get_media_probe_cache()
+        results = {}
+        missing = []
+
+        for path in paths:
+            info = cache.get(path)
+            if info is None:
+                missing.append(path)
+            results[path] = info
+
+        if missing:
+            with ThreadPoolExecutor(max_workers=max(1, int(workers))) as pool:
+                for path, info in zip(missing, pool.map(self._run_ffprobe, missing)):
+                    results[path] = info
+                    if info is not None:
+                        cache.put(path, info)
+            cache.flush()
+
+        return results
+
+    def _run_ffprobe(self, video_path):
+        """Run ffprobe on one file"""
         ffprobe_path = self.ffmpeg_path.replace('ffmpeg', 'ffprobe')
 
         cmd = [
@@ -172,13 +893,13 @@ class FFmpegHandler:
             '-print_format', 'json',
             '-show_format',
             '-show_streams',
-            video_path
+            str(video_path)
         ]
 
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = subprocess.run(cmd, capture_output=True, text=True,
+                                    stdin=subprocess.DEVNULL)
             if result.returncode == 0:
-                import json
                 return json.loads(result.stdout)
             return None
         except Exception as e:
@@ -186,9 +907,213 @@ class FFmpegHandler:
             return None
 
 
+def _load_json(path):
+    """Load a JSON dict, returning {} if it is missing or unreadable"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_json(path, data):
+    """Write a JSON file atomically"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _read_exact(stream, view):
+    """
+    Fill a memoryview from a pipe
+
+    Returns:
+        bool: False if the stream ended before a whole frame arrived
+    """
+    filled = 0
+    while filled < len(view):
+        count = stream.readinto(view[filled:])
+        if not count:
+            return False
+        filled += count
+    return True
+
+
+def _drain_lines(stream, tail):
+    """Read a pipe to the end, keeping its last lines in tail"""
+    for line in iter(stream.readline, b''):
+        tail.append(line.decode('utf-8', errors='replace').rstrip())
+
+
+# Raw input layouts: pix_fmt -> (channels, numpy dtype, max value)
+RAWVIDEO_FORMATS = {
+    'rgb24': (3, np.uint8, 255),
+    'rgba': (4, np.uint8, 255),
+    'rgb48le': (3, np.dtype('<u2'), 65535),
+    'rgba64le': (4, np.dtype('<u2'), 65535),
+    'gbrpf32le': (3, np.dtype('<f4'), None),
+}
+
+
+class RawVideoEncoder:
+    """
+    FFmpeg process fed with raw frames over stdin
+
+    Usage:
+        encoder = handler.open_rawvideo_encoder("out.mp4", 1920, 1080)
+        for pixels in frames:
+            encoder.write_frame(pixels)
+        ok = encoder.close()
+    """
+
+    def __init__(self, cmd, width, height, pix_fmt='rgb24'):
+        if pix_fmt not in RAWVIDEO_FORMATS:
+            raise ValueError(f"Unsupported raw pixel format: {pix_fmt}")
+
+        self.width = width
+        self.height = height
+        self.pix_fmt = pix_fmt
+        self.channels, self.dtype, self.max_value = RAWVIDEO_FORMATS[pix_fmt]
+        self.frames = 0
+
+        self.process = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE
+        )
+
+        # Drain stderr so FFmpeg never blocks on a full pipe; keep the tail
+        # for error reporting
+        self._stderr_tail = deque(maxlen=50)
+        self._stderr_thread = threading.Thread(target=_drain_lines,
+                                               args=(self.process.stderr, self._stderr_tail),
+                                               daemon=True)
+        self._stderr_thread.start()
+
+    @property
+    def error_output(self):
+        """Last lines FFmpeg wrote to stderr"""
+        return '\n'.join(self._stderr_tail)
+
+    def write_frame(self, pixels, flip=False):
+        """
+        Send one frame to FFmpeg
+
+        Args:
+            pixels: Array of shape (height, width, channels), rows top to
+                    bottom. Float values in 0-1 are quantized to the pipe's
+                    bit depth (gbrpf32le keeps floats); integer arrays of the
+                    pipe dtype go as is.
+            flip: Pixels are bottom row first (Blender image order)
+        """
+        pixels = np.asarray(pixels)
+        if pixels.shape[:2] != (self.height, self.width):
+            raise ValueError(
+                f"Frame is {pixels.shape[1]}x{pixels.shape[0]}, "
+                f"encoder expects {self.width}x{self.height}"
+            )
+
+        if flip:
+            pixels = pixels[::-1]
+        pixels = pixels[..., :self.channels]
+        if pixels.shape[2] < self.channels:
+            # Pad a missing alpha channel as opaque
+            alpha = np.full(pixels.shape[:2] + (1,), 1.0 if pixels.dtype.kind == 'f' else self.max_value,
+                            dtype=pixels.dtype)
+            pixels = np.concatenate([pixels, alpha], axis=-1)
+
+        if self.max_value is None:
+            # Planar float, stored G, B, R; values are passed unclipped
+            frame = np.ascontiguousarray(pixels[..., [1, 2, 0]].transpose(2, 0, 1), dtype=self.dtype)
+        else:
+            if pixels.dtype.kind == 'f':
+                pixels = np.clip(pixels, 0.0, 1.0) * self.max_value + 0.5
+            frame = np.ascontiguousarray(pixels, dtype=self.dtype)
+
+        try:
+            self.process.stdin.write(memoryview(frame).cast('B'))
+        except (BrokenPipeError, OSError) as e:
+            raise RuntimeError(f"FFmpeg stopped accepting frames: {self.error_output}") from e
+        self.frames += 1
+
+    def close(self, timeout=3600, rusage=False):
+        """
+        Finish encoding
+
+        Args:
+            timeout: Seconds to wait for FFmpeg to exit (None waits forever)
+            rusage: Also return FFmpeg's resource usage
+
+        Returns:
+            bool: True if FFmpeg exited successfully; with rusage=True a
+                  (success, usage) tuple, where usage is the os.wait4()
+                  resource usage of the FFmpeg process, or None where
+                  os.wait4() is unavailable (Windows) or FFmpeg timed out
+        """
+        try:
+            self.process.stdin.close()
+        except OSError:
+            pass
+
+        usage = None
+        try:
+            if rusage and hasattr(os, 'wait4'):
+                returncode, usage = self._wait4(timeout)
+            else:
+                returncode = self.process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+            print("FFmpeg encoding timed out")
+            return (False, None) if rusage else False
+
+        self._stderr_thread.join(timeout=5)
+        ok = returncode == 0
+        if not ok:
+            print(f"FFmpeg error: {self.error_output}")
+        return (ok, usage) if rusage else ok
+
+    def _wait4(self, timeout):
+        """Reap FFmpeg with os.wait4(), keeping Popen's returncode in sync"""
+        pid = self.process.pid
+        if timeout is None:
+            _, status, usage = os.wait4(pid, 0)
+        else:
+            deadline = time.monotonic() + timeout
+            while True:
+                reaped, status, usage = os.wait4(pid, os.WNOHANG)
+                if reaped:
+                    break
+                if time.monotonic() >= deadline:
+                    raise subprocess.TimeoutExpired(self.process.args, timeout)
+                time.sleep(0.01)
+
+        self.process.returncode = os.waitstatus_to_exitcode(status)
+        return self.process.returncode, usage
+
+    def abort(self):
+        """Stop FFmpeg without finishing the file"""
+        self.process.kill()
+        self.process.wait()
+
+
+# Handlers by executable path
+_ffmpeg_handlers = {}
+
+
 def get_ffmpeg_handler():
     """Get FFmpeg handler with preferences"""
     # Get base package name (remove subdirectory from package path)
     base_package = __package__.rsplit('.', 1)[0] if '.' in __package__ else __package__
     prefs = bpy.context.preferences.addons[base_package].preferences
-    return FFmpegHandler(prefs.ffmpeg_path)
+
+    handler = _ffmpeg_handlers.get(prefs.ffmpeg_path)
+    if handler is None:
+        handler = FFmpegHandler(prefs.ffmpeg_path)
+        _ffmpeg_handlers[prefs.ffmpeg_path] = handler
+    return handler
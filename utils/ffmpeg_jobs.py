@@ -0,0 +1,263 @@
+"""
+FFmpeg Job Runner for HyperGradeFX
+Runs FFmpeg in the background and tracks its progress
+"""
+
+import subprocess
+import threading
+import time
+from collections import deque
+
+
+# Job states
+JOB_QUEUED = 'QUEUED'
+JOB_RUNNING = 'RUNNING'
+JOB_DONE = 'DONE'
+JOB_FAILED = 'FAILED'
+JOB_CANCELLED = 'CANCELLED'
+
+_FINISHED_STATES = {JOB_DONE, JOB_FAILED, JOB_CANCELLED}
+
+
+class FFmpegJob:
+    """
+    One FFmpeg process run without blocking the caller
+
+    FFmpeg is started with '-progress pipe:1', and a reader thread parses
+    its key=value progress blocks as they arrive. Poll the attributes
+    (frame, fps, speed, fraction, state) from a timer or modal operator.
+
+    Usage:
+        job = FFmpegJob(cmd, total_frames=250, label="shot_010.mp4")
+        job.start()
+        ...
+        if job.finished:
+            print(job.state, job.error_output)
+    """
+
+    def __init__(self, cmd, total_frames=None, label="", on_finish=None):
+        """
+        Args:
+            cmd: FFmpeg command line (executable first)
+            total_frames: Expected output frames, for the progress fraction
+            label: Name shown in the UI
+            on_finish: Optional callable(job) run on the reader thread once
+                       the process exits
+        """
+        self.cmd = list(cmd)
+        self.total_frames = total_frames
+        self.label = label or (self.cmd[-1] if self.cmd else "FFmpeg")
+        self.on_finish = on_finish
+
+        self.state = JOB_QUEUED
+        self.frame = 0
+        self.fps = 0.0
+        self.speed = 0.0
+        self.out_time = 0.0
+        self.returncode = None
+        self.started_at = None
+        self.finished_at = None
+
+        self.process = None
+        self.queue = None
+        self._stderr_tail = deque(maxlen=50)
+        self._threads = []
+        self._cancel_requested = False
+
+    @property
+    def finished(self):
+        return self.state in _FINISHED_STATES
+
+    @property
+    def fraction(self):
+        """Progress in 0-1, or None when the frame count is unknown"""
+        if self.state == JOB_DONE:
+            return 1.0
+        if not self.total_frames:
+            return None
+        return min(1.0, self.frame / self.total_frames)
+
+    @property
+    def elapsed(self):
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+    @property
+    def error_output(self):
+        """Last lines FFmpeg wrote to stderr"""
+        return '\n'.join(self._stderr_tail)
+
+    def start(self):
+        """Launch FFmpeg and the progress reader threads"""
+        if self.state != JOB_QUEUED:
+            return
+
+        # Machine-readable progress on stdout instead of the stats line
+        cmd = [self.cmd[0], '-progress', 'pipe:1', '-nostats'] + self.cmd[1:]
+
+        try:
+            self.process = subprocess.Popen(
+                cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE
+            )
+        except OSError as e:
+            self._stderr_tail.append(str(e))
+            self._finish(JOB_FAILED)
+            return
+
+        self.state = JOB_RUNNING
+        self.started_at = time.monotonic()
+
+        stderr_thread = threading.Thread(target=self._read_stderr, daemon=True)
+        stdout_thread = threading.Thread(target=self._read_progress, daemon=True)
+        self._threads = [stderr_thread, stdout_thread]
+        stderr_thread.start()
+        stdout_thread.start()
+
+    def cancel(self):
+        """Stop the job (queued jobs never start)"""
+        self._cancel_requested = True
+        if self.state == JOB_QUEUED:
+            self._finish(JOB_CANCELLED)
+        elif self.state == JOB_RUNNING and self.process is not None:
+            self.process.terminate()
+
+    def wait(self, timeout=None):
+        """Block until the job finishes; returns True if it did in time"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for thread in self._threads:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            thread.join(remaining)
+        return self.finished
+
+    def _read_stderr(self):
+        for line in iter(self.process.stderr.readline, b''):
+            self._stderr_tail.append(line.decode('utf-8', errors='replace').rstrip())
+
+    def _read_progress(self):
+        """Parse '-progress' blocks until FFmpeg exits"""
+        for raw in iter(self.process.stdout.readline, b''):
+            key, _, value = raw.decode('utf-8', errors='replace').strip().partition('=')
+            self._update(key, value.strip())
+
+        self.returncode = self.process.wait()
+        for thread in self._threads:
+            if thread is not threading.current_thread():
+                thread.join(timeout=5)
+
+        if self._cancel_requested:
+            self._finish(JOB_CANCELLED)
+        elif self.returncode == 0:
+            self._finish(JOB_DONE)
+        else:
+            self._finish(JOB_FAILED)
+
+    def _update(self, key, value):
+        """Apply one progress field"""
+        try:
+            if key == 'frame':
+                self.frame = int(value)
+            elif key == 'fps':
+                self.fps = float(value)
+            elif key == 'speed' and value.endswith('x'):
+                self.speed = float(value[:-1])
+            elif key == 'out_time_us':
+                self.out_time = int(value) / 1_000_000
+        except ValueError:
+            # 'N/A' before the first frame is encoded
+            pass
+
+    def _finish(self, state):
+        self.state = state
+        self.finished_at = time.monotonic()
+        if self.on_finish is not None:
+            try:
+                self.on_finish(self)
+            except Exception as e:
+                print(f"HyperGradeFX: FFmpeg job callback failed: {e}")
+
+        # Start the next queued job even while the main thread is busy
+        if self.queue is not None:
+            self.queue.update()
+
+
+class FFmpegJobQueue:
+    """
+    Queue of FFmpeg jobs with a concurrency limit
+
+    update() starts queued jobs while there are free slots. It also runs
+    whenever a job finishes, so the queue keeps moving even while the main
+    thread is blocked (e.g. rendering); calling it from a timer as well
+    keeps the UI current. It never blocks.
+    """
+
+    def __init__(self, max_concurrent=1, history=20):
+        self.max_concurrent = max(1, int(max_concurrent))
+        self.jobs = []
+        self.history = history
+        # Re-entrant: a job that fails to start finishes inside update()
+        self._lock = threading.RLock()
+
+    def submit(self, job):
+        """Add a job; it starts as soon as a slot is free"""
+        job.queue = self
+        with self._lock:
+            self.jobs.append(job)
+        self.update()
+        return job
+
+    def update(self):
+        """
+        Start queued jobs and trim finished ones
+
+        Returns:
+            bool: True while any job is queued or running
+        """
+        with self._lock:
+            for job in list(self.jobs):
+                if job.state != JOB_QUEUED:
+                    continue
+                # Counted afresh each time: a job that fails to start finishes
+                # inside start(), and its nested update() may start others
+                if self._running_count() >= self.max_concurrent:
+                    break
+                job.start()
+
+            finished = [job for job in self.jobs if job.finished]
+            for job in finished[:max(0, len(finished) - self.history)]:
+                self.jobs.remove(job)
+
+            return any(not job.finished for job in self.jobs)
+
+    def _running_count(self):
+        return sum(1 for job in self.jobs if job.state == JOB_RUNNING)
+
+    def active_jobs(self):
+        """Jobs that are queued or running"""
+        with self._lock:
+            return [job for job in self.jobs if not job.finished]
+
+    def cancel_all(self):
+        """Cancel every queued and running job"""
+        for job in self.active_jobs():
+            job.cancel()
+
+    def clear_finished(self):
+        """Forget finished jobs"""
+        with self._lock:
+            self.jobs = [job for job in self.jobs if not job.finished]
+
+
+# Shared queue instance
+_job_queue = None
+
+
+def get_job_queue():
+    """Get the shared FFmpeg job queue"""
+    global _job_queue
+    if _job_queue is None:
+        _job_queue = FFmpegJobQueue()
+    return _job_queue
@@ -0,0 +1,104 @@
+"""
+Held Frame Detection for HyperGradeFX
+Spots frames identical to the previous one so exports can reuse its file
+"""
+
+import hashlib
+import os
+import shutil
+
+import numpy as np
+
+
+class FrameDeduplicator:
+    """
+    Detect frames that repeat the previous frame
+
+    Each frame is fingerprinted by hashing a decimated copy of its pixels
+    (every step-th row and column), which costs a few milliseconds even for
+    4K frames. With exact=True a fingerprint match is confirmed against a
+    full copy of the previous frame, so changes between the sampled pixels
+    are never missed.
+
+    Usage:
+        dedup = FrameDeduplicator()
+        for frame in frames:
+            if dedup.is_repeat(pixels):
+                link_or_copy(previous_path, path)
+    """
+
+    def __init__(self, exact=True, step=8):
+        self.exact = exact
+        self.step = max(1, int(step))
+        self.repeats = 0
+        self._fingerprint = None
+        self._previous = None
+
+    def fingerprint(self, pixels):
+        """Hash of the decimated pixels"""
+        sample = np.ascontiguousarray(pixels[::self.step, ::self.step])
+        digest = hashlib.blake2b(sample.tobytes(), digest_size=16)
+        digest.update(repr(pixels.shape).encode('ascii'))
+        return digest.digest()
+
+    def is_repeat(self, pixels):
+        """
+        Check a frame against the previous one and remember it
+
+        Returns:
+            bool: True if the frame matches the previous frame
+        """
+        fingerprint = self.fingerprint(pixels)
+        if fingerprint == self._fingerprint and (
+                not self.exact or np.array_equal(self._previous, pixels)):
+            self.repeats += 1
+            return True
+
+        self._fingerprint = fingerprint
+        if self.exact:
+            if self._previous is None or self._previous.shape != pixels.shape:
+                self._previous = np.empty_like(pixels)
+            np.copyto(self._previous, pixels)
+        return False
+
+    def reset(self):
+        """Forget the previous frame (e.g. after a frame was skipped)"""
+        self._fingerprint = None
+
+
+def break_hardlink(filepath):
+    """
+    Remove a file that shares its data with other hardlinks
+
+    Writers that overwrite in place would otherwise change every linked
+    frame at once.
+    """
+    try:
+        if os.stat(filepath).st_nlink > 1:
+            os.unlink(filepath)
+    except OSError:
+        pass
+
+
+def link_or_copy(source, destination):
+    """
+    Make destination a hardlink to source, or a copy where links fail
+
+    Returns:
+        str: 'link' or 'copy'
+    """
+    source = str(source)
+    destination = str(destination)
+
+    try:
+        os.unlink(destination)
+    except FileNotFoundError:
+        pass
+
+    try:
+        os.link(source, destination)
+        return 'link'
+    except OSError:
+        # Different volume, FAT/exFAT, or links not permitted
+        shutil.copy2(source, destination)
+        return 'copy'
@@ -0,0 +1,230 @@
+"""
+Headless Color Grade Stack Evaluator
+Runs the 7-stage color grade stack on NumPy images without the compositor
+"""
+
+import copy
+
+import numpy as np
+
+from . import color_ops
+from .constants import GRADE_STACK_STAGES
+
+
+# Samples taken from a node's curve mapping when reading curves
+CURVE_SAMPLES = 256
+
+# Default parameters for each stage (neutral settings of the created nodes)
+GRADE_STACK_DEFAULTS = {
+    'exposure': {
+        'exposure': 0.0,
+    },
+    'white_balance': {
+        'fac': 0.0,
+        'color': (0.8, 0.8, 0.8),
+        'blend_type': 'ADD',
+        'use_clamp': False,
+    },
+    'contrast': {
+        'bright': 0.0,
+        'contrast': 0.0,
+    },
+    'saturation': {
+        'hue': 0.5,
+        'saturation': 1.0,
+        'value': 1.0,
+        'fac': 1.0,
+    },
+    'color_wheels': dict(color_ops.color_correction_defaults(), mask=1.0),
+    'curves': {
+        'combined': None,
+        'red': None,
+        'green': None,
+        'blue': None,
+        'black': (0.0, 0.0, 0.0),
+        'white': (1.0, 1.0, 1.0),
+        'fac': 1.0,
+    },
+    'final_adjust': {
+        'hue': 0.5,
+        'saturation': 1.0,
+        'value': 1.0,
+        'fac': 1.0,
+    },
+}
+
+
+class GradeStackEvaluator:
+    """
+    Evaluate the color grade stack created by HGFX_OT_CreateColorGradeStack
+
+    Parameters are a dict keyed by stage (see GRADE_STACK_DEFAULTS). They
+    can be read from a compositor node tree with from_node_tree() or given
+    directly, so already-rendered frames can be regraded in a background
+    worker without running the compositor.
+
+    Usage:
+        evaluator = GradeStackEvaluator.from_node_tree(scene.node_tree)
+        graded = evaluator.evaluate(pixels)
+    """
+
+    def __init__(self, params=None):
+        self.params = copy.deepcopy(GRADE_STACK_DEFAULTS)
+        for stage, values in (params or {}).items():
+            if stage not in self.params:
+                raise ValueError(f"Unknown grade stage: {stage}")
+            self.params[stage].update(values)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Create an evaluator from a parameter dict (e.g. loaded from JSON)"""
+        return cls(data)
+
+    @classmethod
+    def from_node_tree(cls, node_tree):
+        """
+        Create an evaluator from the grade stack nodes in a node tree
+
+        Stage nodes are found by their labels. Only unlinked input values
+        are read; stages missing from the tree keep their neutral defaults.
+        """
+        nodes_by_label = {node.label: node for node in node_tree.nodes}
+        params = {}
+
+        for stage, label in GRADE_STACK_STAGES:
+            node = nodes_by_label.get(label)
+            if node is not None:
+                params[stage] = _read_stage(stage, node)
+
+        return cls(params)
+
+    def to_dict(self):
+        """Get the stage parameters as a JSON-serializable dict"""
+        data = copy.deepcopy(self.params)
+        for values in data.values():
+            for key, value in values.items():
+                if isinstance(value, tuple):
+                    values[key] = list(value)
+        return data
+
+    def evaluate(self, pixels):
+        """
+        Apply all seven stages to an image
+
+        Args:
+            pixels: Array of shape (..., 3) or (..., 4)
+
+        Returns:
+            numpy.ndarray: Graded float32 array of the same shape
+        """
+        p = self.params
+
+        result = color_ops.exposure(pixels, p['exposure']['exposure'])
+
+        wb = p['white_balance']
+        result = color_ops.mix_rgb(result, wb['color'], wb['fac'],
+                                   wb['blend_type'], wb['use_clamp'])
+
+        result = color_ops.bright_contrast(result, p['contrast']['bright'],
+                                           p['contrast']['contrast'])
+
+        sat = p['saturation']
+        result = color_ops.hue_sat_value(result, sat['hue'], sat['saturation'],
+                                         sat['value'], sat['fac'])
+
+        wheels = p['color_wheels']
+        result = color_ops.color_correction(result, wheels, wheels['mask'])
+
+        curves = p['curves']
+        result = color_ops.rgb_curves(result, curves['combined'], curves['red'],
+                                      curves['green'], curves['blue'],
+                                      curves['black'], curves['white'], curves['fac'])
+
+        final = p['final_adjust']
+        result = color_ops.hue_sat_value(result, final['hue'], final['saturation'],
+                                         final['value'], final['fac'])
+
+        return result
+
+    def apply_to_image(self, image, tile_size=512, max_memory_mb=64):
+        """
+        Grade a Blender image in place, tile by tile
+
+        Args:
+            image: bpy.types.Image object or numpy array
+            tile_size: Tile edge length
+            max_memory_mb: Passed on to ImageIOHandler.iter_tiles()
+
+        Returns:
+            int: Number of tiles processed
+        """
+        from .openimageio_handler import ImageIOHandler
+
+        return ImageIOHandler.apply_tiled(image, self.evaluate, tile_size=tile_size,
+                                          max_memory_mb=max_memory_mb)
+
+
+def _input_value(node, name, default):
+    """Get an input socket's default value, falling back when missing"""
+    socket = node.inputs.get(name)
+    if socket is None or not hasattr(socket, 'default_value'):
+        return default
+    value = socket.default_value
+    return tuple(value) if hasattr(value, '__len__') else float(value)
+
+
+def _sample_curve(mapping, curve):
+    """Sample a curve mapping curve into (x, y) points"""
+    xs = np.linspace(0.0, 1.0, CURVE_SAMPLES)
+    return [[float(x), float(mapping.evaluate(curve, x))] for x in xs]
+
+
+def _read_stage(stage, node):
+    """Read one stage's parameters from its compositor node"""
+    if stage == 'exposure':
+        return {'exposure': _input_value(node, 'Exposure', 0.0)}
+
+    if stage == 'white_balance':
+        return {
+            'fac': float(node.inputs[0].default_value),
+            'color': tuple(node.inputs[2].default_value)[:3],
+            'blend_type': node.blend_type,
+            'use_clamp': bool(node.use_clamp),
+        }
+
+    if stage == 'contrast':
+        return {
+            'bright': _input_value(node, 'Bright', 0.0),
+            'contrast': _input_value(node, 'Contrast', 0.0),
+        }
+
+    if stage in ('saturation', 'final_adjust'):
+        return {
+            'hue': _input_value(node, 'Hue', 0.5),
+            'saturation': _input_value(node, 'Saturation', 1.0),
+            'value': _input_value(node, 'Value', 1.0),
+            'fac': _input_value(node, 'Fac', 1.0),
+        }
+
+    if stage == 'color_wheels':
+        params = {key: getattr(node, key, default)
+                  for key, default in color_ops.color_correction_defaults().items()}
+        params['mask'] = _input_value(node, 'Mask', 1.0)
+        return params
+
+    if stage == 'curves':
+        mapping = node.mapping
+        mapping.initialize()
+        curves = mapping.curves
+        # Blender stores the RGB curves as R, G, B, then Combined
+        return {
+            'combined': _sample_curve(mapping, curves[3]),
+            'red': _sample_curve(mapping, curves[0]),
+            'green': _sample_curve(mapping, curves[1]),
+            'blue': _sample_curve(mapping, curves[2]),
+            'black': _input_value(node, 'Black Level', (0.0, 0.0, 0.0))[:3],
+            'white': _input_value(node, 'White Level', (1.0, 1.0, 1.0))[:3],
+            'fac': _input_value(node, 'Fac', 1.0),
+        }
+
+    return {}
@@ -0,0 +1,391 @@
+"""
+3D LUT Baking for HyperGradeFX
+Bakes per-pixel color chains into a 3D LUT and applies it to images
+"""
+
+from pathlib import Path
+
+import numpy as np
+
+from . import color_ops
+from .blueprint_interpreter import BlueprintInterpreter, GROUP_INPUT, GROUP_OUTPUT
+
+
+# Common lattice sizes (points per axis)
+LUT_SIZES = (17, 33, 65)
+
+# How lattice coordinates map to scene linear input values
+LUT_SHAPERS = ('SRGB', 'LINEAR')
+
+LUT_INTERPOLATIONS = ('TRILINEAR', 'TETRAHEDRAL')
+
+# Blueprint node types whose output color depends only on the input color
+POINTWISE_NODE_TYPES = {
+    'CompositorNodeColorCorrection',
+    'CompositorNodeHueSat',
+    'CompositorNodeMixRGB',
+    'CompositorNodeBrightContrast',
+    'CompositorNodeExposure',
+    'CompositorNodeMath',
+    'CompositorNodeValToRGB',
+    'CompositorNodeCurveRGB',
+    'CompositorNodeColorBalance',
+}
+
+
+class LUT3D:
+    """
+    A 3D color lookup table
+
+    table has shape (size, size, size, 3) and is indexed [r, g, b]. The
+    lattice covers 0-1 in shaper space: with the SRGB shaper, inputs are
+    sRGB-encoded before lookup (better precision in the shadows); with the
+    LINEAR shaper, inputs are scaled from domain_min..domain_max. Outputs
+    are scene linear.
+
+    Scene linear footage goes above 1.0, which the SRGB lattice does not
+    cover. Pass apply() a fallback (the function the LUT was baked from)
+    to grade such pixels directly; without one they are clamped to the
+    lattice edge.
+    """
+
+    def __init__(self, table, shaper='SRGB', domain_min=0.0, domain_max=1.0, title=""):
+        table = np.asarray(table, dtype=np.float32)
+        if table.ndim != 4 or table.shape[:3] != (table.shape[0],) * 3 or table.shape[3] != 3:
+            raise ValueError(f"LUT table must have shape (N, N, N, 3), got {table.shape}")
+        if shaper not in LUT_SHAPERS:
+            raise ValueError(f"Unknown LUT shaper: {shaper}")
+
+        self.table = table
+        self.shaper = shaper
+        self.domain_min = float(domain_min)
+        self.domain_max = float(domain_max)
+        self.title = title
+
+    @property
+    def size(self):
+        return self.table.shape[0]
+
+    @classmethod
+    def lattice(cls, size, shaper='SRGB', domain_min=0.0, domain_max=1.0):
+        """
+        Get the scene linear input colors for every lattice point
+
+        Returns:
+            numpy.ndarray: Array of shape (size, size, size, 3)
+        """
+        axis = np.linspace(0.0, 1.0, size, dtype=np.float32)
+        r, g, b = np.meshgrid(axis, axis, axis, indexing='ij')
+        coords = np.stack([r, g, b], axis=-1)
+
+        if shaper == 'SRGB':
+            return color_ops.srgb_to_linear(coords)
+        return domain_min + coords * (domain_max - domain_min)
+
+    @classmethod
+    def bake(cls, func, size=33, shaper='SRGB', domain_min=0.0, domain_max=1.0, title=""):
+        """
+        Bake a per-pixel color function into a LUT
+
+        Args:
+            func: Callable taking an (..., 4) RGBA float32 array and
+                  returning an array of the same shape
+            size: Points per lattice axis (33 or 65 are typical)
+            shaper: SRGB or LINEAR lattice spacing
+            domain_min, domain_max: Input range for the LINEAR shaper
+        """
+        if size < 2:
+            raise ValueError("LUT size must be at least 2")
+
+        colors = cls.lattice(size, shaper, domain_min, domain_max)
+        rgba = np.concatenate([colors, np.ones(colors.shape[:-1] + (1,), np.float32)], axis=-1)
+
+        # Evaluate one red slab at a time to keep 65^3 bakes small
+        table = np.empty((size, size, size, 3), dtype=np.float32)
+        for r in range(size):
+            table[r] = np.asarray(func(rgba[r]), dtype=np.float32)[..., :3]
+
+        return cls(table, shaper, domain_min, domain_max, title)
+
+    def _shaper_coords(self, rgb):
+        """Map scene linear colors to shaper space (0-1 inside the lattice)"""
+        if self.shaper == 'SRGB':
+            return color_ops.linear_to_srgb(rgb)
+        span = self.domain_max - self.domain_min or 1.0
+        return (rgb - self.domain_min) / span
+
+    def in_domain(self, pixels):
+        """
+        Check which pixels the lattice covers
+
+        Returns:
+            numpy.ndarray: bool array of shape pixels.shape[:-1]
+        """
+        coords = self._shaper_coords(np.asarray(pixels, dtype=np.float32)[..., :3])
+        return np.all((coords >= 0.0) & (coords <= 1.0), axis=-1)
+
+    def apply(self, pixels, interpolation='TETRAHEDRAL', fallback=None):
+        """
+        Apply the LUT to an image
+
+        Args:
+            pixels: Array of shape (..., 3) or (..., 4); alpha is kept
+            interpolation: TRILINEAR or TETRAHEDRAL
+            fallback: Optional callable grading pixels outside the lattice
+                      directly (an (N, channels) array in, same shape out);
+                      without it they are clamped to the lattice edge
+
+        Returns:
+            numpy.ndarray: float32 array of the same shape
+        """
+        pixels = np.asarray(pixels, dtype=np.float32)
+        n = self.size
+        flat = self.table.reshape(-1, 3)
+
+        shaped = self._shaper_coords(pixels[..., :3])
+        outside = None
+        if fallback is not None:
+            outside = ~np.all((shaped >= 0.0) & (shaped <= 1.0), axis=-1)
+        coords = np.clip(shaped, 0.0, 1.0) * (n - 1)
+        base = np.minimum(np.floor(coords).astype(np.int32), n - 2)
+        frac = coords - base
+
+        r0, g0, b0 = base[..., 0], base[..., 1], base[..., 2]
+        fr, fg, fb = frac[..., 0:1], frac[..., 1:2], frac[..., 2:3]
+
+        def corner(dr, dg, db):
+            return flat[((r0 + dr) * n + (g0 + dg)) * n + (b0 + db)]
+
+        c000 = corner(0, 0, 0)
+        c111 = corner(1, 1, 1)
+
+        if interpolation == 'TRILINEAR':
+            c100, c010, c001 = corner(1, 0, 0), corner(0, 1, 0), corner(0, 0, 1)
+            c110, c101, c011 = corner(1, 1, 0), corner(1, 0, 1), corner(0, 1, 1)
+
+            c00 = c000 + (c100 - c000) * fr
+            c01 = c001 + (c101 - c001) * fr
+            c10 = c010 + (c110 - c010) * fr
+            c11 = c011 + (c111 - c011) * fr
+            c0 = c00 + (c10 - c00) * fg
+            c1 = c01 + (c11 - c01) * fg
+            rgb = c0 + (c1 - c0) * fb
+
+        elif interpolation == 'TETRAHEDRAL':
+            # Walk from c000 to c111 along the edges ordered by fraction size
+            rgb = np.empty(pixels.shape[:-1] + (3,), dtype=np.float32)
+            cases = [
+                ((fr >= fg) & (fg >= fb), (1, 0, 0), (1, 1, 0), fr, fg, fb),
+                ((fr >= fb) & (fb > fg), (1, 0, 0), (1, 0, 1), fr, fb, fg),
+                ((fb > fr) & (fr >= fg), (0, 0, 1), (1, 0, 1), fb, fr, fg),
+                ((fg > fr) & (fr >= fb), (0, 1, 0), (1, 1, 0), fg, fr, fb),
+                ((fg >= fb) & (fb > fr), (0, 1, 0), (0, 1, 1), fg, fb, fr),
+                ((fb > fg) & (fg > fr), (0, 0, 1), (0, 1, 1), fb, fg, fr),
+            ]
+            done = np.zeros(pixels.shape[:-1], dtype=bool)
+            for mask, first, second, t1, t2, t3 in cases:
+                mask = mask[..., 0] & ~done
+                if not mask.any():
+                    continue
+                done |= mask
+                ca = corner(*first)[mask]
+                cb = corner(*second)[mask]
+                c0 = c000[mask]
+                rgb[mask] = (c0 + (ca - c0) * t1[mask] + (cb - ca) * t2[mask] +
+                             (c111[mask] - cb) * t3[mask])
+        else:
+            raise ValueError(f"Unknown LUT interpolation: {interpolation}")
+
+        out = np.array(pixels, dtype=np.float32, copy=True)
+        out[..., :3] = rgb
+
+        if outside is not None and outside.any():
+            out[outside] = np.asarray(fallback(pixels[outside]), dtype=np.float32)
+        return out
+
+    def apply_to_image(self, image, interpolation='TETRAHEDRAL', tile_size=512, max_memory_mb=64,
+                       fallback=None):
+        """
+        Apply the LUT to a Blender image in place, tile by tile
+
+        Returns:
+            int: Number of tiles processed
+        """
+        from .openimageio_handler import ImageIOHandler
+
+        return ImageIOHandler.apply_tiled(image, lambda tile: self.apply(tile, interpolation, fallback),
+                                          tile_size=tile_size, max_memory_mb=max_memory_mb)
+
+    def save_cube(self, filepath):
+        """
+        Write the LUT as a .cube file (red varies fastest)
+
+        The lattice is sampled in shaper space, so a LINEAR LUT records its
+        domain with DOMAIN_MIN/DOMAIN_MAX. An SRGB LUT expects sRGB-encoded
+        input, which is how .cube files are usually applied.
+        """
+        filepath = Path(filepath)
+        lines = []
+        if self.title:
+            lines.append(f'TITLE "{self.title}"')
+        lines.append(f"# HyperGradeFX shaper: {self.shaper}")
+        lines.append(f"LUT_3D_SIZE {self.size}")
+        if self.shaper == 'LINEAR':
+            lines.append(f"DOMAIN_MIN {self.domain_min:.6f} {self.domain_min:.6f} {self.domain_min:.6f}")
+            lines.append(f"DOMAIN_MAX {self.domain_max:.6f} {self.domain_max:.6f} {self.domain_max:.6f}")
+
+        values = self.table.transpose(2, 1, 0, 3).reshape(-1, 3)
+        lines.extend(f"{r:.6f} {g:.6f} {b:.6f}" for r, g, b in values)
+
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write("\n".join(lines) + "\n")
+
+        return str(filepath)
+
+    @classmethod
+    def load_cube(cls, filepath):
+        """Read a 3D .cube file"""
+        size = None
+        title = ""
+        shaper = 'LINEAR'
+        domain_min, domain_max = 0.0, 1.0
+        values = []
+
+        with open(filepath, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                if line.startswith('#'):
+                    if 'HyperGradeFX shaper:' in line:
+                        shaper = line.split(':', 1)[1].strip()
+                    continue
+
+                keyword = line.split()[0]
+                if keyword == 'TITLE':
+                    title = line[len('TITLE'):].strip().strip('"')
+                elif keyword == 'LUT_3D_SIZE':
+                    size = int(line.split()[1])
+                elif keyword == 'DOMAIN_MIN':
+                    domain_min = float(line.split()[1])
+                elif keyword == 'DOMAIN_MAX':
+                    domain_max = float(line.split()[1])
+                elif keyword == 'LUT_1D_SIZE':
+                    raise ValueError("1D .cube LUTs are not supported")
+                else:
+                    values.append([float(v) for v in line.split()[:3]])
+
+        if size is None or len(values) != size ** 3:
+            raise ValueError(f"Invalid .cube file: {filepath}")
+
+        table = np.array(values, dtype=np.float32).reshape(size, size, size, 3)
+        return cls(table.transpose(2, 1, 0, 3), shaper, domain_min, domain_max, title)
+
+
+def split_pointwise_prefix(node_data):
+    """
+    Split a blueprint into a bakeable pointwise part and the remainder
+
+    If every evaluated node is pointwise, the whole graph is bakeable.
+    Otherwise the prefix is the chain of pointwise nodes starting at the
+    group input, up to the first node that is not pointwise, has several
+    linked inputs or feeds several nodes.
+
+    Args:
+        node_data: Blueprint node_data dict or JSON string
+
+    Returns:
+        tuple: (prefix_node_data or None, suffix_node_data or None)
+    """
+    interpreter = BlueprintInterpreter(node_data)
+    node_data = interpreter.node_data
+    nodes = interpreter.nodes
+    links = interpreter.links
+
+    if not interpreter.order:
+        return None, None
+
+    if all(nodes[name].get('type') in POINTWISE_NODE_TYPES for name in interpreter.order):
+        return node_data, None
+
+    incoming = {}
+    outgoing = {}
+    for link in links:
+        incoming.setdefault(link['to_node'], []).append(link)
+        outgoing.setdefault(link['from_node'], []).append(link)
+
+    # Follow the single chain leaving the group input
+    chain = []
+    current = GROUP_INPUT
+    while len(outgoing.get(current, [])) == 1:
+        link = outgoing[current][0]
+        name = link['to_node']
+        if name == GROUP_OUTPUT or nodes[name].get('type') not in POINTWISE_NODE_TYPES:
+            break
+        if len(incoming.get(name, [])) != 1:
+            break
+        chain.append(name)
+        current = name
+
+    if not chain:
+        return None, node_data
+
+    last = chain[-1]
+    exit_link = outgoing[last][0]
+    chain_set = set(chain)
+
+    prefix = {
+        'inputs': node_data.get('inputs', []),
+        'outputs': [{'name': 'Image', 'type': 'NodeSocketColor'}],
+        'nodes': [nodes[name] for name in chain],
+        'links': [link for link in links if link['to_node'] in chain_set] + [{
+            'from_node': last, 'to_node': GROUP_OUTPUT,
+            'from_socket': exit_link.get('from_socket', 0), 'to_socket': 0,
+        }],
+    }
+
+    # The remainder reads the baked result from the group input
+    suffix_links = []
+    for link in links:
+        if link['to_node'] in chain_set:
+            continue
+        if link['from_node'] == last:
+            link = dict(link, from_node=GROUP_INPUT, from_socket=0)
+        suffix_links.append(link)
+
+    suffix = {
+        'inputs': node_data.get('inputs', []),
+        'outputs': node_data.get('outputs', []),
+        'nodes': [node for name, node in nodes.items() if name not in chain_set],
+        'links': suffix_links,
+    }
+
+    return prefix, suffix
+
+
+def bake_blueprint(node_data, size=33, shaper='SRGB', domain_min=0.0, domain_max=1.0, title=""):
+    """
+    Bake the pointwise prefix of a blueprint into a LUT
+
+    Returns:
+        tuple: (LUT3D or None, BlueprintInterpreter for the remainder or None)
+    """
+    prefix, suffix = split_pointwise_prefix(node_data)
+
+    lut = None
+    if prefix is not None:
+        interpreter = BlueprintInterpreter(prefix)
+        lut = LUT3D.bake(interpreter.evaluate, size, shaper, domain_min, domain_max, title)
+
+    remainder = BlueprintInterpreter(suffix) if suffix is not None else None
+    return lut, remainder
+
+
+def bake_grade_stack(evaluator, size=33, shaper='SRGB', domain_min=0.0, domain_max=1.0, title=""):
+    """
+    Bake a GradeStackEvaluator into a LUT (every stage is pointwise)
+
+    Returns:
+        LUT3D: The baked LUT
+    """
+    return LUT3D.bake(evaluator.evaluate, size, shaper, domain_min, domain_max, title)
@@ -0,0 +1,296 @@
+"""
+Baked LUT Cache for HyperGradeFX
+Content-addressed on-disk cache of LUTs baked from blueprints
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+
+from .lut import LUT3D, bake_blueprint, bake_grade_stack, split_pointwise_prefix
+from .blueprint_interpreter import BlueprintInterpreter
+
+
+# Bump when baking changes so stale LUTs are not reused
+LUT_CACHE_VERSION = 1
+
+# Default cache cap (matches the add-on preference default)
+DEFAULT_LUT_CACHE_SIZE_MB = 512
+
+# Node data that has no effect on the rendered result
+_COSMETIC_NODE_KEYS = {'location', 'label', 'width', 'height', 'color', 'use_custom_color'}
+
+# Baked LUTs kept in memory on top of the disk cache
+_MEMORY_ENTRIES = 8
+
+
+def canonical_blueprint_hash(node_data, size, shaper='SRGB', domain_min=0.0, domain_max=1.0):
+    """
+    Hash a blueprint's node_data together with the LUT settings
+
+    Keys are sorted and cosmetic node fields (location, label, ...) are
+    dropped, so re-saving or rearranging a blueprint keeps the same hash.
+
+    Args:
+        node_data: Blueprint node_data dict or JSON string
+        size: LUT lattice size
+        shaper: LUT shaper (color space of the lattice)
+        domain_min, domain_max: Input domain for the LINEAR shaper
+
+    Returns:
+        str: Hex digest
+    """
+    if isinstance(node_data, str):
+        node_data = json.loads(node_data) if node_data else {}
+
+    canonical = dict(node_data)
+    canonical['nodes'] = sorted(
+        ({k: v for k, v in node.items() if k not in _COSMETIC_NODE_KEYS}
+         for node in node_data.get('nodes', [])),
+        key=lambda node: node.get('name', '')
+    )
+    canonical['links'] = sorted(
+        node_data.get('links', []),
+        key=lambda link: json.dumps(link, sort_keys=True)
+    )
+
+    payload = {
+        'version': LUT_CACHE_VERSION,
+        'graph': canonical,
+        'size': int(size),
+        'shaper': shaper,
+        'domain': [float(domain_min), float(domain_max)] if shaper == 'LINEAR' else None,
+    }
+    text = json.dumps(payload, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class LUTCache:
+    """
+    Persistent cache of baked LUTs with LRU eviction
+
+    Each LUT is stored as <hash>.npy next to an index.json holding its
+    settings, byte size and last access time. When the cache grows past
+    max_bytes, the least recently used LUTs are deleted.
+    """
+
+    def __init__(self, cache_dir=None, max_bytes=DEFAULT_LUT_CACHE_SIZE_MB * 1024 * 1024):
+        if cache_dir is None:
+            cache_dir = Path(tempfile.gettempdir()) / "HyperGradeFX" / "lut_cache"
+
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._memory = OrderedDict()
+        self._index = None
+
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def _index_path(self):
+        return self.cache_dir / "index.json"
+
+    def _load_index(self):
+        """Load the index from disk (once)"""
+        if self._index is not None:
+            return self._index
+
+        self._index = {}
+        try:
+            with open(self._index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == LUT_CACHE_VERSION:
+                self._index = data.get('entries', {})
+        except (OSError, ValueError):
+            pass
+
+        return self._index
+
+    def _save_index(self):
+        """Write the index atomically"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._index_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': LUT_CACHE_VERSION, 'entries': self._index}, f)
+        os.replace(tmp_path, self._index_path)
+
+    def get(self, key):
+        """
+        Look up a LUT by hash
+
+        Returns:
+            LUT3D or None
+        """
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self._touch(key)
+                self.hits += 1
+                return self._memory[key]
+
+            entry = self._load_index().get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            try:
+                table = np.load(self.cache_dir / f"{key}.npy")
+                lut = LUT3D(table, entry['shaper'], entry['domain_min'],
+                            entry['domain_max'], entry.get('title', ""))
+            except (OSError, ValueError, KeyError) as e:
+                print(f"HyperGradeFX: Dropping unreadable cached LUT {key}: {e}")
+                self._remove(key)
+                self._save_index()
+                self.misses += 1
+                return None
+
+            self._remember(key, lut)
+            self._touch(key)
+            self._save_index()
+            self.hits += 1
+            return lut
+
+    def put(self, key, lut):
+        """Store a LUT under a hash"""
+        with self._lock:
+            index = self._load_index()
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+            path = self.cache_dir / f"{key}.npy"
+            tmp_path = self.cache_dir / f"{key}.tmp.npy"
+            np.save(tmp_path, lut.table)
+            os.replace(tmp_path, path)
+
+            index[key] = {
+                'shaper': lut.shaper,
+                'domain_min': lut.domain_min,
+                'domain_max': lut.domain_max,
+                'title': lut.title,
+                'bytes': path.stat().st_size,
+                'last_access': time.time(),
+            }
+            self._remember(key, lut)
+            self._evict()
+            self._save_index()
+
+    def get_or_bake_blueprint(self, node_data, size=33, shaper='SRGB',
+                              domain_min=0.0, domain_max=1.0, title=""):
+        """
+        Get the baked LUT for a blueprint, baking it on a cache miss
+
+        Returns:
+            tuple: (LUT3D or None, BlueprintInterpreter for the remainder or None)
+        """
+        prefix, suffix = split_pointwise_prefix(node_data)
+        remainder = BlueprintInterpreter(suffix) if suffix is not None else None
+        if prefix is None:
+            return None, remainder
+
+        key = canonical_blueprint_hash(prefix, size, shaper, domain_min, domain_max)
+        lut = self.get(key)
+        if lut is None:
+            lut, _ = bake_blueprint(prefix, size, shaper, domain_min, domain_max, title)
+            self.put(key, lut)
+
+        return lut, remainder
+
+    def get_or_bake_grade_stack(self, evaluator, size=33, shaper='SRGB',
+                                domain_min=0.0, domain_max=1.0, title=""):
+        """Get the baked LUT for a GradeStackEvaluator, baking it on a miss"""
+        graph = {'grade_stack': evaluator.to_dict()}
+        key = canonical_blueprint_hash(graph, size, shaper, domain_min, domain_max)
+        lut = self.get(key)
+        if lut is None:
+            lut = bake_grade_stack(evaluator, size, shaper, domain_min, domain_max, title)
+            self.put(key, lut)
+        return lut
+
+    def set_max_bytes(self, max_bytes):
+        """Change the cache cap, evicting LUTs if needed"""
+        with self._lock:
+            self.max_bytes = max(0, int(max_bytes))
+            self._load_index()
+            if self._evict():
+                self._save_index()
+
+    def clear(self):
+        """Delete every cached LUT"""
+        with self._lock:
+            for key in list(self._load_index()):
+                self._remove(key)
+            self._save_index()
+
+    def get_stats(self):
+        """
+        Get cache statistics
+
+        Returns:
+            dict: Hit/miss counters and disk usage
+        """
+        with self._lock:
+            index = self._load_index()
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': len(index),
+                'bytes': sum(entry['bytes'] for entry in index.values()),
+                'max_bytes': self.max_bytes,
+                'cache_dir': str(self.cache_dir),
+            }
+
+    def _remember(self, key, lut):
+        """Keep a LUT in the in-memory LRU"""
+        self._memory[key] = lut
+        self._memory.move_to_end(key)
+        while len(self._memory) > _MEMORY_ENTRIES:
+            self._memory.popitem(last=False)
+
+    def _touch(self, key):
+        """Record an access for LRU ordering (written with the next index save)"""
+        entry = self._load_index().get(key)
+        if entry is not None:
+            entry['last_access'] = time.time()
+
+    def _remove(self, key):
+        """Delete one cached LUT"""
+        self._index.pop(key, None)
+        self._memory.pop(key, None)
+        try:
+            (self.cache_dir / f"{key}.npy").unlink()
+        except OSError:
+            pass
+
+    def _evict(self):
+        """Delete least recently used LUTs until under the cap"""
+        index = self._index
+        total = sum(entry['bytes'] for entry in index.values())
+        evicted = False
+
+        for key in sorted(index, key=lambda k: index[k]['last_access']):
+            if total <= self.max_bytes:
+                break
+            total -= index[key]['bytes']
+            self._remove(key)
+            evicted = True
+
+        return evicted
+
+
+# Shared cache instance
+_lut_cache = None
+
+
+def get_lut_cache():
+    """Get the shared LUT cache"""
+    global _lut_cache
+    if _lut_cache is None:
+        _lut_cache = LUTCache()
+    return _lut_cache
@@ -0,0 +1,193 @@
+"""
+Media Probe Cache for HyperGradeFX
+Persistent cache of ffprobe results keyed by file identity
+"""
+
+import atexit
+import copy
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+
+# Bump when the stored format changes so stale entries are ignored
+MEDIA_PROBE_CACHE_VERSION = 1
+
+# Probe results kept on disk; least recently used ones are dropped first
+DEFAULT_MAX_ENTRIES = 10000
+
+# Seconds between index writes when flushing after single lookups
+DEFAULT_FLUSH_INTERVAL = 30.0
+
+
+def _file_identity(path):
+    """
+    Get the cache key and signature of a media file
+
+    Returns:
+        tuple: (resolved path, size, mtime_ns), or None if it does not exist
+    """
+    try:
+        resolved = os.path.realpath(path)
+        stat = os.stat(resolved)
+    except OSError:
+        return None
+    return resolved, stat.st_size, stat.st_mtime_ns
+
+
+class MediaProbeCache:
+    """
+    Cache of parsed ffprobe output with LRU eviction
+
+    Entries are keyed by resolved path and only reused while the file's
+    size and modification time are unchanged. The whole index lives in
+    memory in LRU order and is written to a single JSON file by flush(),
+    so warm lookups cost one stat() call each. Lookups return copies, so
+    callers may modify them freely.
+    """
+
+    def __init__(self, cache_path=None, max_entries=DEFAULT_MAX_ENTRIES):
+        if cache_path is None:
+            cache_path = Path(tempfile.gettempdir()) / "HyperGradeFX" / "media_probe.json"
+
+        self.cache_path = Path(cache_path)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = None
+        self._dirty = False
+        self._flushed_at = 0.0
+
+        self.hits = 0
+        self.misses = 0
+
+    def _load(self):
+        """Load the index from disk (once)"""
+        if self._entries is not None:
+            return self._entries
+
+        self._entries = OrderedDict()
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == MEDIA_PROBE_CACHE_VERSION:
+                entries = data.get('entries', {})
+                for key in sorted(entries, key=lambda k: entries[k].get('last_access', 0)):
+                    self._entries[key] = entries[key]
+        except (OSError, ValueError):
+            pass
+
+        return self._entries
+
+    def get(self, path):
+        """
+        Look up the probe result for a file
+
+        Returns:
+            dict or None: Parsed ffprobe JSON, None on a miss or stale entry
+        """
+        identity = _file_identity(path)
+        if identity is None:
+            return None
+        key, size, mtime_ns = identity
+
+        with self._lock:
+            entries = self._load()
+            entry = entries.get(key)
+            if entry is None or entry['size'] != size or entry['mtime_ns'] != mtime_ns:
+                self.misses += 1
+                return None
+
+            entries.move_to_end(key)
+            entry['last_access'] = time.time()
+            self.hits += 1
+            return copy.deepcopy(entry['info'])
+
+    def put(self, path, info):
+        """Store a probe result (written to disk by flush())"""
+        identity = _file_identity(path)
+        if identity is None:
+            return
+        key, size, mtime_ns = identity
+
+        with self._lock:
+            entries = self._load()
+            entries[key] = {
+                'size': size,
+                'mtime_ns': mtime_ns,
+                'info': copy.deepcopy(info),
+                'last_access': time.time(),
+            }
+            entries.move_to_end(key)
+            while len(entries) > self.max_entries:
+                entries.popitem(last=False)
+            self._dirty = True
+
+    def flush(self, min_interval=0.0):
+        """
+        Write the index to disk if it changed
+
+        Args:
+            min_interval: Skip the write if the index was written less than
+                          this many seconds ago; the changes are kept for
+                          the next flush (at the latest when Python exits)
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            if min_interval and time.monotonic() - self._flushed_at < min_interval:
+                return
+            try:
+                self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.cache_path.with_suffix('.tmp')
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump({'version': MEDIA_PROBE_CACHE_VERSION,
+                               'entries': self._entries}, f)
+                os.replace(tmp_path, self.cache_path)
+                self._dirty = False
+                self._flushed_at = time.monotonic()
+            except OSError as e:
+                print(f"HyperGradeFX: Could not save media probe cache: {e}")
+
+    def clear(self):
+        """Forget every probe result"""
+        with self._lock:
+            self._entries = OrderedDict()
+            self._dirty = False
+            try:
+                self.cache_path.unlink()
+            except OSError:
+                pass
+
+    def get_stats(self):
+        """
+        Get cache statistics
+
+        Returns:
+            dict: Hit/miss counters and entry count
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': len(self._load()),
+                'max_entries': self.max_entries,
+                'cache_path': str(self.cache_path),
+            }
+
+
+# Shared cache instance
+_media_probe_cache = None
+
+
+def get_media_probe_cache():
+    """Get the shared media probe cache"""
+    global _media_probe_cache
+    if _media_probe_cache is None:
+        _media_probe_cache = MediaProbeCache()
+        # Write out changes held back by debounced flushes
+        atexit.register(_media_probe_cache.flush)
+    return _media_probe_cache
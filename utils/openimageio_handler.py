@@ -6,6 +6,14 @@ Handles advanced image I/O operations
 import bpy
 import numpy as np
 from pathlib import Path
+from .buffer_pool import get_buffer_pool
+
+# OpenImageIO's Python module ships with Blender 3.5+; file I/O outside of
+# bpy.data.images (worker threads and processes) needs it
+try:
+    import OpenImageIO as oiio
+except ImportError:
+    oiio = None
 
 
 class ImageIOHandler:
@@ -103,34 +111,70 @@ class ImageIOHandler:
         return image
 
     @staticmethod
-    def get_pixel_data(image):
-        """Get pixel data from an image as numpy array"""
+    def get_pixel_data(image, out=None):
+        """
+        Get pixel data from an image as a float32 numpy array
+
+        Pixels are copied straight into the array buffer with foreach_get,
+        so no Python float objects are created along the way.
+
+        Args:
+            image: bpy.types.Image object
+            out: Optional preallocated float32 array with height * width *
+                 channels elements to read into (reused across frames)
+
+        Returns:
+            numpy.ndarray: Array of shape (height, width, channels)
+        """
         if not image:
             return None
 
         width, height = image.size
         channels = image.channels
+        shape = (height, width, channels)
 
-        # Get pixels as list
-        pixels = list(image.pixels)
+        if out is None:
+            out = np.empty(shape, dtype=np.float32)
+        elif out.dtype != np.float32 or out.size != height * width * channels:
+            raise ValueError(
+                f"Output buffer must be float32 with {height * width * channels} elements"
+            )
+        elif not out.flags['C_CONTIGUOUS']:
+            raise ValueError("Output buffer must be C-contiguous")
 
-        # Convert to numpy array and reshape
-        pixel_array = np.array(pixels).reshape((height, width, channels))
+        # Read directly into the array memory
+        image.pixels.foreach_get(out.reshape(-1))
 
-        return pixel_array
+        return out.reshape(shape)
 
     @staticmethod
     def set_pixel_data(image, pixel_data):
-        """Set pixel data from numpy array"""
+        """
+        Set pixel data from a numpy array
+
+        Args:
+            image: bpy.types.Image object
+            pixel_data: Array with height * width * channels values
+
+        Returns:
+            bool: True on success
+        """
         if not image or pixel_data is None:
             return False
 
         try:
-            # Flatten array
-            pixels = pixel_data.flatten().tolist()
+            width, height = image.size
+            expected = width * height * image.channels
+
+            # foreach_set needs a flat, contiguous float32 buffer; this is a
+            # no-op for arrays coming from get_pixel_data
+            pixels = np.ascontiguousarray(pixel_data, dtype=np.float32).reshape(-1)
+
+            if pixels.size != expected:
+                raise ValueError(f"Expected {expected} values, got {pixels.size}")
 
-            # Set pixels
-            image.pixels = pixels
+            # Write directly from the array memory
+            image.pixels.foreach_set(pixels)
             image.update()
 
             return True
@@ -138,6 +182,106 @@ class ImageIOHandler:
             print(f"Error setting pixel data: {e}")
             return False
 
+    @staticmethod
+    def borrow_pixel_buffer(image):
+        """
+        Borrow a pooled float32 buffer sized for an image
+
+        Use with get_pixel_data(out=...) in per-frame loops so each frame
+        reuses the same memory instead of allocating a new array.
+
+        Usage:
+            with ImageIOHandler.borrow_pixel_buffer(image) as buffer:
+                pixels = ImageIOHandler.get_pixel_data(image, out=buffer)
+
+        Returns:
+            Context manager yielding a (height, width, channels) array
+        """
+        width, height = image.size
+        return get_buffer_pool().borrow(width, height, image.channels)
+
+    @staticmethod
+    def iter_tiles(image, tile_size=512, max_memory_mb=64, write_back=False):
+        """
+        Iterate over an image tile by tile
+
+        Blender images are copied once with foreach_get into a pooled
+        frame buffer (slicing image.pixels would copy the whole image for
+        every slice) and tiles are views into it; with write_back=True the
+        buffer is stored back with a single foreach_set at the end.
+
+        Image files are streamed through OpenImageIO a strip of scanlines
+        at a time, so only max_memory_mb of pixels is held and the whole
+        frame is never materialized.
+
+        Args:
+            image: bpy.types.Image, numpy array (height, width, channels)
+                   or image file path
+            tile_size: Tile edge length, or (height, width) tuple
+            max_memory_mb: Strip memory budget in MB when streaming a file
+            write_back: Write modified tiles back into the image (Blender
+                        images and arrays only)
+
+        Yields:
+            tuple: (y0, x0, tile) with tile of shape (th, tw, channels)
+        """
+        if isinstance(tile_size, int):
+            tile_h, tile_w = tile_size, tile_size
+        else:
+            tile_h, tile_w = tile_size
+
+        if tile_h < 1 or tile_w < 1:
+            raise ValueError("Tile size must be positive")
+
+        if isinstance(image, (str, Path)):
+            if write_back:
+                raise ValueError("write_back is not supported for image files")
+            yield from _iter_file_tiles(image, tile_h, tile_w, max_memory_mb)
+            return
+
+        # numpy sources are already in memory: hand out views directly
+        if isinstance(image, np.ndarray):
+            yield from _iter_array_tiles(image, tile_h, tile_w)
+            return
+
+        width, height = image.size
+        pool = get_buffer_pool()
+        buffer = ImageIOHandler.get_pixel_data(image, out=pool.acquire(width, height, image.channels))
+
+        try:
+            yield from _iter_array_tiles(buffer, tile_h, tile_w)
+
+            if write_back:
+                image.pixels.foreach_set(buffer.reshape(-1))
+                image.update()
+        finally:
+            pool.release(buffer)
+
+    @staticmethod
+    def apply_tiled(image, func, tile_size=512, max_memory_mb=64):
+        """
+        Apply a pixel function to an image tile by tile
+
+        Args:
+            image: bpy.types.Image object or numpy array
+            func: Callable taking a (th, tw, channels) float32 array and
+                  returning an array of the same shape (may modify in place)
+            tile_size: Tile edge length, or (height, width) tuple
+            max_memory_mb: Passed on to iter_tiles()
+
+        Returns:
+            int: Number of tiles processed
+        """
+        count = 0
+        for _, _, tile in ImageIOHandler.iter_tiles(image, tile_size=tile_size,
+                                                    max_memory_mb=max_memory_mb,
+                                                    write_back=True):
+            result = func(tile)
+            if result is not None and result is not tile:
+                tile[...] = result
+            count += 1
+        return count
+
     @staticmethod
     def convert_color_space(image, from_space='sRGB', to_space='Linear'):
         """Convert image color space"""
@@ -235,6 +379,291 @@ class ImageIOHandler:
         return metadata
 
 
+# Pixel formats written for each color depth setting
+_OIIO_FORMATS = {
+    '8': 'uint8',
+    '16': 'uint16',
+    'HALF': 'half',
+    '32': 'float',
+}
+
+
+def _iter_array_tiles(pixels, tile_h, tile_w):
+    """Yield (y0, x0, view) tiles of an in-memory image"""
+    height, width = pixels.shape[:2]
+    for y0 in range(0, height, tile_h):
+        for x0 in range(0, width, tile_w):
+            yield y0, x0, pixels[y0:y0 + tile_h, x0:x0 + tile_w]
+
+
+def _iter_file_tiles(filepath, tile_h, tile_w, max_memory_mb):
+    """Yield (y0, x0, tile) tiles of an image file, reading strips of scanlines"""
+    if oiio is None:
+        raise RuntimeError("OpenImageIO Python module is not available")
+
+    image_input = oiio.ImageInput.open(str(filepath))
+    if image_input is None:
+        raise RuntimeError(f"Cannot open image {filepath}: {oiio.geterror()}")
+
+    try:
+        spec = image_input.spec()
+        width, height, channels = spec.width, spec.height, spec.nchannels
+
+        budget_rows = int(max_memory_mb * 1024 * 1024) // (width * channels * 4)
+        if budget_rows < 1:
+            raise ValueError(
+                f"Memory budget of {max_memory_mb} MB is too small for a "
+                f"{width} pixel wide scanline"
+            )
+        strip_h = min(tile_h, height, budget_rows)
+
+        for y0 in range(0, height, strip_h):
+            y1 = min(height, y0 + strip_h)
+            strip = image_input.read_scanlines(0, 0, y0, y1, 0, 0, channels, 'float')
+            if strip is None:
+                raise RuntimeError(f"Cannot read image {filepath}: {image_input.geterror()}")
+            strip = strip.reshape(y1 - y0, width, channels)
+            for x0 in range(0, width, tile_w):
+                yield y0, x0, strip[:, x0:x0 + tile_w]
+    finally:
+        image_input.close()
+
+
+def has_file_io():
+    """Check if image files can be read and written outside bpy"""
+    return oiio is not None
+
+
+def has_display_transform():
+    """Check if OpenColorIO view transforms can be applied outside bpy"""
+    return oiio is not None and hasattr(oiio.ImageBufAlgo, 'ociodisplay')
+
+
+def apply_display_transform(pixels, display, view, look="", config_path="",
+                            from_space='scene_linear'):
+    """
+    Apply an OpenColorIO display and view transform without bpy
+
+    Safe to call from worker threads. With Blender's configuration this
+    gives the same result as Blender's color management for AgX, Filmic
+    and the other view transforms.
+
+    Args:
+        pixels: RGB float array of shape (height, width, 3)
+        display: OCIO display name (e.g. 'sRGB')
+        view: OCIO view name (e.g. 'AgX')
+        look: OCIO look name, or "" for none
+        config_path: OCIO config file (default: $OCIO)
+        from_space: Color space of the pixels
+
+    Returns:
+        numpy.ndarray: Display-referred float32 array of the same shape
+    """
+    if not has_display_transform():
+        raise RuntimeError("OpenImageIO with OpenColorIO support is not available")
+
+    pixels = np.ascontiguousarray(pixels, dtype=np.float32)
+    result = oiio.ImageBufAlgo.ociodisplay(
+        oiio.ImageBuf(pixels), display, view,
+        fromspace=from_space, looks=look, unpremult=False, colorconfig=config_path
+    )
+    if result.has_error:
+        raise RuntimeError(f"Display transform failed: {result.geterror()}")
+    return result.get_pixels(oiio.FLOAT).reshape(pixels.shape)
+
+
+def read_image_size(filepath):
+    """
+    Read an image file's size from its header without decoding pixels
+
+    Returns:
+        tuple: (width, height, channels)
+    """
+    if oiio is None:
+        raise RuntimeError("OpenImageIO Python module is not available")
+
+    image_input = oiio.ImageInput.open(str(filepath))
+    if image_input is None:
+        raise RuntimeError(f"Cannot open image {filepath}: {oiio.geterror()}")
+
+    try:
+        spec = image_input.spec()
+        return spec.width, spec.height, spec.nchannels
+    finally:
+        image_input.close()
+
+
+def read_image_color_depth(filepath):
+    """
+    Read an image file's stored bit depth from its header
+
+    Returns:
+        str: '8', '16', 'HALF' or '32' as accepted by write_image_file(),
+             or None for other pixel types
+    """
+    if oiio is None:
+        raise RuntimeError("OpenImageIO Python module is not available")
+
+    image_input = oiio.ImageInput.open(str(filepath))
+    if image_input is None:
+        raise RuntimeError(f"Cannot open image {filepath}: {oiio.geterror()}")
+
+    try:
+        pixel_type = str(image_input.spec().format)
+    finally:
+        image_input.close()
+
+    for color_depth, name in _OIIO_FORMATS.items():
+        if name == pixel_type:
+            return color_depth
+    return None
+
+
+def read_image_file(filepath, out=None):
+    """
+    Read an image file into a float32 array without bpy
+
+    Safe to call from worker threads and processes. Rows are returned in
+    file order (top to bottom), unlike Blender's bottom-up image pixels.
+
+    Args:
+        filepath: Image file path
+        out: Optional float32 array of shape (height, width, channels) to fill
+
+    Returns:
+        numpy.ndarray: Array of shape (height, width, channels)
+    """
+    if oiio is None:
+        raise RuntimeError("OpenImageIO Python module is not available")
+
+    image_input = oiio.ImageInput.open(str(filepath))
+    if image_input is None:
+        raise RuntimeError(f"Cannot open image {filepath}: {oiio.geterror()}")
+
+    try:
+        spec = image_input.spec()
+        pixels = image_input.read_image(0, 0, 0, spec.nchannels, 'float')
+        if pixels is None:
+            raise RuntimeError(f"Cannot read image {filepath}: {image_input.geterror()}")
+        pixels = pixels.reshape(spec.height, spec.width, spec.nchannels)
+    finally:
+        image_input.close()
+
+    if out is not None:
+        out.reshape(pixels.shape)[...] = pixels
+        return out.reshape(pixels.shape)
+    return pixels
+
+
+def write_image_file(filepath, pixels, color_depth=None, compression=None, quality=90):
+    """
+    Write a float array to an image file without bpy
+
+    The format follows the file extension. Safe to call from worker
+    threads and processes.
+
+    Args:
+        filepath: Output file path
+        pixels: Array of shape (height, width, channels), rows top to bottom
+        color_depth: '8', '16', 'HALF' or '32' (default: 8 for PNG/JPEG,
+                     HALF for EXR, 16 for TIFF)
+        compression: OpenImageIO compression name (e.g. 'zip', 'piz')
+        quality: JPEG quality (0-100)
+    """
+    if oiio is None:
+        raise RuntimeError("OpenImageIO Python module is not available")
+
+    filepath = str(filepath)
+    ext = Path(filepath).suffix.lower()
+    pixels = np.ascontiguousarray(pixels, dtype=np.float32)
+    height, width, channels = pixels.shape
+
+    if color_depth is None:
+        color_depth = {'.exr': 'HALF', '.tif': '16', '.tiff': '16'}.get(ext, '8')
+
+    image_output = oiio.ImageOutput.create(filepath)
+    if image_output is None:
+        raise RuntimeError(f"Cannot create image {filepath}: {oiio.geterror()}")
+
+    spec = oiio.ImageSpec(width, height, channels, _OIIO_FORMATS.get(color_depth, 'uint8'))
+    if compression:
+        spec.attribute('compression', compression)
+    if ext in ('.jpg', '.jpeg'):
+        spec.attribute('compression', f'jpeg:{int(quality)}')
+
+    try:
+        if not image_output.open(filepath, spec):
+            raise RuntimeError(f"Cannot open {filepath} for writing: {image_output.geterror()}")
+        if not image_output.write_image(pixels):
+            raise RuntimeError(f"Cannot write image {filepath}: {image_output.geterror()}")
+    finally:
+        image_output.close()
+
+    return filepath
+
+
+def _resize_axis(pixels, size, axis, block=256):
+    """Area-resample one axis of an image to size samples"""
+    length = pixels.shape[axis]
+    if size == length:
+        return pixels
+
+    # Whole-number factors: plain block average
+    if length % size == 0:
+        shape = pixels.shape[:axis] + (size, length // size) + pixels.shape[axis + 1:]
+        return np.ascontiguousarray(pixels).reshape(shape).mean(axis=axis + 1, dtype=np.float32)
+
+    # Otherwise integrate with a running sum and sample it at the output
+    # pixel edges; float64 keeps the differences exact enough for 16-bit
+    edges = np.linspace(0.0, length, size + 1)
+    index = np.minimum(edges.astype(np.int64), length - 1)
+    frac_shape = [1] * pixels.ndim
+    frac_shape[axis] = size + 1
+    frac = (edges - index).reshape(frac_shape)
+    span_shape = list(frac_shape)
+    span_shape[axis] = size
+    span = np.diff(edges).reshape(span_shape)
+
+    out_shape = list(pixels.shape)
+    out_shape[axis] = size
+    out = np.empty(out_shape, dtype=np.float32)
+
+    # The running sum is built a strip at a time to bound memory
+    other = 1 - axis
+    for start in range(0, pixels.shape[other], block):
+        strip = [slice(None)] * pixels.ndim
+        strip[other] = slice(start, start + block)
+        strip = tuple(strip)
+
+        summed = np.cumsum(pixels[strip], axis=axis, dtype=np.float64)
+        low = np.take(summed, index - 1, axis=axis)
+        low[(slice(None),) * axis + (index == 0,)] = 0.0
+        high = np.take(summed, index, axis=axis)
+        at_edges = low + frac * (high - low)
+        out[strip] = np.diff(at_edges, axis=axis) / span
+
+    return out
+
+
+def resize_area(pixels, width, height):
+    """
+    Resize an image by averaging the source area under each output pixel
+
+    Exact box filtering for any scale factor, so downscaled frames do not
+    alias. Safe to call from worker threads.
+
+    Args:
+        pixels: Array of shape (height, width, channels)
+        width, height: Output size in pixels
+
+    Returns:
+        numpy.ndarray: float32 array of shape (height, width, channels)
+    """
+    pixels = np.asarray(pixels, dtype=np.float32)
+    pixels = _resize_axis(pixels, int(height), axis=0)
+    return _resize_axis(pixels, int(width), axis=1)
+
+
 def get_image_handler():
     """Get image handler instance"""
     return ImageIOHandler()
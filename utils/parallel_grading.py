@@ -0,0 +1,360 @@
+"""
+Parallel Frame Grading for HyperGradeFX
+Applies a grade to existing frames across worker processes
+"""
+
+import multiprocessing
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .blueprint_interpreter import BlueprintInterpreter
+from .grade_evaluator import GradeStackEvaluator
+from .lut import LUT3D, split_pointwise_prefix
+from .lut_cache import get_lut_cache
+
+
+# Grader built once per worker process by _init_worker()
+_worker_grader = None
+
+
+def make_grade_spec(grade, use_lut=False, lut_size=33):
+    """
+    Turn a grade into a small picklable spec for worker processes
+
+    Args:
+        grade: GradeStackEvaluator, BlueprintInterpreter, LUT3D, or a
+               blueprint node_data dict / JSON string
+        use_lut: Bake pointwise grades into a LUT once, up front. Pixels
+                 outside the LUT's lattice (scene linear values above 1.0)
+                 are still graded directly.
+        lut_size: Lattice size when baking
+
+    Returns:
+        dict: Grade spec
+    """
+    if isinstance(grade, LUT3D):
+        # No source function to fall back on: out-of-lattice values clamp
+        return {'lut': _lut_spec(grade)}
+
+    if isinstance(grade, GradeStackEvaluator):
+        if use_lut:
+            return {
+                'lut': _lut_spec(get_lut_cache().get_or_bake_grade_stack(grade, lut_size)),
+                'lut_fallback': {'grade_stack': grade.to_dict()},
+            }
+        return {'grade_stack': grade.to_dict()}
+
+    node_data = grade.node_data if isinstance(grade, BlueprintInterpreter) else grade
+    if use_lut:
+        lut, remainder = get_lut_cache().get_or_bake_blueprint(node_data, lut_size)
+        if lut is not None:
+            prefix, _ = split_pointwise_prefix(node_data)
+            return {
+                'lut': _lut_spec(lut),
+                'lut_fallback': {'blueprint': prefix},
+                'blueprint': remainder.node_data if remainder is not None else None,
+            }
+    return {'blueprint': node_data}
+
+
+def _lut_spec(lut):
+    return {
+        'table': lut.table,
+        'shaper': lut.shaper,
+        'domain_min': lut.domain_min,
+        'domain_max': lut.domain_max,
+    }
+
+
+def build_grader(spec):
+    """
+    Build a pixel function from a grade spec
+
+    Returns:
+        callable: Function mapping an (..., channels) array to a graded array
+    """
+    steps = []
+
+    if spec.get('lut') is not None:
+        lut_data = spec['lut']
+        lut = LUT3D(lut_data['table'], lut_data['shaper'],
+                    lut_data['domain_min'], lut_data['domain_max'])
+        if spec.get('lut_fallback') is not None:
+            fallback = build_grader(spec['lut_fallback'])
+            steps.append(lambda pixels: lut.apply(pixels, fallback=fallback))
+        else:
+            steps.append(lut.apply)
+
+    if spec.get('grade_stack') is not None:
+        steps.append(GradeStackEvaluator.from_dict(spec['grade_stack']).evaluate)
+
+    if spec.get('blueprint') is not None:
+        interpreter = BlueprintInterpreter(spec['blueprint'])
+        interpreter.check_supported()
+        steps.append(interpreter.evaluate)
+
+    def grade(pixels):
+        for step in steps:
+            pixels = step(pixels)
+        return pixels
+
+    return grade
+
+
+def _init_worker(spec):
+    """Worker process initializer"""
+    global _worker_grader
+    _worker_grader = build_grader(spec)
+
+
+def _grade_bands(pixels, rows_per_chunk, grader):
+    """Grade a frame in place, in row bands to keep temporaries small"""
+    for y0 in range(0, pixels.shape[0], rows_per_chunk):
+        band = pixels[y0:y0 + rows_per_chunk]
+        band[...] = grader(band)
+
+
+def _grade_slot(slot_name, shape, rows_per_chunk, grader=None):
+    """Grade one frame in place inside a shared memory slot"""
+    slot = shared_memory.SharedMemory(name=slot_name)
+    try:
+        pixels = np.ndarray(shape, dtype=np.float32, buffer=slot.buf)
+        _grade_bands(pixels, rows_per_chunk, grader or _worker_grader)
+        del pixels
+    finally:
+        slot.close()
+    return shape
+
+
+def _grade_file(input_path, output_path, rows_per_chunk, reader=None, writer=None, grader=None):
+    """Read, grade and write one frame file inside a worker"""
+    from .openimageio_handler import read_image_color_depth, read_image_file, write_image_file
+
+    pixels = np.array((reader or read_image_file)(input_path), dtype=np.float32)
+    _grade_bands(pixels, rows_per_chunk, grader or _worker_grader)
+
+    if writer is not None:
+        writer(output_path, pixels)
+    elif os.path.splitext(input_path)[1].lower() == os.path.splitext(output_path)[1].lower():
+        # Keep the source bit depth (16-bit PNG, float EXR) instead of the
+        # extension's default
+        write_image_file(output_path, pixels, color_depth=read_image_color_depth(input_path))
+    else:
+        write_image_file(output_path, pixels)
+    return str(output_path)
+
+
+def default_worker_count():
+    """Get the number of CPUs this process may run on"""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+
+def _default_mp_context():
+    """
+    Get the multiprocessing context for worker processes, or None for threads
+
+    Spawned and forkserver workers re-import this module by its package
+    name, which only exists inside Blender (extensions live under bl_ext)
+    and pulls in bpy, so they cannot start from Blender. Forked workers
+    inherit the loaded modules instead. That is safe on Linux because
+    workers only run NumPy and OpenImageIO code: they never call into bpy
+    or Blender's threads, and exit without running Blender's exit handlers.
+    macOS system frameworks are not fork-safe and Windows cannot fork, so
+    there the work runs on threads; NumPy and OpenImageIO release the GIL
+    for the heavy lifting.
+    """
+    if sys.platform.startswith('linux') and 'fork' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('fork')
+    return None
+
+
+class FrameGradingEngine:
+    """
+    Fan frame grading out over a process pool
+
+    grade_files() hands each worker file paths only: the worker reads,
+    grades and writes its frame, so decoding and encoding scale with the
+    workers too. map_frames() grades in-memory frames, copying them into a
+    ring of shared memory slots graded in place, so pixel data is never
+    pickled. Results are handed back strictly in submission order.
+
+    Usage:
+        engine = FrameGradingEngine(GradeStackEvaluator.from_node_tree(tree))
+        engine.grade_files(input_paths, output_paths)
+    """
+
+    def __init__(self, grade, workers=None, queue_depth=None, use_lut=False,
+                 lut_size=33, rows_per_chunk=256, mp_context=None):
+        """
+        Args:
+            grade: GradeStackEvaluator, BlueprintInterpreter, LUT3D or node_data
+            workers: Worker process count (default: usable CPUs)
+            queue_depth: Frames in flight (default: 2 per worker)
+            use_lut: Bake pointwise grades into a LUT before fanning out
+                     (faster; out-of-lattice pixels are graded directly)
+            lut_size: LUT lattice size when baking
+            rows_per_chunk: Rows graded at once inside a worker
+            mp_context: multiprocessing context (default: fork on Linux,
+                        threads elsewhere; see _default_mp_context())
+        """
+        self.spec = make_grade_spec(grade, use_lut, lut_size)
+        self.workers = workers or default_worker_count()
+        self.queue_depth = queue_depth or self.workers * 2
+        self.rows_per_chunk = rows_per_chunk
+        self.mp_context = mp_context or _default_mp_context()
+
+        self.stats = {'frames': 0, 'seconds': 0.0, 'fps': 0.0}
+
+    def _executor(self):
+        """
+        Create the worker pool
+
+        Returns:
+            tuple: (executor, grader) where grader is passed to tasks
+                   running on threads and None for worker processes
+        """
+        if self.mp_context is None:
+            return ThreadPoolExecutor(max_workers=self.workers), build_grader(self.spec)
+
+        return ProcessPoolExecutor(max_workers=self.workers, mp_context=self.mp_context,
+                                   initializer=_init_worker, initargs=(self.spec,)), None
+
+    def _finish_stats(self, count, start):
+        elapsed = time.perf_counter() - start
+        self.stats = {
+            'frames': count,
+            'seconds': elapsed,
+            'fps': count / elapsed if elapsed > 0 else 0.0,
+        }
+
+    def map_frames(self, frames):
+        """
+        Grade a stream of frames
+
+        Args:
+            frames: Iterable of (key, pixels) with float32 pixels of shape
+                    (height, width, channels)
+
+        Yields:
+            tuple: (key, graded) in input order. graded is a view into a
+                   shared slot and is only valid until the next iteration;
+                   copy it if it must be kept.
+        """
+        free_slots = []
+        all_slots = []
+        pending = deque()
+        start = time.perf_counter()
+        count = 0
+
+        def take_slot(nbytes):
+            while free_slots:
+                slot = free_slots.pop()
+                if slot.size >= nbytes:
+                    return slot
+                # Frame size grew; replace the smaller slot
+                all_slots.remove(slot)
+                slot.close()
+                slot.unlink()
+            slot = shared_memory.SharedMemory(create=True, size=max(nbytes, 1))
+            all_slots.append(slot)
+            return slot
+
+        try:
+            executor, grader = self._executor()
+            with executor as pool:
+
+                def finish_oldest():
+                    key, slot, future = pending.popleft()
+                    shape = future.result()
+                    yield key, np.ndarray(shape, dtype=np.float32, buffer=slot.buf)
+                    free_slots.append(slot)
+
+                for key, pixels in frames:
+                    if len(pending) >= self.queue_depth:
+                        for result in finish_oldest():
+                            count += 1
+                            yield result
+
+                    pixels = np.asarray(pixels, dtype=np.float32)
+                    slot = take_slot(pixels.nbytes)
+                    np.ndarray(pixels.shape, dtype=np.float32, buffer=slot.buf)[...] = pixels
+
+                    future = pool.submit(_grade_slot, slot.name, pixels.shape,
+                                         self.rows_per_chunk, grader)
+                    pending.append((key, slot, future))
+
+                while pending:
+                    for result in finish_oldest():
+                        count += 1
+                        yield result
+
+        finally:
+            for slot in all_slots:
+                slot.close()
+                slot.unlink()
+
+            self._finish_stats(count, start)
+
+    def grade_files(self, input_paths, output_paths, reader=None, writer=None, progress=None):
+        """
+        Grade image files to new files
+
+        Each worker reads, grades and writes whole frames, so only paths
+        cross the process boundary.
+
+        Args:
+            input_paths: Source frame paths
+            output_paths: Destination paths (same length, same order)
+            reader: Callable path -> float32 array (default: read_image_file);
+                    must be a module-level function so workers can unpickle it
+            writer: Callable (path, array) (default: write_image_file with
+                    the source file's bit depth); same restriction as reader
+            progress: Optional callable (done, total) called in frame order
+
+        Returns:
+            list: Written output paths, in order
+        """
+        input_paths = list(input_paths)
+        output_paths = list(output_paths)
+        if len(input_paths) != len(output_paths):
+            raise ValueError("Input and output path lists differ in length")
+
+        written = []
+        pending = deque()
+        start = time.perf_counter()
+
+        def finish_oldest():
+            written.append(pending.popleft().result())
+            if progress:
+                progress(len(written), len(output_paths))
+
+        try:
+            executor, grader = self._executor()
+            with executor as pool:
+                try:
+                    for in_path, out_path in zip(input_paths, output_paths):
+                        if len(pending) >= self.queue_depth:
+                            finish_oldest()
+                        pending.append(pool.submit(_grade_file, str(in_path), str(out_path),
+                                                   self.rows_per_chunk, reader, writer, grader))
+
+                    while pending:
+                        finish_oldest()
+                except BaseException:
+                    # Do not start frames nobody will wait for
+                    for future in pending:
+                        future.cancel()
+                    raise
+
+        finally:
+            self._finish_stats(len(written), start)
+
+        return written
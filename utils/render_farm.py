@@ -0,0 +1,320 @@
+"""
+Local Render Farm for HyperGradeFX
+Renders frames with several background Blender processes
+"""
+
+import os
+import re
+import subprocess
+import threading
+import time
+from collections import deque
+from pathlib import Path
+
+
+# Farm states
+FARM_IDLE = 'IDLE'
+FARM_RUNNING = 'RUNNING'
+FARM_DONE = 'DONE'
+FARM_FAILED = 'FAILED'
+FARM_CANCELLED = 'CANCELLED'
+
+# Blender's -F names and the extensions it writes with -x 1
+FARM_EXTENSIONS = {
+    'PNG': '.png',
+    'JPEG': '.jpg',
+    'OPEN_EXR': '.exr',
+    'TIFF': '.tif',
+}
+
+# "Saved: '/path/frame_0012.png'" after each written frame
+_SAVED_LINE = re.compile(r"Saved:\s+'(.+)'")
+
+
+def plan_frame_chunks(frames, workers, distribution='CHUNKED'):
+    """
+    Split frames between workers
+
+    Args:
+        frames: Frame numbers in order
+        workers: Number of worker processes
+        distribution: 'CHUNKED' (contiguous ranges, best cache reuse for
+                      simulations and caches) or 'STRIDED' (every Nth frame,
+                      evens out shots whose cost varies along the range)
+
+    Returns:
+        list: One non-empty frame list per worker
+    """
+    frames = list(frames)
+    workers = max(1, min(int(workers), len(frames)))
+    if not frames:
+        return []
+
+    if distribution == 'STRIDED':
+        return [frames[i::workers] for i in range(workers)]
+
+    size, extra = divmod(len(frames), workers)
+    chunks = []
+    start = 0
+    for i in range(workers):
+        end = start + size + (1 if i < extra else 0)
+        chunks.append(frames[start:end])
+        start = end
+    return chunks
+
+
+def frames_argument(frames):
+    """
+    Format frames for Blender's -f option, e.g. '1..40,45,50..60'
+
+    Consecutive frames are collapsed into ranges to keep the command short.
+    """
+    frames = sorted(set(frames))
+    parts = []
+    run_start = previous = frames[0]
+    for frame in frames[1:] + [None]:
+        if frame is not None and frame == previous + 1:
+            previous = frame
+            continue
+        parts.append(str(run_start) if run_start == previous else f"{run_start}..{previous}")
+        if frame is not None:
+            run_start = previous = frame
+    return ','.join(parts)
+
+
+class FarmWorker:
+    """One 'blender -b' process rendering a list of frames"""
+
+    def __init__(self, cmd, frames, frame_paths):
+        """
+        Args:
+            cmd: Blender command line
+            frames: Frames this worker renders
+            frame_paths: Normalized output path -> frame number
+        """
+        self.cmd = cmd
+        self.frames = list(frames)
+        self.frame_paths = frame_paths
+        self.saved = set()
+        self.current_frame = None
+        self.returncode = None
+        self.process = None
+        self._output_tail = deque(maxlen=50)
+        self._thread = None
+
+    @property
+    def finished(self):
+        return self.returncode is not None
+
+    @property
+    def error_output(self):
+        """Last lines Blender printed"""
+        return '\n'.join(self._output_tail)
+
+    def start(self):
+        try:
+            # stderr joins stdout so one reader thread drains both
+            self.process = subprocess.Popen(
+                self.cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT
+            )
+        except OSError as e:
+            self._output_tail.append(str(e))
+            self.returncode = -1
+            return
+
+        self._thread = threading.Thread(target=self._read_output, daemon=True)
+        self._thread.start()
+
+    def _read_output(self):
+        for raw in iter(self.process.stdout.readline, b''):
+            line = raw.decode('utf-8', errors='replace').rstrip()
+            self._output_tail.append(line)
+
+            match = _SAVED_LINE.search(line)
+            if match:
+                frame = self.frame_paths.get(os.path.normpath(match.group(1)))
+                if frame is not None:
+                    self.saved.add(frame)
+            elif line.startswith('Fra:'):
+                try:
+                    self.current_frame = int(line[4:].split(None, 1)[0])
+                except ValueError:
+                    pass
+
+        self.returncode = self.process.wait()
+
+    def terminate(self):
+        if self.process is not None and self.returncode is None:
+            self.process.terminate()
+
+
+class RenderFarm:
+    """
+    Render frames of a saved .blend with several background Blender processes
+
+    Each worker renders its share of the frames straight into the output
+    directory, so no merge step is needed. Frames a worker did not save
+    (crash, out of memory, bad exit) are retried in further rounds spread
+    over fresh workers. Call poll() regularly, e.g. from a modal timer; it
+    never blocks.
+
+    Usage:
+        farm = RenderFarm(blender, "snapshot.blend", output_dir, range(1, 251), workers=4)
+        farm.start()
+        while farm.poll():
+            time.sleep(1)
+        print(farm.state, farm.failed_frames)
+    """
+
+    def __init__(self, blender_path, blend_path, output_dir, frames, workers=2,
+                 distribution='CHUNKED', file_format='PNG', max_retries=2,
+                 threads_per_worker=None, scene=None):
+        """
+        Args:
+            blender_path: Blender executable
+            blend_path: .blend file to render (a snapshot of the session)
+            output_dir: Directory frames are written to as frame_####.ext
+            frames: Frame numbers to render
+            workers: Concurrent Blender processes
+            distribution: 'CHUNKED' or 'STRIDED' (see plan_frame_chunks())
+            file_format: Blender file format name ('PNG', 'OPEN_EXR', ...)
+            max_retries: Extra attempts for frames that failed
+            threads_per_worker: Render threads per process (default: CPU
+                                count split between workers)
+            scene: Scene to render (default: the file's active scene)
+        """
+        if file_format not in FARM_EXTENSIONS:
+            raise ValueError(f"Unsupported farm file format: {file_format}")
+
+        self.blender_path = str(blender_path)
+        self.blend_path = str(blend_path)
+        self.output_dir = Path(output_dir)
+        self.frames = sorted(set(frames))
+        self.workers = max(1, int(workers))
+        self.distribution = distribution
+        self.file_format = file_format
+        self.max_retries = max(0, int(max_retries))
+        self.threads_per_worker = threads_per_worker or max(1, (os.cpu_count() or 1) // self.workers)
+        self.scene = scene
+
+        self.state = FARM_IDLE
+        self.attempts = {frame: 0 for frame in self.frames}
+        self.done_frames = set()
+        self.failed_frames = []
+        self.active = []
+        self.retry_rounds = 0
+        self.last_error = ""
+        self.started_at = None
+        self.finished_at = None
+
+    def frame_path(self, frame):
+        """Output file of a frame"""
+        return self.output_dir / f"frame_{frame:04d}{FARM_EXTENSIONS[self.file_format]}"
+
+    @property
+    def finished(self):
+        return self.state in (FARM_DONE, FARM_FAILED, FARM_CANCELLED)
+
+    @property
+    def fraction(self):
+        saved = len(self.done_frames) + sum(len(w.saved) for w in self.active)
+        return saved / len(self.frames) if self.frames else 1.0
+
+    @property
+    def elapsed(self):
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+    def _command(self, frames):
+        cmd = [self.blender_path, '-b', self.blend_path]
+        if self.scene:
+            cmd += ['-S', self.scene]
+        return cmd + [
+            '-o', str(self.output_dir / "frame_####"),
+            '-F', self.file_format,
+            '-x', '1',
+            '-t', str(self.threads_per_worker),
+            '-f', frames_argument(frames),
+        ]
+
+    def _launch(self, frames):
+        """Start workers over frames"""
+        frame_paths = {os.path.normpath(str(self.frame_path(f))): f for f in frames}
+        for chunk in plan_frame_chunks(frames, self.workers, self.distribution):
+            for frame in chunk:
+                self.attempts[frame] += 1
+            worker = FarmWorker(self._command(chunk), chunk, frame_paths)
+            worker.start()
+            self.active.append(worker)
+
+    def start(self):
+        """Launch the first round of workers"""
+        if self.state != FARM_IDLE:
+            return
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.state = FARM_RUNNING
+        self.started_at = time.monotonic()
+        if not self.frames:
+            self._finish(FARM_DONE)
+            return
+        self._launch(self.frames)
+
+    def poll(self):
+        """
+        Collect finished workers and schedule retries
+
+        Returns:
+            bool: True while the farm is running
+        """
+        if self.state != FARM_RUNNING:
+            return False
+
+        for worker in [w for w in self.active if w.finished]:
+            self.active.remove(worker)
+            for frame in worker.frames:
+                # Trust the file on disk over the log for frames not reported
+                if frame in worker.saved or (worker.returncode == 0 and self.frame_path(frame).exists()):
+                    self.done_frames.add(frame)
+            if worker.returncode != 0:
+                self.last_error = worker.error_output[-2000:]
+
+        if self.active:
+            return True
+
+        missing = [f for f in self.frames if f not in self.done_frames]
+        retry = [f for f in missing if self.attempts[f] <= self.max_retries]
+
+        if retry:
+            self.retry_rounds += 1
+            print(f"HyperGradeFX: Retrying {len(retry)} frame(s) (round {self.retry_rounds})")
+            self._launch(retry)
+            return True
+
+        self.failed_frames = missing
+        self._finish(FARM_FAILED if missing else FARM_DONE)
+        return False
+
+    def cancel(self):
+        """Stop every worker; frames already written stay on disk"""
+        for worker in self.active:
+            worker.terminate()
+        for worker in self.active:
+            if worker.process is not None:
+                worker.process.wait()
+        self.active = []
+        if not self.finished:
+            self._finish(FARM_CANCELLED)
+
+    def wait(self, interval=1.0):
+        """Block until the farm finishes"""
+        while self.poll():
+            time.sleep(interval)
+        return self.state
+
+    def _finish(self, state):
+        self.state = state
+        self.finished_at = time.monotonic()
@@ -0,0 +1,281 @@
+"""
+Image Sequence I/O for HyperGradeFX
+Overlaps frame file reads and writes with per-frame processing
+"""
+
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from .constants import EXPORT_FORMATS
+
+
+# Image file extensions picked up when listing a sequence directory
+SEQUENCE_EXTENSIONS = {fmt['ext'] for fmt in EXPORT_FORMATS.values()} | {'.jpeg', '.tiff'}
+
+
+def list_sequence(directory, extensions=None):
+    """
+    List the image files of a sequence in name order
+
+    Args:
+        directory: Directory holding the frames
+        extensions: Extensions to include (default: SEQUENCE_EXTENSIONS)
+
+    Returns:
+        list: Sorted Path objects
+    """
+    extensions = extensions or SEQUENCE_EXTENSIONS
+    return sorted(p for p in Path(directory).iterdir()
+                  if p.is_file() and p.suffix.lower() in extensions)
+
+
+def _timed_read(reader, path):
+    """Read one frame, returning (pixels, seconds spent reading)"""
+    start = time.perf_counter()
+    pixels = reader(path)
+    return pixels, time.perf_counter() - start
+
+
+class SequenceReader:
+    """
+    Read an image sequence ahead of the consumer on background threads
+
+    While frame N is being processed, frames N+1..N+prefetch are decoded
+    by a small thread pool. File reads and PNG/EXR decompression release
+    the GIL, so disk and decode time overlap with compute.
+
+    Usage:
+        reader = SequenceReader(paths, prefetch=4)
+        for path, pixels in reader:
+            process(pixels)
+        print(reader.get_stats())
+    """
+
+    def __init__(self, paths, reader=None, prefetch=4, threads=2):
+        """
+        Args:
+            paths: Frame file paths, in order
+            reader: Callable path -> array (default: read_image_file)
+            prefetch: Maximum frames decoded ahead of the consumer
+            threads: Reader threads
+        """
+        if reader is None:
+            from .openimageio_handler import read_image_file
+            reader = read_image_file
+
+        self.paths = list(paths)
+        self.reader = reader
+        self.prefetch = max(1, int(prefetch))
+        self.threads = max(1, int(threads))
+        self._reset_stats()
+
+    def __len__(self):
+        return len(self.paths)
+
+    def _reset_stats(self):
+        self.frames = 0
+        self.read_seconds = 0.0
+        self.wait_seconds = 0.0
+        self.compute_seconds = 0.0
+        self.total_seconds = 0.0
+
+    def __iter__(self):
+        """
+        Yields:
+            tuple: (path, pixels) in sequence order
+        """
+        self._reset_stats()
+        pending = deque()
+        paths = iter(self.paths)
+        start = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=self.threads,
+                                thread_name_prefix="HGFXSequenceReader") as pool:
+
+            def fill():
+                while len(pending) < self.prefetch:
+                    path = next(paths, None)
+                    if path is None:
+                        return
+                    pending.append((path, pool.submit(_timed_read, self.reader, path)))
+
+            try:
+                fill()
+                while pending:
+                    path, future = pending.popleft()
+
+                    # Time the consumer spends blocked on the disk
+                    wait_start = time.perf_counter()
+                    pixels, read_time = future.result()
+                    self.wait_seconds += time.perf_counter() - wait_start
+                    self.read_seconds += read_time
+
+                    fill()
+
+                    compute_start = time.perf_counter()
+                    yield path, pixels
+                    self.compute_seconds += time.perf_counter() - compute_start
+                    self.frames += 1
+
+            finally:
+                # Consumer stopped early: drop reads that have not started
+                for _, future in pending:
+                    future.cancel()
+                self.total_seconds = time.perf_counter() - start
+
+    def get_stats(self):
+        """
+        Get timing statistics for the last pass
+
+        read_seconds is the time reader threads spent decoding, wait_seconds
+        the time the consumer was blocked on them and compute_seconds the
+        time spent by the consumer between frames. A wait close to zero means
+        I/O is fully hidden behind compute.
+
+        Returns:
+            dict: Frame count and timings in seconds
+        """
+        return {
+            'frames': self.frames,
+            'read_seconds': self.read_seconds,
+            'wait_seconds': self.wait_seconds,
+            'compute_seconds': self.compute_seconds,
+            'total_seconds': self.total_seconds,
+            'io_overlap': (1.0 - self.wait_seconds / self.read_seconds
+                           if self.read_seconds > 0 else 1.0),
+        }
+
+
+def _timed_write(writer, path, pixels, kwargs):
+    """Write one frame, returning the seconds spent encoding and writing"""
+    start = time.perf_counter()
+    writer(path, pixels, **kwargs)
+    return time.perf_counter() - start
+
+
+class SequenceWriter:
+    """
+    Encode and write frames on background threads
+
+    submit() hands a frame to the writer threads and returns at once, so
+    the caller can start on the next frame while compression and the
+    disk write happen behind it. At most queue_depth frames are in flight;
+    submitting more blocks until the oldest one is written.
+
+    Usage:
+        with SequenceWriter(queue_depth=4) as writer:
+            for frame in frames:
+                writer.submit(path, render(frame))
+    """
+
+    def __init__(self, writer=None, queue_depth=4, threads=2):
+        """
+        Args:
+            writer: Callable (path, pixels, **kwargs) (default: write_image_file)
+            queue_depth: Maximum frames waiting to be written
+            threads: Writer threads
+        """
+        if writer is None:
+            from .openimageio_handler import write_image_file
+            writer = write_image_file
+
+        self.writer = writer
+        self.queue_depth = max(1, int(queue_depth))
+        self.threads = max(1, int(threads))
+
+        self._pool = None
+        self._pending = deque()
+        self.written = []
+        self.frames = 0
+        self.write_seconds = 0.0
+        self.backpressure_seconds = 0.0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # Flush on success; on error just stop without raising a second one
+        self.close(wait=exc_type is None)
+        return False
+
+    def submit(self, path, pixels, release=None, **kwargs):
+        """
+        Queue a frame for writing
+
+        The writer owns pixels until the frame is written; do not modify
+        the array after submitting it.
+
+        Args:
+            path: Output file path
+            pixels: Array of shape (height, width, channels), rows top to bottom
+            release: Optional callable(pixels) run once the frame is written,
+                     e.g. to return the buffer to a pool
+            **kwargs: Passed on to the writer (color_depth, compression, ...)
+        """
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.threads,
+                                            thread_name_prefix="HGFXSequenceWriter")
+
+        while len(self._pending) >= self.queue_depth:
+            wait_start = time.perf_counter()
+            self._finish_oldest()
+            self.backpressure_seconds += time.perf_counter() - wait_start
+
+        future = self._pool.submit(_timed_write, self.writer, path, pixels, kwargs)
+        self._pending.append((str(path), pixels, release, future))
+
+    def _finish_oldest(self):
+        """Wait for the oldest queued frame, re-raising its write error"""
+        path, pixels, release, future = self._pending.popleft()
+        try:
+            self.write_seconds += future.result()
+        finally:
+            if release is not None:
+                release(pixels)
+        self.written.append(path)
+        self.frames += 1
+
+    def flush(self):
+        """Wait until every queued frame is written"""
+        while self._pending:
+            self._finish_oldest()
+
+    def close(self, wait=True):
+        """
+        Flush and stop the writer threads
+
+        Args:
+            wait: Write out queued frames; when False, frames not yet
+                  started are dropped
+        """
+        try:
+            if wait:
+                self.flush()
+        finally:
+            for _, pixels, release, future in self._pending:
+                future.cancel()
+                if release is not None and future.cancelled():
+                    release(pixels)
+            self._pending.clear()
+            if self._pool is not None:
+                self._pool.shutdown(wait=True)
+                self._pool = None
+
+    def get_stats(self):
+        """
+        Get timing statistics
+
+        write_seconds is the time writer threads spent encoding and writing,
+        backpressure_seconds the time submit() blocked on a full queue.
+
+        Returns:
+            dict: Frame count and timings in seconds
+        """
+        return {
+            'frames': self.frames,
+            'queued': len(self._pending),
+            'write_seconds': self.write_seconds,
+            'backpressure_seconds': self.backpressure_seconds,
+        }